@@ -0,0 +1,667 @@
+# automation/async_uploader.py
+"""
+Async Naukri Resume Upload - drives Chrome over the DevTools protocol directly,
+overlapping independent work instead of one blocking WebDriver call at a time
+"""
+
+import os
+import re
+import json
+import time
+import base64
+import asyncio
+import logging
+import subprocess
+
+from cookie_jar import read_cookie_file, build_cookie_params, cookie_urls, split_applied, from_cdp_cookie
+from dom_probe import PROBE_JS, RACE_JS, TARGET_JS, call_script, call_async_script, selector_spec
+from driver_cache import find_chrome_binary
+from naukri_selectors import (
+    NAUKRI_HOME, UPLOAD_PAGES, LOGIN_INDICATORS, PROFILE_LINKS, UPLOAD_PAGE_MARKERS,
+    UPLOAD_OR_RESUME_BUTTON, SUBMIT_BUTTON, FILE_INPUT, ENABLED_FILE_INPUT,
+    SUCCESS_INDICATORS, FAILURE_INDICATORS, STEALTH_JS
+)
+from profile_cache import ProfileCache
+from run_timing import RunTimer
+from resource_blocker import ResourceBlocker
+from network_waterfall import NetworkWaterfall
+from debug_capture import DebugCapture
+from session_preflight import check_session, log_result, DEAD, EXIT_SESSION_EXPIRED
+from http_uploader import HttpUploader, resolve_upload_mode
+from resume_prep import ResumePreparer, ResumeError, EXIT_RESUME_REJECTED
+from navigation_hints import NavigationHints, UPLOAD_PAGE
+from upload_ledger import UploadLedger
+
+# Check for websockets availability
+try:
+    import websockets
+    USE_WEBSOCKETS = True
+except ImportError:
+    USE_WEBSOCKETS = False
+
+DEVTOOLS_PATTERN = re.compile(r"DevTools listening on (ws://\S+)")
+
+FIRST_NODE_JS = """
+const snap = document.evaluate(arguments[0], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+return snap.snapshotLength ? snap.snapshotItem(0) : null;
+"""
+
+PAGE_STATE_JS = """
+return {
+    title: document.title,
+    url: location.href,
+    accessDenied: document.documentElement.outerHTML.toLowerCase().includes('access denied'),
+    resumeOnPage: (() => {
+        const html = document.documentElement.outerHTML.toLowerCase();
+        return html.includes('resume') && html.includes('.pdf');
+    })()
+};
+"""
+
+
+class CDPError(Exception):
+    pass
+
+
+class CDPConnection:
+    """Minimal DevTools client on the browser websocket, with flattened page sessions"""
+
+    def __init__(self, ws_url, timer=None):
+        self.ws_url = ws_url
+        self.timer = timer
+        self.ws = None
+        self.reader = None
+        self.next_id = 0
+        self.pending = {}
+        self.listeners = {}
+
+    async def connect(self):
+        self.ws = await websockets.connect(self.ws_url, max_size=None, ping_interval=None)
+        self.reader = asyncio.create_task(self._read_loop())
+
+    async def close(self):
+        if self.reader:
+            self.reader.cancel()
+        if self.ws:
+            await self.ws.close()
+
+    async def send(self, method, params=None, session_id=None, timeout=60):
+        self.next_id += 1
+        message_id = self.next_id
+        message = {"id": message_id, "method": method, "params": params or {}}
+        if session_id:
+            message["sessionId"] = session_id
+
+        future = asyncio.get_running_loop().create_future()
+        self.pending[message_id] = future
+        if self.timer:
+            self.timer.count_command(method)
+        try:
+            await self.ws.send(json.dumps(message))
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            self.pending.pop(message_id, None)
+
+    def on(self, method, callback):
+        self.listeners.setdefault(method, []).append(callback)
+
+    def expect(self, method, predicate=None):
+        """Future for the next matching event, registered before the action that triggers it"""
+        future = asyncio.get_running_loop().create_future()
+
+        def listener(params):
+            if not future.done() and (predicate is None or predicate(params)):
+                future.set_result(params)
+
+        self.on(method, listener)
+        future.add_done_callback(lambda _: self.listeners[method].remove(listener))
+        return future
+
+    async def _read_loop(self):
+        try:
+            async for raw in self.ws:
+                message = json.loads(raw)
+                if "id" in message:
+                    future = self.pending.get(message["id"])
+                    if future and not future.done():
+                        if "error" in message:
+                            future.set_exception(CDPError(message["error"].get("message", "CDP error")))
+                        else:
+                            future.set_result(message.get("result", {}))
+                else:
+                    for callback in list(self.listeners.get(message.get("method"), [])):
+                        callback(message.get("params", {}))
+        except websockets.ConnectionClosed:
+            pass
+        finally:
+            for future in self.pending.values():
+                if not future.done():
+                    future.set_exception(CDPError("DevTools connection closed"))
+
+
+class AsyncNaukriUploader:
+    def __init__(self):
+        self.resume_path = os.getenv("RESUME_PATH", "./resume/Nikhil_Saini_Resume.pdf")
+        self.cookies_file = os.getenv("NAUKRI_COOKIES_FILE", "./cookies/naukri_cookies.json")
+        self.cookies_b64 = os.getenv("NAUKRI_COOKIES_B64")
+        self.upload_verify_timeout = float(os.getenv("UPLOAD_VERIFY_TIMEOUT", "30"))
+        self.page_timeout = float(os.getenv("WAIT_CEILING", "15"))
+        self.account = os.getenv("NAUKRI_ACCOUNT", "default")
+        self.force = os.getenv("FORCE_RUN", "false").lower() == "true"
+        self.profile_name = os.getenv("CHROME_PROFILE_NAME", "default")
+
+        self.timer = RunTimer()
+        self.ledger = UploadLedger()
+        self.hints = NavigationHints()
+        self.blocker = ResourceBlocker()
+        self.waterfall = NetworkWaterfall()
+        self.capture = DebugCapture()
+        self.run_succeeded = False
+        self.preflight = os.getenv("PREFLIGHT", "1") != "0"
+        self.exit_code = None
+        self.failure = None  # why run() returned False, for batch reports
+        self.upload_mode = os.getenv("UPLOAD_MODE", "auto").lower()  # auto | http | browser
+        self.upload_engine = None
+        self.preparer = ResumePreparer()
+        self.upload_path = None
+        self.profile_cache = ProfileCache()
+        self.profile_slot = None
+        self.process = None
+        self.cdp = None
+        self.session_id = None
+        self.inflight = set()
+        self.last_network_activity = time.monotonic()
+        self.stderr_drain = None
+        self.upload_indicator = None
+
+        os.makedirs("./cookies", exist_ok=True)
+        os.makedirs("./logs", exist_ok=True)
+
+    # --- browser plumbing -------------------------------------------------
+
+    async def launch_browser(self):
+        """Start headless Chrome on a free DevTools port and attach to its page"""
+        chrome_binary = find_chrome_binary()
+        if not chrome_binary:
+            raise Exception("Chrome binary not found (set CHROME_BIN)")
+
+        self.profile_slot = self.profile_cache.acquire(self.profile_name)
+        if not self.profile_slot:
+            raise Exception("No free Chrome profile slot")
+
+        self.process = await asyncio.create_subprocess_exec(
+            chrome_binary,
+            "--headless=new",
+            "--remote-debugging-port=0",
+            f"--user-data-dir={os.path.join(self.profile_slot, 'chrome_cdp')}",
+            "--no-sandbox",
+            "--disable-dev-shm-usage",
+            "--disable-gpu",
+            "--window-size=1366,768",
+            "--disable-blink-features=AutomationControlled",
+            "--no-first-run",
+            "--no-default-browser-check",
+            "about:blank",
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE
+        )
+        ws_url = await asyncio.wait_for(self._read_devtools_url(), timeout=30)
+        # Keep draining stderr so Chrome never blocks on a full pipe
+        self.stderr_drain = asyncio.create_task(self._drain_stderr())
+
+        self.cdp = CDPConnection(ws_url, timer=self.timer)
+        await self.cdp.connect()
+
+        targets = await self.cdp.send("Target.getTargets")
+        pages = [t for t in targets["targetInfos"] if t["type"] == "page"]
+        target_id = pages[0]["targetId"] if pages else (
+            await self.cdp.send("Target.createTarget", {"url": "about:blank"})
+        )["targetId"]
+        attached = await self.cdp.send("Target.attachToTarget", {"targetId": target_id, "flatten": True})
+        self.session_id = attached["sessionId"]
+
+        self.cdp.on("Network.requestWillBeSent", self._request_started)
+        self.cdp.on("Network.loadingFinished", self._request_finished)
+        self.cdp.on("Network.loadingFailed", self._request_finished)
+        if self.blocker.enabled:
+            for method in ("Network.requestWillBeSent", "Network.loadingFinished", "Network.loadingFailed"):
+                self.cdp.on(method, lambda params, method=method: self.blocker.record_event(method, params))
+        if self.waterfall.enabled:
+            for method in (
+                "Network.requestWillBeSent", "Network.responseReceived", "Network.loadingFinished",
+                "Network.loadingFailed", "Page.domContentEventFired", "Page.loadEventFired"
+            ):
+                self.cdp.on(method, lambda params, method=method: self.waterfall.record_event(method, params))
+
+        version = await self.cdp.send("Browser.getVersion")
+        await asyncio.gather(
+            self.page("Page.enable"),
+            self.page("Network.enable"),
+            self.page("Runtime.enable"),
+            self.block_resources(),
+            self.page("Page.addScriptToEvaluateOnNewDocument", {"source": STEALTH_JS}),
+            self.page("Network.setUserAgentOverride", {
+                "userAgent": version["userAgent"].replace("HeadlessChrome", "Chrome")
+            })
+        )
+        logging.info(f"🚗 Chrome {version['product']} attached over DevTools")
+
+    async def block_resources(self):
+        if not self.blocker.enabled:
+            logging.info("🚫 Resource blocking disabled")
+            return
+        # Network.enable must land first, setBlockedURLs is ignored on a disabled domain
+        await self.page("Network.enable")
+        await self.page("Network.setBlockedURLs", {"urls": self.blocker.patterns})
+        logging.info(f"🚫 Blocking {len(self.blocker.patterns)} resource patterns")
+
+    async def _read_devtools_url(self):
+        while True:
+            line = await self.process.stderr.readline()
+            if not line:
+                raise Exception("Chrome exited before DevTools was ready")
+            match = DEVTOOLS_PATTERN.search(line.decode("utf-8", "replace"))
+            if match:
+                return match.group(1)
+
+    async def _drain_stderr(self):
+        while await self.process.stderr.readline():
+            pass
+
+    def _request_started(self, params):
+        self.inflight.add(params["requestId"])
+        self.last_network_activity = time.monotonic()
+
+    def _request_finished(self, params):
+        self.inflight.discard(params["requestId"])
+        self.last_network_activity = time.monotonic()
+
+    async def page(self, method, params=None):
+        return await self.cdp.send(method, params, session_id=self.session_id)
+
+    async def evaluate(self, expression, await_promise=False, by_value=True):
+        result = await self.page("Runtime.evaluate", {
+            "expression": expression,
+            "returnByValue": by_value,
+            "awaitPromise": await_promise
+        })
+        if "exceptionDetails" in result:
+            raise CDPError(result["exceptionDetails"].get("text", "script error"))
+        return result["result"].get("value") if by_value else result["result"]
+
+    async def navigate(self, url):
+        """Navigate and wait for the load event"""
+        self.inflight.clear()
+        loaded = self.cdp.expect("Page.loadEventFired")
+        await self.page("Page.navigate", {"url": url})
+        try:
+            await asyncio.wait_for(loaded, self.page_timeout * 2)
+        except asyncio.TimeoutError:
+            logging.warning(f"⏱️ Load event not seen for {url}")
+
+    async def wait_network_idle(self, quiet_period=0.5, max_inflight=2, timeout=None):
+        """At most max_inflight requests open for quiet_period seconds (long polls never finish)"""
+        deadline = time.monotonic() + (timeout or self.page_timeout)
+        while time.monotonic() < deadline:
+            quiet_for = time.monotonic() - self.last_network_activity
+            if len(self.inflight) <= max_inflight and quiet_for >= quiet_period:
+                return True
+            await asyncio.sleep(0.1)
+        return False
+
+    async def probe(self, selectors):
+        """Counts per named selector in one evaluation, {name: {count, visible, enabled, texts}}"""
+        specs = {name: selector_spec(selector) for name, selector in selectors.items()}
+        return await self.evaluate(call_script(PROBE_JS, specs, 20)) or {}
+
+    async def poll_probe(self, selectors, timeout):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            results = await self.probe(selectors)
+            if any(result["count"] for result in results.values()):
+                return results
+            await asyncio.sleep(0.25)
+        return None
+
+    async def wait_for_elements(self, selectors, timeout=None):
+        """Probe the DOM while the network settles, whichever answers first wins"""
+        timeout = timeout or self.page_timeout
+        probe_task = asyncio.create_task(self.poll_probe(selectors, timeout))
+        idle_task = asyncio.create_task(self.wait_network_idle(timeout=timeout))
+        try:
+            done, _ = await asyncio.wait({probe_task, idle_task}, return_when=asyncio.FIRST_COMPLETED)
+            if probe_task in done:
+                return probe_task.result()
+            # Network settled first, one more look decides it
+            results = await self.probe(selectors)
+            return results if any(result["count"] for result in results.values()) else None
+        finally:
+            probe_task.cancel()
+            idle_task.cancel()
+
+    async def click(self, selector):
+        """Scroll to the first usable match and click it with real mouse events"""
+        target = await self.evaluate(call_script(TARGET_JS, selector_spec(selector)))
+        if not target:
+            return None
+        for event_type in ("mouseMoved", "mousePressed", "mouseReleased"):
+            await self.page("Input.dispatchMouseEvent", {
+                "type": event_type, "x": target["x"], "y": target["y"],
+                "button": "left", "clickCount": 1
+            })
+        return target["text"] or "(no text)"
+
+    async def set_file(self, xpath):
+        """Attach the resume to the first matching file input"""
+        node = await self.evaluate(call_script(FIRST_NODE_JS, xpath), by_value=False)
+        if not node.get("objectId"):
+            return False
+        await self.page("DOM.setFileInputFiles", {
+            "files": [os.path.abspath(self.upload_path or self.resume_path)],
+            "objectId": node["objectId"]
+        })
+        return True
+
+    async def page_state(self):
+        return await self.evaluate(call_script(PAGE_STATE_JS))
+
+    # --- phases -------------------------------------------------------------
+
+    def decode_cookies_from_secret(self):
+        """Decode cookies from base64"""
+        if self.cookies_b64:
+            try:
+                cookies = json.loads(base64.b64decode(self.cookies_b64).decode("utf-8"))
+                with open(self.cookies_file, "w", encoding="utf-8") as f:
+                    json.dump(cookies, f, indent=2)
+                logging.info("🍪 Cookies decoded from secret")
+                return True
+            except Exception as e:
+                logging.error(f"Cookie decode failed: {e}")
+        return False
+
+    async def preflight_session(self):
+        """Probe the saved session over HTTP before paying for Chrome"""
+        result = await asyncio.to_thread(check_session, self.cookies_file, self.cookies_b64)
+        log_result(result)
+        return result.status != DEAD
+
+    async def upload_over_http(self):
+        """Upload and confirm over plain HTTP, off the event loop"""
+        http = HttpUploader(os.path.abspath(self.upload_path or self.resume_path), self.cookies_file, self.cookies_b64, timer=self.timer)
+        if await asyncio.to_thread(http.run):
+            self.upload_indicator = http.upload_indicator
+            return True
+        return False
+
+    async def load_cookies(self):
+        """Seed the whole jar before the first navigation"""
+        if not os.path.exists(self.cookies_file) and not self.decode_cookies_from_secret():
+            raise FileNotFoundError("No cookies available")
+
+        params, rejected = build_cookie_params(read_cookie_file(self.cookies_file))
+        if params:
+            await self.page("Network.setCookies", {"cookies": params})
+        stored = await self.page("Network.getCookies", {"urls": cookie_urls(params)}) if params else {}
+        applied, browser_rejected = split_applied(params, stored.get("cookies", []))
+        for name, reason in rejected + browser_rejected:
+            logging.warning(f"Cookie {name} failed: {reason}")
+        logging.info(f"🍪 Loaded {len(applied)} cookies in bulk ({len(rejected) + len(browser_rejected)} rejected)")
+        return len(applied) > 0
+
+    async def navigate_to_profile(self):
+        """Homepage first, then a profile link, direct navigation as fallback"""
+        logging.info("🏠 Starting from homepage...")
+        await self.navigate(NAUKRI_HOME)
+        links = await self.wait_for_elements(PROFILE_LINKS)
+
+        if links:
+            for name, result in links.items():
+                if not result["visible"]:
+                    continue
+                loaded = self.cdp.expect("Page.loadEventFired")
+                text = await self.click(PROFILE_LINKS[name])
+                if not text:
+                    continue
+                logging.info(f"🔗 Clicked profile link: {text}")
+                try:
+                    await asyncio.wait_for(loaded, self.page_timeout)
+                except asyncio.TimeoutError:
+                    pass
+                state = await self.page_state()
+                if "mnjuser" in state["url"]:
+                    logging.info(f"✅ Successfully navigated to: {state['url']}")
+                    return True
+                break
+
+        logging.info("🔗 Trying direct navigation to profile...")
+        await self.navigate(f"{NAUKRI_HOME}/mnjuser/profile")
+        state = await self.page_state()
+        if "access denied" not in state["title"].lower() and not state["accessDenied"]:
+            logging.info("✅ Direct navigation successful")
+            return True
+        return False
+
+    async def verify_login(self):
+        """Any visible login indicator, or a logged-in URL"""
+        state, indicators = await asyncio.gather(self.page_state(), self.probe(LOGIN_INDICATORS))
+        logging.info(f"📍 Current URL: {state['url']}")
+        logging.info(f"📄 Page title: {state['title']}")
+
+        if "access denied" in state["title"].lower() or state["accessDenied"]:
+            logging.error("❌ ACCESS DENIED detected")
+            return False
+
+        for name, result in indicators.items():
+            if result["visible"]:
+                logging.info(f"✅ Login verified via: {LOGIN_INDICATORS[name]}")
+                return True
+
+        if "mnjuser" in state["url"] and "login" not in state["url"]:
+            logging.info("✅ Login verified via URL pattern")
+            return True
+
+        logging.warning("⚠️ Could not verify login status")
+        return False
+
+    async def open_upload_page(self):
+        for page in self.hints.order(UPLOAD_PAGE, UPLOAD_PAGES):
+            logging.info(f"🌐 Trying page: {page}")
+            await self.navigate(page)
+            markers = await self.wait_for_elements(UPLOAD_PAGE_MARKERS, timeout=10)
+            state = await self.page_state()
+            if markers and "access denied" not in state["title"].lower():
+                logging.info(f"✅ Found upload page: {page}")
+                self.hints.record(UPLOAD_PAGE, page, True)
+                return True
+            self.hints.record(UPLOAD_PAGE, page, False)
+        return False
+
+    async def upload_resume(self):
+        """Attach the resume via file input, or via an upload button that reveals one"""
+        if not await self.open_upload_page():
+            return False
+
+        if await self.set_file(FILE_INPUT):
+            logging.info("📁 Resume attached to file input")
+            await self.wait_network_idle(timeout=8)
+            text = await self.click(SUBMIT_BUTTON)
+            if text:
+                logging.info(f"🔘 Clicked submit: {text}")
+            return await self.verify_upload()
+
+        text = await self.click(UPLOAD_OR_RESUME_BUTTON)
+        if text:
+            logging.info(f"🔘 Trying button: {text}")
+            revealed = await self.poll_probe({"file input": ENABLED_FILE_INPUT}, timeout=6)
+            if revealed and await self.set_file(ENABLED_FILE_INPUT):
+                logging.info("📁 Found triggered file input")
+                return await self.verify_upload()
+
+        logging.warning("⚠️ No upload elements found")
+        return False
+
+    async def verify_upload(self):
+        """Race every success and failure indicator in the page"""
+        success = {name: selector_spec(selector) for name, selector in SUCCESS_INDICATORS.items()}
+        failure = {name: selector_spec(selector) for name, selector in FAILURE_INDICATORS.items()}
+        try:
+            result = await self.evaluate(
+                call_async_script(RACE_JS, success, failure, int(self.upload_verify_timeout * 1000)),
+                await_promise=True
+            )
+        except CDPError as e:
+            logging.warning(f"Indicator race interrupted: {e}")
+            result = None
+
+        if result and result["outcome"] == "success":
+            self.upload_indicator = result["name"]
+            logging.info(f"✅ Upload success detected: {result['name']}")
+            return True
+        if result and result["outcome"] == "failure":
+            logging.error(f"❌ Upload failure detected: {result['name']}")
+            return False
+
+        state = await self.page_state()
+        if state["resumeOnPage"]:
+            self.upload_indicator = "resume on page"
+            logging.info("✅ Resume detected on page")
+            return True
+
+        logging.warning("⚠️ Upload success not confirmed")
+        return False
+
+    # --- artifacts and shutdown ----------------------------------------------
+
+    async def save_debug_info(self, label="final"):
+        """Grab screenshot and source now, the capture thread writes them"""
+        try:
+            screenshot, html = await asyncio.gather(
+                self.page("Page.captureScreenshot", {"format": "png"}),
+                self.evaluate("document.documentElement.outerHTML")
+            )
+            self.capture.save(label, base64.b64decode(screenshot["data"]), html)
+        except Exception as e:
+            logging.error(f"Debug save failed: {e}")
+
+    async def save_cookies(self):
+        stored = await self.page("Network.getAllCookies")
+        cookies = [from_cdp_cookie(cookie) for cookie in stored.get("cookies", [])]
+        with open(self.cookies_file, "w") as f:
+            json.dump(cookies, f, indent=2)
+        cookies_b64 = base64.b64encode(json.dumps(cookies).encode()).decode()
+        logging.info("🍪 Updated cookies saved")
+        print(f"COOKIES_B64: {cookies_b64}")
+
+    async def cleanup(self):
+        """Cleanup resources"""
+        try:
+            if self.cdp and self.session_id:
+                if self.capture.should_capture(not self.run_succeeded):
+                    await asyncio.gather(self.save_debug_info(), self.save_cookies())
+                else:
+                    await self.save_cookies()
+                await self.cdp.send("Browser.close")
+        except Exception as e:
+            logging.error(f"Cleanup error: {e}")
+
+        await asyncio.to_thread(self.capture.close)
+        if self.stderr_drain:
+            self.stderr_drain.cancel()
+
+        if self.cdp:
+            await self.cdp.close()
+        if self.process and self.process.returncode is None:
+            try:
+                await asyncio.wait_for(self.process.wait(), timeout=10)
+            except asyncio.TimeoutError:
+                self.process.kill()
+        if self.profile_slot:
+            self.profile_cache.release(self.profile_slot)
+            self.profile_slot = None
+        logging.info("🧹 Cleanup completed")
+
+    async def run_phase(self, name, coroutine):
+        with self.timer.span(name) as span:
+            result = await coroutine
+            if result is False:
+                span.outcome = "failed"
+        if name != "cleanup" and self.session_id and self.capture.should_capture_phase(result is False):
+            await self.save_debug_info(name)
+        return result
+
+    async def run(self):
+        """Main execution over DevTools"""
+        with self.timer.span("run") as run_span:
+            success = await self.run_flow()
+            if not success:
+                run_span.outcome = "failed"
+        self.hints.save()
+        self.timer.extra_summary.extend(self.hints.summary_lines())
+        self.timer.extra_summary.extend(self.blocker.summary_lines())
+        self.timer.extra_summary.extend(self.waterfall.summary_lines())
+        self.waterfall.write(self.timer)
+        self.timer.extra_summary.append(f"🏁 Upload mode {self.upload_mode}, succeeded via: {self.upload_engine or 'none'}")
+        self.timer.write()
+        self.timer.summary()
+        return success
+
+    async def run_flow(self):
+        try:
+            logging.info("🚀 Starting ASYNC Naukri automation (DevTools engine)")
+            if not USE_WEBSOCKETS:
+                raise Exception("The async engine needs the 'websockets' package")
+            try:
+                prepared = await self.run_phase("prepare_resume", asyncio.to_thread(self.preparer.prepare, self.resume_path))
+            except ResumeError as e:
+                self.exit_code = EXIT_RESUME_REJECTED
+                raise Exception(f"Resume rejected: {e}")
+            self.upload_path = prepared.path
+            resume_hash = prepared.sha256
+            confirmed = self.ledger.recent_confirmation(resume_hash, self.account)
+            if confirmed and not self.force:
+                logging.info(
+                    f"📒 Resume {resume_hash[:12]} already confirmed at {confirmed['confirmed_at']} "
+                    f"via {confirmed['indicator']}, skipping (use --force to upload anyway)"
+                )
+                return True
+
+            if self.preflight and not await self.run_phase("preflight", self.preflight_session()):
+                self.exit_code = EXIT_SESSION_EXPIRED
+                raise Exception("Session expired, refresh NAUKRI_COOKIES_B64")
+            self.upload_mode = resolve_upload_mode(self.upload_mode)
+            if self.upload_mode in ("auto", "http"):
+                if await self.run_phase("http_fast_path", self.upload_over_http()):
+                    logging.info("🎉 SUCCESS: Resume upload completed over HTTP!")
+                    self.upload_engine = "http"
+                    self.run_succeeded = True
+                    self.ledger.record(resume_hash, self.account, self.upload_indicator, self.resume_path)
+                    return True
+                if self.upload_mode == "http":
+                    raise Exception("HTTP upload failed and UPLOAD_MODE=http allows no browser fallback")
+                logging.info("↩️ HTTP fast path failed, falling back to the browser")
+
+            await self.run_phase("setup", self.launch_browser())
+            if not await self.run_phase("cookies", self.load_cookies()):
+                raise Exception("Cookie loading failed")
+            if not await self.run_phase("navigate", self.navigate_to_profile()):
+                raise Exception("Navigation failed")
+            if not await self.run_phase("verify_login", self.verify_login()):
+                raise Exception("Login verification failed")
+
+            if await self.run_phase("upload", self.upload_resume()):
+                logging.info("🎉 SUCCESS: Resume upload completed!")
+                self.upload_engine = "browser"
+                self.run_succeeded = True
+                self.ledger.record(resume_hash, self.account, self.upload_indicator, self.resume_path)
+                return True
+            logging.error("❌ Resume upload failed")
+            self.failure = "resume upload failed"
+            return False
+
+        except Exception as e:
+            logging.error(f"💥 Automation failed: {e}")
+            self.failure = str(e)
+            return False
+        finally:
+            await self.run_phase("cleanup", self.cleanup())
@@ -0,0 +1,169 @@
+# automation/batch_runner.py
+"""
+Batch uploads - runs several (resume, cookie file) jobs in a process pool
+with a concurrency cap, each on its own profile dir and debug ports
+"""
+
+import os
+import sys
+import csv
+import json
+import time
+import asyncio
+import logging
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from session_preflight import EXIT_SESSION_EXPIRED
+from resource_monitor import EXIT_MEMORY_CEILING
+from resume_prep import EXIT_RESUME_REJECTED
+
+SUMMARY_PHASES = ["run/setup", "run/cookies", "run/navigate", "run/verify_login", "run/upload"]
+PORT_BASE = 9300
+PORTS_PER_JOB = 10
+EXIT_REASONS = {
+    EXIT_SESSION_EXPIRED: "session expired",
+    EXIT_MEMORY_CEILING: "memory ceiling hit",
+    EXIT_RESUME_REJECTED: "resume rejected",
+}
+
+
+def load_manifest(manifest_path):
+    """Jobs from a JSON list or a CSV with resume,cookies[,name,account,engine] columns"""
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        if manifest_path.endswith(".csv"):
+            rows = list(csv.DictReader(f))
+        else:
+            rows = json.load(f)
+
+    jobs = []
+    for index, row in enumerate(rows):
+        if not row.get("resume") or not row.get("cookies"):
+            raise ValueError(f"Manifest entry {index} needs 'resume' and 'cookies'")
+        name = row.get("name") or os.path.splitext(os.path.basename(row["cookies"]))[0]
+        jobs.append({
+            "index": index,
+            "name": name,
+            "resume": row["resume"],
+            "cookies": row["cookies"],
+            "account": row.get("account") or name,
+            "engine": row.get("engine") or "selenium",
+        })
+    return jobs
+
+
+def job_error(uploader, success):
+    """Why a job failed: the exit code's reason plus the failed phase or exception"""
+    if success:
+        return None
+    machine = getattr(uploader, "machine", None)
+    detail = (machine.error if machine else None) or uploader.failure
+    reason = EXIT_REASONS.get(uploader.exit_code)
+    if reason and detail:
+        return f"{reason} ({detail})"
+    return reason or detail or "upload failed"
+
+
+def run_job(job, force=False):
+    """Run one upload in this worker process, isolated by env"""
+    os.environ.update({
+        "RESUME_PATH": job["resume"],
+        "NAUKRI_COOKIES_FILE": job["cookies"],
+        "NAUKRI_ACCOUNT": job["account"],
+        "CHROME_PROFILE_NAME": f"batch-{job['name']}",
+        "CHROME_DEBUG_PORT_BASE": str(PORT_BASE + job["index"] * PORTS_PER_JOB),
+    })
+    # Never fall back to the shared secret for someone else's jar
+    os.environ.pop("NAUKRI_COOKIES_B64", None)
+    if force:
+        os.environ["FORCE_RUN"] = "true"
+
+    os.makedirs("./logs/batch", exist_ok=True)
+    log_format = f"%(asctime)s - {job['name']} - %(levelname)s - %(message)s"
+    logging.basicConfig(
+        level=logging.INFO,
+        format=log_format,
+        handlers=[logging.StreamHandler(), logging.FileHandler(f"./logs/batch/{job['name']}.log")],
+        force=True
+    )
+
+    start = time.monotonic()
+    try:
+        if job["engine"] == "async":
+            from async_uploader import AsyncNaukriUploader
+            uploader = AsyncNaukriUploader()
+            success = asyncio.run(uploader.run())
+        else:
+            from naukri_cookie_uploader import StealthNaukriUploader
+            uploader = StealthNaukriUploader()
+            success = uploader.run()
+        phases = {}
+        for span in uploader.timer.spans:
+            phases[span.path] = phases.get(span.path, 0.0) + span.wall
+        error = job_error(uploader, success)
+        exit_code = uploader.exit_code
+    except Exception as e:
+        success, phases, error, exit_code = False, {}, str(e), None
+
+    return {
+        "name": job["name"],
+        "success": success,
+        "wall": time.monotonic() - start,
+        "phases": phases,
+        "error": error,
+        "exit_code": exit_code,
+    }
+
+
+def format_report(results, total_wall):
+    header = f"{'job':<24} {'result':<8} {'wall':>7} " + " ".join(
+        f"{phase.split('/')[-1]:>12}" for phase in SUMMARY_PHASES
+    )
+    lines = [header]
+    for result in sorted(results, key=lambda r: r["name"]):
+        phases = " ".join(f"{result['phases'].get(phase, 0.0):>12.1f}" for phase in SUMMARY_PHASES)
+        outcome = "ok" if result["success"] else "FAILED"
+        lines.append(f"{result['name']:<24} {outcome:<8} {result['wall']:>7.1f} {phases}")
+        if result["error"]:
+            lines.append(f"    error: {result['error']}")
+
+    slowest = max((r["wall"] for r in results), default=0.0)
+    summed = sum(r["wall"] for r in results)
+    lines.append(
+        f"Total wall {total_wall:.1f}s (slowest job {slowest:.1f}s, sequential would be ~{summed:.1f}s), "
+        f"{sum(1 for r in results if r['success'])}/{len(results)} succeeded"
+    )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    parser = argparse.ArgumentParser(description="Upload resumes for several profiles in parallel")
+    parser.add_argument("manifest", help="JSON list or CSV of {resume, cookies, name?, account?, engine?}")
+    parser.add_argument("-j", "--concurrency", type=int, default=int(os.getenv("BATCH_CONCURRENCY", "2")))
+    parser.add_argument("--force", action="store_true", help="ignore the upload ledger")
+    args = parser.parse_args(argv)
+
+    jobs = load_manifest(args.manifest)
+    logging.info(f"📋 {len(jobs)} job(s), up to {args.concurrency} at a time")
+
+    start = time.monotonic()
+    results = []
+    # One process per job so env, logging and Chrome state never leak between jobs
+    with ProcessPoolExecutor(max_workers=max(args.concurrency, 1), max_tasks_per_child=1) as pool:
+        futures = {pool.submit(run_job, job, args.force): job for job in jobs}
+        for future in as_completed(futures):
+            job = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                result = {"name": job["name"], "success": False, "wall": 0.0, "phases": {}, "error": str(e), "exit_code": None}
+            logging.info(f"{'✅' if result['success'] else '❌'} {result['name']} finished in {result['wall']:.1f}s")
+            results.append(result)
+
+    logging.info("📊 Batch report:\n" + format_report(results, time.monotonic() - start))
+    return 0 if all(r["success"] for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,148 @@
+# automation/benchmark.py
+"""
+End-to-end benchmark - runs the full uploader flow against the local
+stand-in N times and reports per-phase latency distributions
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import shutil
+import tempfile
+import statistics
+from datetime import datetime
+
+from naukri_standin import StandInServer, parse_range
+from run_timing import percentile
+
+
+def run_benchmark(iterations, page_latency=(0.0, 0.0), upload_latency=(0.0, 0.0),
+                  access_denied_rate=0.0, upload_failure_rate=0.0, output_dir="./logs", upload_mode="browser"):
+    """Run the uploader against a fresh stand-in, returns the collected results"""
+    # Selectors read the base URL at import time, once imported the override below would be ignored
+    if "naukri_selectors" in sys.modules:
+        raise RuntimeError("naukri_selectors is already imported, run the benchmark in a fresh process")
+
+    server = StandInServer(
+        page_latency=page_latency,
+        upload_latency=upload_latency,
+        access_denied_rate=access_denied_rate,
+        upload_failure_rate=upload_failure_rate
+    ).start()
+    work_dir = tempfile.mkdtemp(prefix="naukri_bench_")
+    cookies_file = os.path.join(work_dir, "cookies.json")
+
+    overrides = {
+        "NAUKRI_BASE_URL": server.base_url,
+        "NAUKRI_COOKIES_FILE": cookies_file,
+        "HTTP_UPLOAD_URL": f"{server.base_url}/upload",
+        # Stand-in uploads must never land in the real ledger or skew the real navigation hints
+        "UPLOAD_LEDGER_PATH": os.path.join(work_dir, "upload_ledger.json"),
+        "NAVIGATION_HINTS_PATH": os.path.join(work_dir, "navigation_hints.json"),
+    }
+    saved_env = {name: os.environ.get(name) for name in overrides}
+
+    phases = {}
+    runs = []
+    try:
+        # Point the selectors at the stand-in before they are first imported
+        os.environ.update(overrides)
+        from naukri_cookie_uploader import StealthNaukriUploader
+
+        for iteration in range(1, iterations + 1):
+            server.write_cookie_file(cookies_file)
+            server.last_upload = None
+            uploader = StealthNaukriUploader()
+            uploader.timer.history_path = os.path.join(output_dir, "benchmark_timings.jsonl")
+            # Every iteration uploads the same resume, the ledger must not short-circuit them
+            uploader.force = True
+            uploader.upload_mode = upload_mode
+
+            logging.info(f"🏁 Benchmark iteration {iteration}/{iterations}")
+            start = time.monotonic()
+            success = uploader.run()
+            runs.append({"iteration": iteration, "success": success, "wall": round(time.monotonic() - start, 3)})
+
+            for span in uploader.timer.spans:
+                phases.setdefault(span.path, []).append(span.wall)
+    finally:
+        server.stop()
+        for name, value in saved_env.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    return {
+        "started_at": datetime.now().isoformat(timespec="seconds"),
+        "iterations": iterations,
+        "config": dict(server.config, upload_mode=upload_mode),
+        "server_stats": server.snapshot_stats(),
+        "runs": runs,
+        "phases": {
+            path: {
+                "count": len(walls),
+                "mean": round(statistics.mean(walls), 3),
+                "p50": round(percentile(walls, 50), 3),
+                "p95": round(percentile(walls, 95), 3),
+                "min": round(min(walls), 3),
+                "max": round(max(walls), 3),
+            }
+            for path, walls in phases.items()
+        },
+    }
+
+
+def format_report(results):
+    successes = sum(1 for run in results["runs"] if run["success"])
+    lines = [
+        f"Runs: {results['iterations']}, successful: {successes}, stand-in stats: {results['server_stats']}",
+        f"{'phase':<42} {'n':>4} {'mean':>7} {'p50':>7} {'p95':>7} {'min':>7} {'max':>7}",
+    ]
+    for path, stats in sorted(results["phases"].items()):
+        lines.append(
+            f"{path:<42} {stats['count']:>4} {stats['mean']:>7.2f} {stats['p50']:>7.2f} "
+            f"{stats['p95']:>7.2f} {stats['min']:>7.2f} {stats['max']:>7.2f}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    parser = argparse.ArgumentParser(description="Benchmark the uploader against the local stand-in")
+    parser.add_argument("-n", "--iterations", type=int, default=5)
+    parser.add_argument("--page-latency", default="0", help="seconds, or a range like 0.2-1.0")
+    parser.add_argument("--upload-latency", default="0", help="seconds, or a range like 0.5-2.0")
+    parser.add_argument("--access-denied-rate", type=float, default=0.0)
+    parser.add_argument("--upload-failure-rate", type=float, default=0.0)
+    parser.add_argument("--output-dir", default="./logs")
+    parser.add_argument("--mode", choices=["auto", "http", "browser"], default="browser",
+                        help="upload mode to measure, browser by default")
+    args = parser.parse_args(argv)
+
+    results = run_benchmark(
+        args.iterations,
+        page_latency=parse_range(args.page_latency),
+        upload_latency=parse_range(args.upload_latency),
+        access_denied_rate=args.access_denied_rate,
+        upload_failure_rate=args.upload_failure_rate,
+        output_dir=args.output_dir,
+        upload_mode=args.mode
+    )
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    output_file = os.path.join(args.output_dir, f"benchmark_{int(time.time())}.json")
+    with open(output_file, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+
+    logging.info("📊 Benchmark results:\n" + format_report(results))
+    logging.info(f"💾 Results saved to {output_file}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
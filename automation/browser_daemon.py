@@ -0,0 +1,324 @@
+# automation/browser_daemon.py
+"""
+Warm browser daemon - keeps initialized drivers alive and runs upload jobs
+sent over a local Unix socket, so a job only pays navigation and upload time
+"""
+
+import os
+import sys
+import json
+import time
+import queue
+import socket
+import logging
+import argparse
+import threading
+import socketserver
+
+DEFAULT_SOCKET = os.getenv("NAUKRI_DAEMON_SOCKET", "/tmp/naukri_daemon.sock")
+PORT_BASE = 9400
+PORTS_PER_WORKER = 10
+
+
+class Job:
+    def __init__(self, request):
+        self.resume = os.path.abspath(request["resume"])
+        self.cookies = os.path.abspath(request["cookies"])
+        self.account = request.get("account") or os.path.splitext(os.path.basename(self.cookies))[0]
+        self.force = bool(request.get("force"))
+        self.submitted = time.monotonic()
+        self.done = threading.Event()
+        self.result = None
+
+
+class DriverWorker(threading.Thread):
+    """Owns one warm uploader/driver and runs queued jobs on it"""
+
+    def __init__(self, index, jobs, max_jobs_per_driver):
+        super().__init__(name=f"driver-{index}", daemon=True)
+        self.index = index
+        self.jobs = jobs
+        self.max_jobs_per_driver = max_jobs_per_driver
+        self.uploader = None
+        self.jobs_on_driver = 0
+        self.stopping = False
+
+    def start_driver(self):
+        from naukri_cookie_uploader import StealthNaukriUploader
+        self.uploader = StealthNaukriUploader()
+        self.uploader.profile_name = f"daemon-{self.index}"
+        self.uploader.debug_port_base = PORT_BASE + self.index * PORTS_PER_WORKER
+        self.uploader.setup_stealth_driver()
+        self.jobs_on_driver = 0
+        logging.info(f"🔥 {self.name}: warm driver ready")
+
+    def stop_driver(self):
+        if not self.uploader:
+            return
+        try:
+            if self.uploader.driver:
+                self.uploader.driver.quit()
+        except Exception as e:
+            logging.warning(f"{self.name}: driver quit failed: {e}")
+        finally:
+            self.uploader.capture.close()
+            self.uploader.release_profile_dir()
+            self.uploader = None
+
+    def healthy(self):
+        try:
+            return self.uploader is not None and self.uploader.driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    def ensure_driver(self):
+        """Recycle after N jobs or when the session died"""
+        if self.uploader and self.jobs_on_driver >= self.max_jobs_per_driver:
+            logging.info(f"♻️ {self.name}: recycling driver after {self.jobs_on_driver} jobs")
+            self.stop_driver()
+        elif self.uploader and not self.healthy():
+            logging.warning(f"♻️ {self.name}: driver unhealthy, recycling")
+            self.stop_driver()
+        if not self.uploader:
+            self.start_driver()
+
+    def run(self):
+        while not self.stopping:
+            try:
+                job = self.jobs.get(timeout=1)
+            except queue.Empty:
+                continue
+            if job is None:
+                break
+            job.result = self.run_job(job)
+            job.done.set()
+        self.stop_driver()
+
+    def reset_browser_state(self, uploader):
+        """Drop the previous account's cookies, storage and HTTP cache before the next job"""
+        from naukri_selectors import NAUKRI_HOME
+        try:
+            uploader.driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        except Exception:
+            uploader.driver.delete_all_cookies()
+        try:
+            # localStorage, sessionStorage, IndexedDB, service workers and cache storage of the origin
+            uploader.driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": NAUKRI_HOME, "storageTypes": "all"})
+            uploader.driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+        except Exception as e:
+            # Leftover storage could leak one account into the next, never run the job on it
+            raise Exception(f"could not clear browser storage: {e}")
+
+    def run_job(self, job):
+        from session_preflight import check_session, log_result, DEAD
+        start = time.monotonic()
+        queued = start - job.submitted
+        uploader = None
+        try:
+            self.ensure_driver()
+            uploader = self.uploader
+            uploader.resume_path = job.resume
+            uploader.cookies_file = job.cookies
+            uploader.cookies_b64 = None  # a missing jar fails the job, never falls back to the daemon's secret
+            uploader.account = job.account
+            uploader.upload_indicator = None
+            uploader.upload_method = None
+            uploader.submitted_methods = set()
+            uploader.upload_path = None
+            if not uploader.prepare_resume():
+                return {"success": False, "error": "resume rejected", "seconds": time.monotonic() - start, "queued": queued}
+            resume_hash = uploader.resume_hash
+
+            confirmed = uploader.ledger.recent_confirmation(resume_hash, job.account)
+            if confirmed and not job.force:
+                return {"success": True, "skipped": True, "indicator": confirmed["indicator"],
+                        "seconds": time.monotonic() - start, "queued": queued}
+
+            # A dead jar never reaches the warm driver
+            if uploader.preflight:
+                preflight = check_session(job.cookies)
+                log_result(preflight)
+                if preflight.status == DEAD:
+                    return {"success": False, "error": f"session expired: {preflight.reason}",
+                            "seconds": time.monotonic() - start, "queued": queued}
+
+            # Start each job from a clean browser, the driver is shared across accounts
+            self.reset_browser_state(uploader)
+
+            with uploader.timer.span("job"):
+                success = (
+                    uploader.load_cookies_stealthily()
+                    and uploader.find_and_upload_resume()
+                    and uploader.confirm_upload()
+                )
+            if success:
+                uploader.ledger.record(resume_hash, job.account, uploader.upload_indicator, job.resume)
+                uploader.save_cookies(print_b64=False)
+            if uploader.capture.should_capture(not success):
+                uploader.save_debug_info(f"job_{job.account}")
+            return {"success": bool(success), "indicator": uploader.upload_indicator,
+                    "seconds": time.monotonic() - start, "queued": queued}
+        except Exception as e:
+            logging.error(f"💥 {self.name}: job failed: {e}")
+            return {"success": False, "error": str(e), "seconds": time.monotonic() - start, "queued": queued}
+        finally:
+            self.jobs_on_driver += 1
+            if uploader:
+                self.finish_job(uploader)
+
+    def finish_job(self, uploader):
+        """Report and reset per-job counters on every exit path, so none leak into the next job"""
+        try:
+            uploader.hints.save()
+            if uploader.driver:
+                uploader.blocker.collect(uploader.driver)
+            uploader.timer.extra_summary.extend(uploader.hints.summary_lines())
+            uploader.timer.extra_summary.extend(uploader.blocker.summary_lines())
+            uploader.timer.extra_summary.extend(uploader.waterfall.summary_lines())
+            uploader.waterfall.write(uploader.timer)
+        except Exception as e:
+            logging.warning(f"{self.name}: job report failed: {e}")
+        finally:
+            uploader.blocker.reset()
+            uploader.waterfall.reset()
+            uploader.timer.flush()
+
+
+class DaemonHandler(socketserver.StreamRequestHandler):
+    """One JSON request per line: a job, {"command": "status"} or {"command": "shutdown"}"""
+
+    def handle(self):
+        line = self.rfile.readline()
+        try:
+            request = json.loads(line)
+        except ValueError:
+            return self.reply({"success": False, "error": "invalid JSON"})
+
+        command = request.get("command", "upload")
+        if command == "status":
+            return self.reply(self.server.daemon.status())
+        if command == "shutdown":
+            self.reply({"success": True})
+            return threading.Thread(target=self.server.shutdown, daemon=True).start()
+
+        try:
+            job = Job(request)
+        except KeyError as e:
+            return self.reply({"success": False, "error": f"missing {e}"})
+        self.server.daemon.jobs.put(job)
+        job.done.wait()
+        self.reply(job.result)
+
+    def reply(self, data):
+        self.wfile.write((json.dumps(data) + "\n").encode("utf-8"))
+
+
+class UnixServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+class BrowserDaemon:
+    def __init__(self, socket_path=DEFAULT_SOCKET, pool_size=1, max_jobs_per_driver=20):
+        self.socket_path = socket_path
+        self.jobs = queue.Queue()
+        self.workers = [DriverWorker(i, self.jobs, max_jobs_per_driver) for i in range(pool_size)]
+
+    def status(self):
+        return {
+            "success": True,
+            "queued": self.jobs.qsize(),
+            "workers": [
+                {"name": w.name, "warm": w.uploader is not None, "jobs_on_driver": w.jobs_on_driver}
+                for w in self.workers
+            ],
+        }
+
+    def serve(self):
+        # Jobs bring their own cookie files, the owner's secret must never stand in for one
+        os.environ.pop("NAUKRI_COOKIES_B64", None)
+        if os.path.exists(self.socket_path):
+            os.unlink(self.socket_path)
+        # Create the socket owner-only from the start, no window where others can connect
+        old_umask = os.umask(0o177)
+        try:
+            server = UnixServer(self.socket_path, DaemonHandler)
+        finally:
+            os.umask(old_umask)
+        server.daemon = self
+        os.chmod(self.socket_path, 0o600)
+
+        # Warm every driver before taking jobs
+        for worker in self.workers:
+            try:
+                worker.start_driver()
+            except Exception as e:
+                logging.error(f"{worker.name}: initial driver start failed, will retry per job: {e}")
+            worker.start()
+
+        logging.info(f"🛰️ Daemon listening on {self.socket_path} with {len(self.workers)} driver(s)")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            for worker in self.workers:
+                worker.stopping = True
+                self.jobs.put(None)
+            for worker in self.workers:
+                worker.join(timeout=30)
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+            logging.info("🧹 Daemon stopped")
+
+
+def send_request(request, socket_path=DEFAULT_SOCKET, timeout=900):
+    """Send one request to a running daemon and wait for its reply"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(timeout)
+        client.connect(socket_path)
+        client.sendall((json.dumps(request) + "\n").encode("utf-8"))
+        reply = b""
+        while not reply.endswith(b"\n"):
+            chunk = client.recv(65536)
+            if not chunk:
+                break
+            reply += chunk
+    return json.loads(reply) if reply else {"success": False, "error": "no reply"}
+
+
+def main(argv=None):
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(threadName)s - %(levelname)s - %(message)s")
+    parser = argparse.ArgumentParser(description="Warm browser daemon for resume uploads")
+    parser.add_argument("--socket", default=DEFAULT_SOCKET)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    serve = sub.add_parser("serve", help="start the daemon")
+    serve.add_argument("--pool", type=int, default=1, help="number of warm drivers")
+    serve.add_argument("--max-jobs", type=int, default=20, help="recycle a driver after this many jobs")
+
+    submit = sub.add_parser("submit", help="queue an upload and wait for the result")
+    submit.add_argument("--resume", required=True)
+    submit.add_argument("--cookies", required=True)
+    submit.add_argument("--account")
+    submit.add_argument("--force", action="store_true")
+
+    sub.add_parser("status", help="show daemon workers and queue")
+    sub.add_parser("shutdown", help="stop the daemon")
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        BrowserDaemon(args.socket, args.pool, args.max_jobs).serve()
+        return 0
+
+    if args.command == "submit":
+        request = {"resume": args.resume, "cookies": args.cookies, "account": args.account, "force": args.force}
+    else:
+        request = {"command": args.command}
+    reply = send_request(request, args.socket)
+    print(json.dumps(reply, indent=2))
+    return 0 if reply.get("success") else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,154 @@
+# automation/cli.py
+"""
+Command line entry point - subcommands import only what they use, so cookie
+and resume checks start instantly and run on hosts without Chrome or Selenium
+"""
+
+import os
+import sys
+import json
+import logging
+import argparse
+
+DEFAULT_RESUME = "./resume/Nikhil_Saini_Resume.pdf"
+DEFAULT_COOKIES = "./cookies/naukri_cookies.json"
+UPLOAD_MODES = ["auto", "http", "browser"]  # http_uploader.UPLOAD_MODES, not imported so --help stays instant
+
+
+def check_cookies(args):
+    """Expiry check, then the HTTP probe unless --offline"""
+    from session_preflight import check_session, log_result, DEAD, EXIT_SESSION_EXPIRED
+
+    result = check_session(args.cookies, os.getenv("NAUKRI_COOKIES_B64"), probe=not args.offline)
+    log_result(result)
+    return EXIT_SESSION_EXPIRED if result.status == DEAD else 0
+
+
+def prepare_resume(args):
+    """Validate, size-check and optimize the resume into the cache"""
+    from resume_prep import ResumePreparer, ResumeError, EXIT_RESUME_REJECTED
+
+    try:
+        prepared = ResumePreparer().prepare(args.resume)
+    except (ResumeError, FileNotFoundError) as e:
+        logging.error(f"❌ Resume rejected: {e}")
+        return EXIT_RESUME_REJECTED
+    print(json.dumps(prepared._asdict(), indent=2))
+    return 0
+
+
+def dry_run(args):
+    """Everything up to the upload without launching Chrome"""
+    from resume_prep import ResumePreparer, ResumeError, EXIT_RESUME_REJECTED
+    from upload_ledger import UploadLedger
+    from session_preflight import check_session, log_result, DEAD, EXIT_SESSION_EXPIRED
+    from driver_cache import DriverCache
+    from http_uploader import resolve_upload_mode
+
+    try:
+        prepared = ResumePreparer().prepare(args.resume)
+    except (ResumeError, FileNotFoundError) as e:
+        logging.error(f"❌ Resume rejected: {e}")
+        return EXIT_RESUME_REJECTED
+
+    account = os.getenv("NAUKRI_ACCOUNT", "default")
+    confirmed = UploadLedger().recent_confirmation(prepared.sha256, account)
+    if confirmed:
+        logging.info(f"📒 Resume {prepared.sha256[:12]} already confirmed at {confirmed['confirmed_at']}, a run would skip it")
+
+    result = check_session(args.cookies, os.getenv("NAUKRI_COOKIES_B64"))
+    log_result(result)
+    if result.status == DEAD:
+        return EXIT_SESSION_EXPIRED
+
+    mode = resolve_upload_mode(args.mode)
+    if mode != "http":
+        cache = DriverCache()
+        manifest = cache.resolve()
+        if cache.chrome_binary:
+            driver = manifest.get("chrome_driver") or manifest.get("uc_driver") or "resolved at launch"
+            logging.info(f"🌐 Chrome {cache.build or '?'} at {cache.chrome_binary}, driver: {driver}")
+        elif mode == "browser":
+            logging.error("❌ Chrome not found, the browser upload cannot run here")
+            return 1
+        else:
+            logging.warning("⚠️ Chrome not found, only the HTTP upload path can run here")
+
+    logging.info(f"✅ Dry run passed: would upload {prepared.path} ({prepared.size} bytes) in {mode} mode")
+    return 0
+
+
+def upload(args):
+    """Full upload run on the chosen engine"""
+    if args.engine == "async":
+        import asyncio
+        from async_uploader import AsyncNaukriUploader
+        uploader = AsyncNaukriUploader()
+        uploader.upload_mode = args.mode
+        if args.force:
+            uploader.force = True
+        success = asyncio.run(uploader.run())
+        return 0 if success else uploader.exit_code or 1
+
+    from naukri_cookie_uploader import StealthNaukriUploader
+    uploader = StealthNaukriUploader()
+    uploader.upload_mode = args.mode
+    if args.force:
+        uploader.force = True
+    success = uploader.run()
+    return 0 if success else uploader.exit_code or 1
+
+
+def bench(args):
+    """End-to-end stand-in benchmark or the Chrome launch benchmark"""
+    if args.target == "launch":
+        from launch_benchmark import main as launch_main
+        return launch_main(args.bench_args)
+    from benchmark import main as flow_main
+    return flow_main(args.bench_args)
+
+
+def main(argv=None):
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    parser = argparse.ArgumentParser(description="Naukri resume automation")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    cookies = sub.add_parser("check-cookies", help="check the saved session without a browser")
+    cookies.add_argument("--cookies", default=os.getenv("NAUKRI_COOKIES_FILE", DEFAULT_COOKIES))
+    cookies.add_argument("--offline", action="store_true", help="only check cookie expiries, no HTTP probe")
+    cookies.set_defaults(handler=check_cookies)
+
+    resume = sub.add_parser("prepare-resume", help="validate and optimize the resume into the cache")
+    resume.add_argument("--resume", default=os.getenv("RESUME_PATH", DEFAULT_RESUME))
+    resume.set_defaults(handler=prepare_resume)
+
+    dry = sub.add_parser("dry-run", help="resume, ledger, session and Chrome checks without uploading")
+    dry.add_argument("--resume", default=os.getenv("RESUME_PATH", DEFAULT_RESUME))
+    dry.add_argument("--cookies", default=os.getenv("NAUKRI_COOKIES_FILE", DEFAULT_COOKIES))
+    dry.add_argument("--mode", choices=UPLOAD_MODES, default=os.getenv("UPLOAD_MODE", "auto"))
+    dry.set_defaults(handler=dry_run)
+
+    run = sub.add_parser("upload", help="upload the resume")
+    run.add_argument("--force", action="store_true", help="upload even if this resume was confirmed recently")
+    run.add_argument(
+        "--engine", choices=["selenium", "async"], default=os.getenv("UPLOAD_ENGINE", "selenium"),
+        help="selenium (default) or the asyncio DevTools engine"
+    )
+    run.add_argument(
+        "--mode", choices=UPLOAD_MODES, default=os.getenv("UPLOAD_MODE", "auto"),
+        help="auto tries plain HTTP first when HTTP_UPLOAD_URL is set, then the browser"
+    )
+    run.set_defaults(handler=upload)
+
+    benchmark = sub.add_parser("bench", help="run a benchmark, extra arguments go to it")
+    benchmark.add_argument("target", choices=["flow", "launch"],
+                           help="flow against the local stand-in, or Chrome launch strategies")
+    benchmark.add_argument("bench_args", nargs=argparse.REMAINDER)
+    benchmark.set_defaults(handler=bench)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
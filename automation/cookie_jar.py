@@ -0,0 +1,151 @@
+# automation/cookie_jar.py
+"""
+Cookie jar helpers - sameSite normalization and bulk injection through DevTools
+"""
+
+import json
+import time
+import logging
+
+SAME_SITE_VALUES = {
+    "none": "Lax",  # Naukri rejects SameSite=None without a secure context
+    "no_restriction": "Lax",
+    "lax": "Lax",
+    "strict": "Strict",
+}
+
+
+def read_cookie_file(cookies_file):
+    """Load the cookie list saved by get_cookies() or a browser export"""
+    with open(cookies_file, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def normalize_same_site(cookie):
+    """Apply the sameSite fix-up used for every cookie we inject"""
+    same_site = cookie.get("sameSite")
+    if same_site is None:
+        return cookie
+    normalized = SAME_SITE_VALUES.get(str(same_site).lower())
+    if normalized:
+        cookie["sameSite"] = normalized
+    else:
+        cookie.pop("sameSite", None)
+    return cookie
+
+
+def cookie_expiry(cookie):
+    """Expiry as epoch seconds, None for session cookies"""
+    expiry = cookie.get("expiry", cookie.get("expirationDate", cookie.get("expires")))
+    if expiry is None or expiry == -1:
+        return None
+    return float(expiry)
+
+
+def to_cdp_cookie(cookie, default_domain="www.naukri.com"):
+    """Convert a WebDriver cookie to a Network.CookieParam, raises ValueError if unusable"""
+    name = cookie.get("name")
+    if not name or cookie.get("value") is None:
+        raise ValueError("missing name or value")
+
+    expiry = cookie_expiry(cookie)
+    if expiry is not None and expiry < time.time():
+        raise ValueError("expired")
+
+    param = {
+        "name": name,
+        "value": str(cookie["value"]),
+        "domain": cookie.get("domain") or default_domain,
+        "path": cookie.get("path", "/"),
+        "secure": bool(cookie.get("secure", False)),
+        "httpOnly": bool(cookie.get("httpOnly", False)),
+    }
+    if expiry is not None:
+        param["expires"] = expiry
+    if cookie.get("sameSite"):
+        param["sameSite"] = cookie["sameSite"]
+    return param
+
+
+def cookie_key(name, domain):
+    return name, (domain or "").lstrip(".")
+
+
+def build_cookie_params(cookies):
+    """CookieParams for every usable cookie, plus (name, reason) for the ones dropped locally"""
+    params = []
+    rejected = []
+    for cookie in cookies:
+        try:
+            params.append(to_cdp_cookie(normalize_same_site(dict(cookie))))
+        except ValueError as e:
+            rejected.append((cookie.get("name"), str(e)))
+    return params, rejected
+
+
+def cookie_urls(params):
+    """URLs that cover every domain/path in the jar, for Network.getCookies"""
+    return sorted({f"https://{p['domain'].lstrip('.')}{p['path']}" for p in params})
+
+
+def matches_stored(param, stored):
+    """True when the browser holds exactly this cookie, not an older one under the same name"""
+    if stored["value"] != param["value"] or stored.get("path", "/") != param["path"]:
+        return False
+    if "expires" not in param:
+        return stored.get("session", True)
+    # Chrome keeps expiries as float seconds, allow for rounding in the saved jar
+    return not stored.get("session") and abs(stored.get("expires", -1) - param["expires"]) < 1
+
+
+def split_applied(params, stored_cookies):
+    """Compare what we sent with what the browser kept, returns (applied, rejected)"""
+    stored_by_key = {}
+    for cookie in stored_cookies:
+        stored_by_key.setdefault(cookie_key(cookie["name"], cookie.get("domain")), []).append(cookie)
+    applied = []
+    rejected = []
+    for param in params:
+        stored = stored_by_key.get(cookie_key(param["name"], param["domain"]), [])
+        if any(matches_stored(param, cookie) for cookie in stored):
+            applied.append(param)
+        elif stored:
+            rejected.append((param["name"], "rejected by browser, an older value is still set"))
+        else:
+            rejected.append((param["name"], "rejected by browser"))
+    return applied, rejected
+
+
+def from_cdp_cookie(cookie):
+    """Network.Cookie back to the get_cookies() format we save to disk"""
+    saved = {
+        "name": cookie["name"],
+        "value": cookie["value"],
+        "domain": cookie["domain"],
+        "path": cookie.get("path", "/"),
+        "secure": cookie.get("secure", False),
+        "httpOnly": cookie.get("httpOnly", False),
+    }
+    if not cookie.get("session") and cookie.get("expires", -1) > 0:
+        saved["expiry"] = int(cookie["expires"])
+    if cookie.get("sameSite"):
+        saved["sameSite"] = cookie["sameSite"]
+    return saved
+
+
+def bulk_set_cookies(driver, cookies):
+    """Set the whole jar with one Network.setCookies call, returns (applied, rejected)"""
+    params, rejected = build_cookie_params(cookies)
+
+    if params:
+        driver.execute_cdp_cmd("Network.setCookies", {"cookies": params})
+
+    # setCookies is all-or-nothing in its reply, read the jar back to see what stuck
+    urls = cookie_urls(params)
+    stored = driver.execute_cdp_cmd("Network.getCookies", {"urls": urls}) if urls else {"cookies": []}
+    applied, browser_rejected = split_applied(params, stored.get("cookies", []))
+    rejected.extend(browser_rejected)
+
+    for name, reason in rejected:
+        logging.warning(f"Cookie {name} failed: {reason}")
+    return applied, rejected
@@ -0,0 +1,101 @@
+# automation/debug_capture.py
+"""
+Debug capture - screenshots and gzipped page source written off the main
+thread, by level (none, on-failure, always), with ring-buffer retention
+"""
+
+import os
+import gzip
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+CAPTURE_LEVELS = ("none", "on-failure", "always")
+
+
+class DebugCapture:
+    def __init__(self, capture_dir=None):
+        self.level = os.getenv("DEBUG_CAPTURE", "on-failure").lower()
+        if self.level not in CAPTURE_LEVELS:
+            logging.warning(f"Unknown DEBUG_CAPTURE level {self.level}, using on-failure")
+            self.level = "on-failure"
+        self.phase_captures = os.getenv("DEBUG_CAPTURE_PHASES", "0") == "1"
+        # Artifacts get their own directory so retention never touches timing history or logs
+        self.capture_dir = capture_dir or os.getenv("DEBUG_CAPTURE_DIR", "./logs/debug")
+        self.keep_files = int(os.getenv("DEBUG_KEEP_FILES", "40"))
+        self.max_bytes = float(os.getenv("DEBUG_MAX_MB", "100")) * 1024 * 1024
+        self.executor = None
+        self.pending = []
+        self.sequence = 0
+
+    def should_capture(self, failed):
+        return self.level == "always" or (self.level == "on-failure" and failed)
+
+    def should_capture_phase(self, failed):
+        return self.phase_captures and self.should_capture(failed)
+
+    def capture(self, driver, label):
+        """Grab screenshot and source from a Selenium session, write them in the background"""
+        try:
+            png = driver.get_screenshot_as_png()
+            html = driver.page_source
+        except Exception as e:
+            logging.error(f"Debug capture failed: {e}")
+            return
+        self.save(label, png, html)
+
+    def save(self, label, png, html):
+        """Queue one artifact set for the writer thread"""
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="debug_capture")
+        self.sequence += 1
+        prefix = f"{int(time.time())}_{os.getpid()}_{self.sequence:02d}_{label}"
+        self.pending.append(self.executor.submit(self._write, prefix, png, html))
+
+    def _write(self, prefix, png, html):
+        os.makedirs(self.capture_dir, exist_ok=True)
+        base = os.path.join(self.capture_dir, prefix)
+        if png:
+            with open(f"{base}.png", "wb") as f:
+                f.write(png)
+        if html:
+            with gzip.open(f"{base}.html.gz", "wt", encoding="utf-8", compresslevel=6) as f:
+                f.write(html)
+        logging.info(f"🐛 Debug info saved as {base}.*")
+
+    def enforce_retention(self):
+        """Drop the oldest artifacts beyond the file count or total size cap"""
+        try:
+            entries = [
+                entry for entry in os.scandir(self.capture_dir)
+                if entry.is_file() and entry.name.endswith((".png", ".html.gz"))
+            ]
+        except FileNotFoundError:
+            return
+        entries.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
+
+        total = 0
+        removed = 0
+        for index, entry in enumerate(entries):
+            total += entry.stat().st_size
+            if index >= self.keep_files or total > self.max_bytes:
+                try:
+                    os.remove(entry.path)
+                    removed += 1
+                except OSError:
+                    pass
+        if removed:
+            logging.info(f"🧹 Removed {removed} old debug artifact(s)")
+
+    def close(self):
+        """Wait for queued writes, then apply retention"""
+        for future in self.pending:
+            try:
+                future.result()
+            except Exception as e:
+                logging.error(f"Debug save failed: {e}")
+        self.pending = []
+        if self.executor:
+            self.executor.shutdown(wait=True)
+            self.executor = None
+        self.enforce_retention()
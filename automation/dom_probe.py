@@ -0,0 +1,186 @@
+# automation/dom_probe.py
+"""
+DOM probe - evaluates a whole named set of selectors in one injected script,
+so a scan is one WebDriver round-trip and a missing selector costs nothing
+"""
+
+import json
+import time
+import logging
+from collections import namedtuple
+
+ProbeResult = namedtuple("ProbeResult", ["name", "count", "visible", "enabled", "first", "usable", "texts"])
+
+RaceResult = namedtuple("RaceResult", ["outcome", "name", "elapsed"])
+
+# Selectors are XPath strings, or ("css", selector) tuples
+MATCH_JS = """
+const isVisible = (el) => {
+    if (!el.getClientRects().length) return false;
+    const style = window.getComputedStyle(el);
+    return style.visibility !== 'hidden' && style.display !== 'none';
+};
+const findNodes = (spec) => {
+    if (spec.type === 'css') return Array.from(document.querySelectorAll(spec.value));
+    const snap = document.evaluate(spec.value, document, null,
+        XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    const nodes = [];
+    for (let i = 0; i < snap.snapshotLength; i++) nodes.push(snap.snapshotItem(i));
+    return nodes;
+};
+"""
+
+PROBE_JS = MATCH_JS + """
+const specs = arguments[0];
+const limit = arguments[1];
+const out = {};
+for (const [name, spec] of Object.entries(specs)) {
+    let nodes = [];
+    try {
+        nodes = findNodes(spec);
+    } catch (e) {
+        out[name] = {count: 0, visible: 0, enabled: 0, first: null, usable: [], texts: [], error: String(e)};
+        continue;
+    }
+    const visible = nodes.filter(isVisible);
+    const usable = visible.filter((el) => !el.disabled);
+    out[name] = {
+        count: nodes.length,
+        visible: visible.length,
+        enabled: nodes.filter((el) => !el.disabled).length,
+        first: nodes.length ? nodes[0] : null,
+        usable: usable.slice(0, limit),
+        texts: usable.slice(0, limit).map((el) => (el.innerText || el.value || '').trim())
+    };
+}
+return out;
+"""
+
+# Success selectors fire on presence, failure selectors only when visible,
+# since error banners are often pre-rendered hidden templates
+RACE_JS = MATCH_JS + """
+const success = arguments[0];
+const failure = arguments[1];
+const timeoutMs = arguments[2];
+const done = arguments[arguments.length - 1];
+let finished = false;
+let scheduled = false;
+let observer = null;
+let timer = null;
+const matches = (spec, visibleOnly) => {
+    try {
+        const nodes = findNodes(spec);
+        return visibleOnly ? nodes.some(isVisible) : nodes.length > 0;
+    } catch (e) {
+        return false;
+    }
+};
+const finish = (outcome, name) => {
+    if (finished) return;
+    finished = true;
+    if (observer) observer.disconnect();
+    clearTimeout(timer);
+    done({outcome: outcome, name: name});
+};
+const check = () => {
+    scheduled = false;
+    for (const [name, spec] of Object.entries(failure)) {
+        if (matches(spec, true)) return finish('failure', name);
+    }
+    for (const [name, spec] of Object.entries(success)) {
+        if (matches(spec, false)) return finish('success', name);
+    }
+};
+check();
+if (!finished) {
+    observer = new MutationObserver(() => {
+        if (!scheduled) {
+            scheduled = true;
+            setTimeout(check, 50);
+        }
+    });
+    observer.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+    timer = setTimeout(() => finish('timeout', null), timeoutMs);
+}
+"""
+
+
+# Scrolls the first visible, enabled match into view and reports where to click it
+TARGET_JS = MATCH_JS + """
+const spec = arguments[0];
+const el = findNodes(spec).find((node) => isVisible(node) && !node.disabled);
+if (!el) return null;
+el.scrollIntoView({block: 'center'});
+const rect = el.getBoundingClientRect();
+return {
+    x: rect.left + rect.width / 2,
+    y: rect.top + rect.height / 2,
+    text: (el.innerText || el.value || '').trim()
+};
+"""
+
+
+def call_script(script, *args):
+    """Wrap a WebDriver-style script (reads arguments[]) as a standalone expression"""
+    return f"(function () {{ {script} }}).apply(null, {json.dumps(list(args))})"
+
+
+def call_async_script(script, *args):
+    """Same for async scripts, the trailing callback becomes a promise resolver"""
+    return (
+        f"new Promise((resolve) => (function () {{ {script} }})"
+        f".apply(null, {json.dumps(list(args))}.concat([resolve])))"
+    )
+
+
+def selector_spec(selector):
+    if isinstance(selector, tuple):
+        kind, value = selector
+        return {"type": kind, "value": value}
+    return {"type": "xpath", "value": selector}
+
+
+class DomProbe:
+    def __init__(self, driver=None, element_limit=20):
+        self.driver = driver
+        self.element_limit = element_limit
+
+    def scan(self, selectors):
+        """Probe every named selector at once, returns {name: ProbeResult} in input order"""
+        specs = {name: selector_spec(selector) for name, selector in selectors.items()}
+        raw = self.driver.execute_script(PROBE_JS, specs, self.element_limit) or {}
+
+        results = {}
+        for name in selectors:
+            data = raw.get(name) or {}
+            if data.get("error"):
+                logging.warning(f"Probe selector '{name}' failed: {data['error']}")
+            results[name] = ProbeResult(
+                name=name,
+                count=data.get("count", 0),
+                visible=data.get("visible", 0),
+                enabled=data.get("enabled", 0),
+                first=data.get("first"),
+                usable=data.get("usable") or [],
+                texts=data.get("texts") or []
+            )
+        return results
+
+    def first_visible(self, selectors):
+        """Name of the first selector with a visible match, or None"""
+        for name, result in self.scan(selectors).items():
+            if result.visible:
+                return name
+        return None
+
+    def race(self, success, failure, timeout=30):
+        """Watch success and failure selectors together, returns whichever resolves first"""
+        start = time.monotonic()
+        self.driver.set_script_timeout(timeout + 5)
+        raw = self.driver.execute_async_script(
+            RACE_JS,
+            {name: selector_spec(selector) for name, selector in success.items()},
+            {name: selector_spec(selector) for name, selector in failure.items()},
+            int(timeout * 1000)
+        ) or {}
+        return RaceResult(raw.get("outcome", "timeout"), raw.get("name"), time.monotonic() - start)
@@ -0,0 +1,117 @@
+# automation/driver_cache.py
+"""
+Offline chromedriver resolution - a manifest keyed by the installed Chrome
+build records which driver binaries worked, so later runs launch straight
+from it without version detection, patching or downloads
+"""
+
+import os
+import re
+import json
+import stat
+import shutil
+import logging
+import subprocess
+from datetime import datetime
+
+CHROME_CANDIDATES = ["google-chrome", "google-chrome-stable", "chromium", "chromium-browser"]
+VERSION_PATTERN = re.compile(r"(\d+)\.(\d+)\.(\d+)\.(\d+)")
+
+
+def find_chrome_binary():
+    """CHROME_BIN if set, else the first Chrome on PATH"""
+    chrome_bin = os.getenv("CHROME_BIN")
+    if chrome_bin and os.path.exists(chrome_bin):
+        return chrome_bin
+    for candidate in CHROME_CANDIDATES:
+        path = shutil.which(candidate)
+        if path:
+            return path
+    return None
+
+
+def detect_chrome_build(chrome_binary):
+    """Full Chrome build like 120.0.6099.71, read from the local binary only"""
+    try:
+        output = subprocess.run(
+            [chrome_binary, "--version"], capture_output=True, text=True, timeout=10
+        ).stdout
+    except (OSError, subprocess.SubprocessError) as e:
+        logging.warning(f"Could not read Chrome version: {e}")
+        return None
+    match = VERSION_PATTERN.search(output)
+    return match.group(0) if match else None
+
+
+class DriverCache:
+    def __init__(self, cache_dir=None):
+        self.cache_dir = os.path.expanduser(
+            cache_dir or os.getenv("DRIVER_CACHE_DIR", "~/.cache/naukri-automation/drivers")
+        )
+        self.manifest_path = os.path.join(self.cache_dir, "manifest.json")
+        self.chrome_binary = None
+        self.build = None
+
+    @property
+    def version_main(self):
+        return int(self.build.split(".")[0]) if self.build else None
+
+    def resolve(self):
+        """Detect the installed Chrome build, returns its manifest entry (empty if unseen)"""
+        self.chrome_binary = find_chrome_binary()
+        self.build = detect_chrome_build(self.chrome_binary) if self.chrome_binary else None
+        if not self.build:
+            return {}
+
+        entry = self.load().get(self.build, {})
+        entry = {key: path for key, path in entry.items() if not key.endswith("_driver") or os.path.exists(path)}
+        if entry:
+            logging.info(f"📦 Driver manifest hit for Chrome {self.build}")
+        else:
+            logging.info(f"📦 No cached driver for Chrome {self.build}, resolving online this time")
+        return entry
+
+    def load(self):
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def record(self, **fields):
+        """Merge fields into this build's entry and drop entries of other builds"""
+        if not self.build:
+            return
+        manifest = self.load()
+        for build, entry in manifest.items():
+            if build != self.build:
+                for key, path in entry.items():
+                    if key.endswith("_driver") and path.startswith(self.cache_dir):
+                        try:
+                            os.unlink(path)
+                        except OSError:
+                            pass
+
+        entry = manifest.get(self.build, {})
+        entry.update(fields)
+        entry["chrome_binary"] = self.chrome_binary
+        entry["version_main"] = self.version_main
+        entry["resolved_at"] = datetime.now().isoformat(timespec="seconds")
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = self.manifest_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({self.build: entry}, f, indent=2)
+        os.replace(tmp_path, self.manifest_path)
+
+    def store_binary(self, key, source_path):
+        """Copy a working (already patched) driver binary into the cache"""
+        if not self.build or not source_path or not os.path.exists(source_path):
+            return None
+        os.makedirs(self.cache_dir, exist_ok=True)
+        target = os.path.join(self.cache_dir, f"{key}_{self.build}")
+        if os.path.abspath(source_path) != os.path.abspath(target):
+            shutil.copy2(source_path, target)
+        os.chmod(target, os.stat(target).st_mode | stat.S_IXUSR | stat.S_IXGRP | stat.S_IXOTH)
+        self.record(**{key: target})
+        return target
@@ -0,0 +1,201 @@
+# automation/http_uploader.py
+"""
+HTTP-only upload fast path - posts the resume as a streamed multipart body
+on a pooled requests.Session carrying the saved cookies, no browser involved
+"""
+
+import os
+import re
+import json
+import uuid
+import logging
+import mimetypes
+
+from run_timing import RunTimer
+from naukri_selectors import HTTP_UPLOAD_URL, HTTP_CONFIRM_URL
+from session_preflight import load_cookie_jar, build_session, USE_REQUESTS, LOGIN_MARKERS
+
+UPLOAD_MODES = ("auto", "http", "browser")
+
+# Response keys that identify the stored file, one of them (or ok: true) must be present
+UPLOAD_ID_KEYS = ("id", "uploadId", "resumeId", "fileKey")
+# Profile page "last updated" stamp, compared before and after the upload
+DEFAULT_CONFIRM_PATTERN = r"(?:uploaded|updated)\s+on\s*:?\s*([^<\n]+)"
+
+
+class MultipartStream:
+    """multipart/form-data body read from disk in chunks, with a known length so no chunked encoding"""
+
+    def __init__(self, field, path, fields=None):
+        boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+        file_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+
+        head = b""
+        for name, value in (fields or {}).items():
+            head += (
+                f"--{boundary}\r\n"
+                f'Content-Disposition: form-data; name="{name}"\r\n\r\n'
+                f"{value}\r\n"
+            ).encode("utf-8")
+        head += (
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="{field}"; filename="{os.path.basename(path)}"\r\n'
+            f"Content-Type: {file_type}\r\n\r\n"
+        ).encode("utf-8")
+
+        self.parts = [head, None, f"\r\n--{boundary}--\r\n".encode("utf-8")]
+        self.file = open(path, "rb")
+        self.length = len(head) + os.path.getsize(path) + len(self.parts[2])
+        self.index = 0
+        self.offset = 0
+
+    def __len__(self):
+        return self.length
+
+    def read(self, size=-1):
+        size = size if size and size > 0 else 64 * 1024
+        chunk = b""
+        while len(chunk) < size and self.index < len(self.parts):
+            part = self.parts[self.index]
+            if part is None:
+                data = self.file.read(size - len(chunk))
+                if not data:
+                    self.index += 1
+                    continue
+                chunk += data
+            else:
+                data = part[self.offset:self.offset + size - len(chunk)]
+                chunk += data
+                self.offset += len(data)
+                if self.offset >= len(part):
+                    self.index += 1
+                    self.offset = 0
+        return chunk
+
+    def close(self):
+        self.file.close()
+
+
+def resolve_upload_mode(mode):
+    """auto only tries HTTP against an explicitly configured upload endpoint"""
+    if mode == "auto" and not HTTP_UPLOAD_URL:
+        logging.info("ℹ️ HTTP_UPLOAD_URL not set, auto mode goes straight to the browser")
+        return "browser"
+    return mode
+
+
+def json_env(name):
+    """Dict from a JSON env var, empty when unset or invalid"""
+    try:
+        value = json.loads(os.getenv(name, "") or "{}")
+        return value if isinstance(value, dict) else {}
+    except ValueError:
+        logging.warning(f"{name} is not valid JSON, ignoring it")
+        return {}
+
+
+class HttpUploader:
+    def __init__(self, resume_path, cookies_file, cookies_b64=None, timer=None):
+        self.resume_path = resume_path
+        self.cookies_file = cookies_file
+        self.cookies_b64 = cookies_b64
+        self.timer = timer or RunTimer()
+        self.upload_url = HTTP_UPLOAD_URL
+        self.confirm_url = HTTP_CONFIRM_URL
+        self.field = os.getenv("HTTP_UPLOAD_FIELD", "file")
+        self.headers = json_env("HTTP_UPLOAD_HEADERS")
+        self.form = json_env("HTTP_UPLOAD_FORM")
+        self.timeout = float(os.getenv("HTTP_UPLOAD_TIMEOUT", "60"))
+        self.confirm_pattern = re.compile(os.getenv("HTTP_CONFIRM_PATTERN", DEFAULT_CONFIRM_PATTERN), re.IGNORECASE)
+        self.upload_indicator = None
+        self.upload_id = None
+        self.baseline_stamp = None
+
+    def upload(self, session):
+        """POST the resume, True when the endpoint accepts it"""
+        body = MultipartStream(self.field, self.resume_path, self.form)
+        try:
+            headers = dict(self.headers, **{"Content-Type": body.content_type, "Content-Length": str(len(body))})
+            logging.info(f"📤 Streaming {len(body)} bytes to {self.upload_url}")
+            response = session.post(self.upload_url, data=body, headers=headers,
+                                    timeout=self.timeout, allow_redirects=False)
+        finally:
+            body.close()
+
+        if response.is_redirect:
+            logging.warning(f"HTTP upload redirected to {response.headers.get('Location')}")
+            return False
+        if not response.ok:
+            logging.warning(f"HTTP upload rejected: HTTP {response.status_code}")
+            return False
+        try:
+            result = response.json()
+        except ValueError:
+            # A soft-404 or login page answers 200 with HTML, that is not an upload
+            logging.warning(f"HTTP upload answered HTTP {response.status_code} without JSON, not counting it")
+            return False
+        if not isinstance(result, dict) or result.get("ok") is False or result.get("error"):
+            logging.warning(f"HTTP upload refused: {str(result)[:200]}")
+            return False
+        upload_id = next((result[key] for key in UPLOAD_ID_KEYS if result.get(key)), None)
+        if result.get("ok") is not True and upload_id is None:
+            logging.warning(f"HTTP upload response has no ok flag or file id: {str(result)[:200]}")
+            return False
+        self.upload_id = str(upload_id) if upload_id is not None else None
+        return True
+
+    def profile_stamp(self, session):
+        """Last-updated stamp on the profile page, None if missing; raises on a login redirect"""
+        response = session.get(self.confirm_url, timeout=self.timeout)
+        if any(marker in response.url for marker in LOGIN_MARKERS):
+            raise Exception("profile page redirected to login")
+        if not response.ok:
+            logging.warning(f"{self.confirm_url} answered HTTP {response.status_code}")
+            return None, ""
+        match = self.confirm_pattern.search(response.text)
+        return (match.group(1).strip() if match else None), response.text
+
+    def confirm(self, session):
+        """The profile has to show this upload, the file name alone is the same every day"""
+        try:
+            stamp, page = self.profile_stamp(session)
+        except Exception as e:
+            logging.warning(f"HTTP confirmation failed: {e}")
+            return False
+        if self.upload_id and self.upload_id in page:
+            self.upload_indicator = f"http: upload id {self.upload_id} on profile"
+            return True
+        if stamp and stamp != self.baseline_stamp:
+            self.upload_indicator = f"http: profile updated {stamp}"
+            return True
+        logging.warning(f"No sign of this upload on {self.confirm_url} (stamp {stamp!r}, before {self.baseline_stamp!r})")
+        return False
+
+    def run(self):
+        """Upload and confirm over HTTP, never raises"""
+        if not USE_REQUESTS:
+            logging.warning("⚠️ requests not installed, HTTP fast path unavailable")
+            return False
+        if not self.upload_url:
+            logging.warning("⚠️ HTTP_UPLOAD_URL not set, HTTP fast path unavailable")
+            return False
+        try:
+            cookies = load_cookie_jar(self.cookies_file, self.cookies_b64)
+            with build_session(cookies) as session:
+                # Stamp before the upload, so yesterday's upload of the same file cannot confirm this one
+                self.baseline_stamp, _ = self.profile_stamp(session)
+                with self.timer.span("http_upload") as span:
+                    uploaded = self.upload(session)
+                    if not uploaded:
+                        span.outcome = "failed"
+                if not uploaded:
+                    return False
+                with self.timer.span("http_confirm") as span:
+                    confirmed = self.confirm(session)
+                    if not confirmed:
+                        span.outcome = "failed"
+                return confirmed
+        except Exception as e:
+            logging.warning(f"HTTP fast path failed: {e}")
+            return False
@@ -0,0 +1,216 @@
+# automation/launch_benchmark.py
+"""
+Chrome launch-strategy benchmark - launches each strategy from
+setup_stealth_driver repeatedly and measures time to first command,
+peak/steady RSS of the process tree and process count
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+import threading
+import statistics
+from datetime import datetime
+
+from proc_tree import tree_usage, driver_root_pids
+from run_timing import percentile
+
+STRATEGY_ORDER_PATH = os.getenv("CHROME_STRATEGY_ORDER", "./state/chrome_strategy_order.json")
+MB = 1024 * 1024
+
+
+class TreeSampler(threading.Thread):
+    """Samples everything this process spawned, so Chrome is covered while it is still starting"""
+
+    def __init__(self, interval=0.05):
+        super().__init__(name="tree_sampler", daemon=True)
+        self.interval = interval
+        self.samples = []
+        self.stopped = threading.Event()
+
+    def run(self):
+        while not self.stopped.is_set():
+            usage = tree_usage([os.getpid()], include_roots=False)
+            self.samples.append((time.monotonic(), usage.rss_bytes, usage.processes))
+            self.stopped.wait(self.interval)
+
+    def stop(self):
+        self.stopped.set()
+        self.join(timeout=2)
+
+    def peak_rss(self):
+        return max((rss for _, rss, _ in self.samples), default=0)
+
+    def since(self, start):
+        return [(rss, processes) for t, rss, processes in self.samples if t >= start]
+
+
+def measure_launch(approach, settle=3.0, interval=0.05, warm=False):
+    """One cold (or warm-profile) launch, None when the strategy does not apply here"""
+    from naukri_cookie_uploader import StealthNaukriUploader
+    uploader = StealthNaukriUploader()
+    uploader.use_profile_cache = warm
+    uploader.profile_name = f"bench-{approach}"
+    uploader.driver_manifest = uploader.driver_cache.resolve() if uploader.use_driver_cache else {}
+    user_data_dir = uploader.prepare_profile_dir()
+
+    sampler = TreeSampler(interval)
+    sampler.start()
+    driver = None
+    try:
+        start = time.monotonic()
+        driver = uploader.launch_healthy_driver(approach, user_data_dir)
+        if driver is None:
+            return None
+        ready = time.monotonic()
+
+        # Let the tree settle, then take the steady numbers from the settle window only
+        time.sleep(settle)
+        settled = sampler.since(ready) or [(0, 0)]
+        final = tree_usage(driver_root_pids(driver))
+        return {
+            "time_to_first_command": round(ready - start, 3),
+            "peak_rss_mb": round(sampler.peak_rss() / MB, 1),
+            "steady_rss_mb": round(statistics.median(rss for rss, _ in settled) / MB, 1),
+            "processes": max(max(p for _, p in settled), final.processes),
+        }
+    finally:
+        sampler.stop()
+        if driver:
+            try:
+                driver.quit()
+            except Exception as e:
+                logging.warning(f"Could not quit {approach}: {e}")
+        uploader.release_profile_dir()
+
+
+def summarize(runs):
+    ok = [run for run in runs if "error" not in run]
+    if not ok:
+        return {"launches": len(runs), "failures": len(runs)}
+    ttfc = [run["time_to_first_command"] for run in ok]
+    return {
+        "launches": len(runs),
+        "failures": len(runs) - len(ok),
+        "ttfc_p50": round(percentile(ttfc, 50), 3),
+        "ttfc_p95": round(percentile(ttfc, 95), 3),
+        "peak_rss_mb": max(run["peak_rss_mb"] for run in ok),
+        "steady_rss_mb": round(statistics.median(run["steady_rss_mb"] for run in ok), 1),
+        "processes": round(statistics.median(run["processes"] for run in ok)),
+    }
+
+
+def run_launch_benchmark(approaches, repeats=3, settle=3.0, warm=False):
+    results = {}
+    for approach in approaches:
+        runs = []
+        for attempt in range(1, repeats + 1):
+            logging.info(f"🏁 {approach} launch {attempt}/{repeats}")
+            try:
+                run = measure_launch(approach, settle=settle, warm=warm)
+            except Exception as e:
+                logging.error(f"{approach} launch failed: {e}")
+                run = {"error": str(e)[:200]}
+            if run is None:
+                logging.info(f"⏭️ {approach} not available on this machine")
+                break
+            runs.append(run)
+        if runs:
+            results[approach] = {"runs": runs, "summary": summarize(runs)}
+    return results
+
+
+def rank_strategies(results):
+    """Fastest median time to first command first, strategies that ever failed last"""
+    def key(item):
+        summary = item[1]["summary"]
+        return (summary["failures"] > 0, summary.get("ttfc_p50", float("inf")), summary.get("steady_rss_mb", 0))
+    return [approach for approach, _ in sorted(results.items(), key=key)]
+
+
+def format_table(results):
+    lines = [f"{'strategy':<20} {'ok':>5} {'ttfc p50':>9} {'ttfc p95':>9} {'peak MB':>8} {'steady MB':>10} {'procs':>6}"]
+    for approach in rank_strategies(results):
+        s = results[approach]["summary"]
+        ok = f"{s['launches'] - s['failures']}/{s['launches']}"
+        if "ttfc_p50" not in s:
+            lines.append(f"{approach:<20} {ok:>5} {'-':>9} {'-':>9} {'-':>8} {'-':>10} {'-':>6}")
+            continue
+        lines.append(
+            f"{approach:<20} {ok:>5} {s['ttfc_p50']:>9.2f} {s['ttfc_p95']:>9.2f} "
+            f"{s['peak_rss_mb']:>8.1f} {s['steady_rss_mb']:>10.1f} {s['processes']:>6}"
+        )
+    return "\n".join(lines)
+
+
+def write_strategy_order(order, path=STRATEGY_ORDER_PATH):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({
+            "order": order,
+            "ranked_by": "median time to first command, failing strategies last",
+            "generated_at": datetime.now().isoformat(timespec="seconds"),
+        }, f, indent=2)
+    logging.info(f"📝 Strategy order written to {path}: {', '.join(order)}")
+
+
+def ordered_approaches(approaches, path=STRATEGY_ORDER_PATH):
+    """Apply a benchmarked order to the (name, description) list, unknown or missing names keep their place after"""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            order = json.load(f)["order"]
+    except (OSError, ValueError, KeyError):
+        return list(approaches)
+    ranked = sorted(
+        approaches,
+        key=lambda a: (order.index(a[0]) if a[0] in order else len(order), approaches.index(a))
+    )
+    if ranked != list(approaches):
+        logging.info(f"🏎️ Chrome strategy order from {path}: {', '.join(name for name, _ in ranked)}")
+    return ranked
+
+
+def main(argv=None):
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    from naukri_cookie_uploader import StealthNaukriUploader
+    names = [name for name, _ in StealthNaukriUploader.CHROME_APPROACHES]
+
+    parser = argparse.ArgumentParser(description="Benchmark the Chrome launch strategies")
+    parser.add_argument("-n", "--repeats", type=int, default=3, help="launches per strategy")
+    parser.add_argument("--strategies", default=",".join(names), help="comma-separated subset")
+    parser.add_argument("--settle", type=float, default=3.0, help="seconds to sample after the first command")
+    parser.add_argument("--warm", action="store_true", help="launch on the cached profile instead of a fresh one")
+    parser.add_argument("--write-order", action="store_true", help=f"save the ranking to {STRATEGY_ORDER_PATH}")
+    parser.add_argument("--output-dir", default="./logs")
+    args = parser.parse_args(argv)
+
+    approaches = [name.strip() for name in args.strategies.split(",") if name.strip() in names]
+    results = run_launch_benchmark(approaches, args.repeats, args.settle, args.warm)
+    if not results:
+        logging.error("❌ No strategy could be launched")
+        return 1
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    output_file = os.path.join(args.output_dir, f"launch_benchmark_{int(time.time())}.json")
+    with open(output_file, "w", encoding="utf-8") as f:
+        json.dump({
+            "started_at": datetime.now().isoformat(timespec="seconds"),
+            "repeats": args.repeats,
+            "settle": args.settle,
+            "warm_profile": args.warm,
+            "strategies": results,
+            "order": rank_strategies(results),
+        }, f, indent=2)
+
+    logging.info("📊 Launch strategies:\n" + format_table(results))
+    logging.info(f"💾 Results saved to {output_file}")
+    if args.write_order:
+        write_strategy_order(rank_strategies(results))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
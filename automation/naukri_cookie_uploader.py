@@ -9,25 +9,56 @@ import time
 import json
 import base64
 import logging
+import sys
 import random
+import shutil
+import signal
 from datetime import datetime
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException
-from selenium.webdriver.common.action_chains import ActionChains
-
-# Check for undetected-chromedriver availability
-try:
-    import undetected_chromedriver as uc
-    USE_UNDETECTED = True
-    logging.info("✅ Undetected ChromeDriver available")
-except ImportError:
-    USE_UNDETECTED = False
-    logging.warning("⚠️ Undetected ChromeDriver not available - may get detected")
+from concurrent.futures import ThreadPoolExecutor
+
+from dom_probe import DomProbe
+from page_snapshot import PageSnapshot
+from profile_cache import ProfileCache, create_temp_profile
+from driver_cache import DriverCache
+from upload_ledger import UploadLedger
+from resource_blocker import ResourceBlocker
+from network_waterfall import NetworkWaterfall
+from debug_capture import DebugCapture
+from session_preflight import check_session, log_result, DEAD, EXIT_SESSION_EXPIRED
+from http_uploader import HttpUploader, resolve_upload_mode
+from phase_machine import PhaseMachine, Phase, parse_retries, DONE
+from launch_benchmark import ordered_approaches
+from proc_tree import tree_usage, driver_root_pids
+from resource_monitor import ResourceMonitor, EXIT_MEMORY_CEILING
+from resume_prep import ResumePreparer, ResumeError, EXIT_RESUME_REJECTED
+from navigation_hints import NavigationHints, UPLOAD_PAGE, PROFILE_LINK, UPLOAD_METHOD
+from run_timing import RunTimer, timed_phase
+from naukri_selectors import (
+    NAUKRI_HOME, UPLOAD_PAGES, LOGIN_INDICATORS, PROFILE_LINKS, UPLOAD_PAGE_MARKERS,
+    UPLOAD_ELEMENTS, SUBMIT_BUTTON, ENABLED_FILE_INPUT, FILE_INPUT, UPLOAD_BUTTON,
+    SUCCESS_INDICATORS, FAILURE_INDICATORS, STEALTH_JS
+)
+from cookie_jar import read_cookie_file, bulk_set_cookies
+from wait_engine import WaitEngine, document_ready, url_matches, element_present, network_idle, any_of
+
+# Selenium and undetected-chromedriver load on first launch, importing this module stays cheap
+uc = None
+USE_UNDETECTED = None
+
+
+def load_undetected():
+    """Probe undetected-chromedriver once, returns whether it is available"""
+    global uc, USE_UNDETECTED
+    if USE_UNDETECTED is None:
+        try:
+            import undetected_chromedriver
+            uc = undetected_chromedriver
+            USE_UNDETECTED = True
+            logging.info("✅ Undetected ChromeDriver available")
+        except ImportError:
+            USE_UNDETECTED = False
+            logging.warning("⚠️ Undetected ChromeDriver not available - may get detected")
+    return USE_UNDETECTED
 
 logging.basicConfig(
     level=logging.INFO,
@@ -38,168 +69,359 @@ class StealthNaukriUploader:
     def __init__(self):
         self.resume_path = os.getenv("RESUME_PATH", "./resume/Nikhil_Saini_Resume.pdf")
         self.driver = None
-        self.cookies_file = "./cookies/naukri_cookies.json"
+        self.cookies_file = os.getenv("NAUKRI_COOKIES_FILE", "./cookies/naukri_cookies.json")
         self.cookies_b64 = os.getenv("NAUKRI_COOKIES_B64")
-        self.use_undetected = USE_UNDETECTED  # Store as instance variable
+        self.use_undetected = None  # None probes undetected-chromedriver on first launch
+        self.startup_mode = os.getenv("CHROME_STARTUP_MODE", "sequential").lower()  # sequential | parallel
+        self.debug_port_base = int(os.getenv("CHROME_DEBUG_PORT_BASE", "9223"))  # uc, regular, minimal use base..base+2
+        self.timer = RunTimer()
+        self.waits = WaitEngine()
+        self.waits.timer = self.timer
+        self.probe = DomProbe()
+        self.page = PageSnapshot()
+        self.cookie_load_mode = os.getenv("COOKIE_LOAD_MODE", "bulk").lower()  # bulk | legacy
+        self.upload_verify_timeout = float(os.getenv("UPLOAD_VERIFY_TIMEOUT", "30"))
+        self.upload_indicator = None
+        self.upload_method = None  # method whose submit the confirm phase is judging
+        self.submitted_methods = set()  # never resubmit with a method that already posted the file
+        self.use_profile_cache = os.getenv("CHROME_PROFILE_CACHE", "1") != "0"
+        self.profile_name = os.getenv("CHROME_PROFILE_NAME", "default")
+        self.profile_cache = ProfileCache()
+        self.profile_slot = None
+        self.temp_profile_dir = None
+        self.use_driver_cache = os.getenv("DRIVER_CACHE", "1") != "0"
+        self.driver_cache = DriverCache()
+        self.driver_manifest = {}
+        self.account = os.getenv("NAUKRI_ACCOUNT", "default")
+        self.force = os.getenv("FORCE_RUN", "false").lower() == "true"
+        self.ledger = UploadLedger()
+        self.resume_hash = None
+        self.preparer = ResumePreparer()
+        self.upload_path = None
+        self.hints = NavigationHints()
+        self.blocker = ResourceBlocker()
+        self.waterfall = NetworkWaterfall()
+        if self.waterfall.enabled:
+            self.blocker.listeners.append(self.waterfall.record_event)
+        self.capture = DebugCapture()
+        self.run_succeeded = False
+        self.preflight = os.getenv("PREFLIGHT", "1") != "0"
+        self.exit_code = None
+        self.failure = None  # why run() returned False, for batch reports
+        self.upload_mode = os.getenv("UPLOAD_MODE", "auto").lower()  # auto | http | browser
+        self.upload_engine = None
+        self.phase_retries = parse_retries(os.getenv("PHASE_RETRIES", ""))
+        self.retry_backoff = float(os.getenv("PHASE_RETRY_BACKOFF", "2"))
+        self.max_driver_restarts = int(os.getenv("MAX_DRIVER_RESTARTS", "1"))
+        self.machine = None
+        self.chrome_approaches = ordered_approaches(self.CHROME_APPROACHES)  # launch_benchmark --write-order
+        self.monitor = ResourceMonitor(self.timer, self.monitored_pids)
+        self.monitor.on_ceiling = self.abort_for_memory
+        self.timer.listeners.append(self.capture_phase)
 
         os.makedirs("./cookies", exist_ok=True)
         os.makedirs("./logs", exist_ok=True)
 
-    def setup_stealth_driver(self):
-        """Setup maximum stealth browser with better version compatibility"""
-        driver_initialized = False
-        
-        # Generate unique user data dir to avoid conflicts
-        import tempfile
-        user_data_dir = tempfile.mkdtemp(prefix="chrome_profile_")
-        
-        # Try multiple approaches in order of preference
-        approaches = [
-            ("undetected_chrome", "Undetected ChromeDriver"),
-            ("regular_chrome", "Regular Chrome with stealth"),
-            ("minimal_chrome", "Minimal Chrome setup"),
-            ("basic_chrome", "Basic Chrome (last resort)")
-        ]
-        
-        for approach_name, approach_desc in approaches:
-            if driver_initialized:
-                break
-                
+    CHROME_APPROACHES = [
+        ("undetected_chrome", "Undetected ChromeDriver"),
+        ("regular_chrome", "Regular Chrome with stealth"),
+        ("minimal_chrome", "Minimal Chrome setup"),
+        ("basic_chrome", "Basic Chrome (last resort)")
+    ]
+
+    def create_driver(self, approach_name, user_data_dir):
+        """Launch a single Chrome strategy, returns None if it is not applicable"""
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+
+        if approach_name == "undetected_chrome" and self.undetected_enabled():
+            # Undetected Chrome approach
+            def uc_options():
+                # uc refuses to reuse an options object, so every attempt builds its own
+                options = uc.ChromeOptions()
+
+                # Essential options only
+                options.add_argument("--no-sandbox")
+                options.add_argument("--disable-dev-shm-usage")
+                options.add_argument("--disable-gpu")
+                options.add_argument("--headless")
+                options.add_argument("--window-size=1366,768")
+                options.add_argument(f"--user-data-dir={user_data_dir}_uc")
+                options.add_argument(f"--remote-debugging-port={self.debug_port_base}")
+
+                # Basic stealth
+                options.add_argument("--disable-blink-features=AutomationControlled")
+                options.add_argument("--disable-web-security")
+                options.add_argument("--disable-extensions")
+                return self.blocker.configure_options(options)
+
+            # Launch straight from the manifest when this Chrome build was resolved before
+            if self.driver_manifest.get("uc_driver"):
+                try:
+                    driver = uc.Chrome(
+                        options=uc_options(),
+                        version_main=self.driver_manifest["version_main"],
+                        driver_executable_path=self.driver_manifest["uc_driver"],
+                        browser_executable_path=self.driver_manifest.get("chrome_binary")
+                    )
+                    logging.info("✅ Undetected Chrome from cached driver")
+                    return driver
+                except Exception as e0:
+                    logging.warning(f"Undetected Chrome from cached driver failed: {e0}")
+
+            # Try without version specification first
+            try:
+                driver = uc.Chrome(options=uc_options(), version_main=None)
+                logging.info("✅ Undetected Chrome without version check")
+                return driver
+            except Exception as e1:
+                logging.warning(f"Undetected Chrome without version failed: {e1}")
+                # Try with version auto-detection
+                try:
+                    driver = uc.Chrome(options=uc_options())
+                    logging.info("✅ Undetected Chrome with auto-detection")
+                    return driver
+                except Exception as e2:
+                    logging.warning(f"Undetected Chrome with auto-detection failed: {e2}")
+                    raise e2
+
+        elif approach_name == "regular_chrome":
+            # Regular Chrome with maximum compatibility
+            options = Options()
+
+            # Essential CI options
+            options.add_argument("--no-sandbox")
+            options.add_argument("--disable-dev-shm-usage")
+            options.add_argument("--disable-gpu")
+            options.add_argument("--headless")
+            options.add_argument("--window-size=1366,768")
+            options.add_argument(f"--user-data-dir={user_data_dir}_reg")
+            options.add_argument(f"--remote-debugging-port={self.debug_port_base + 1}")
+
+            # Compatibility options
+            options.add_argument("--disable-blink-features=AutomationControlled")
+            options.add_argument("--disable-web-security")
+            options.add_argument("--disable-features=VizDisplayCompositor")
+            options.add_argument("--disable-extensions")
+            options.add_argument("--disable-plugins")
+            options.add_argument("--disable-default-apps")
+            options.add_argument("--disable-background-timer-throttling")
+            options.add_argument("--disable-backgrounding-occluded-windows")
+            options.add_argument("--disable-renderer-backgrounding")
+            options.add_argument("--disable-ipc-flooding-protection")
+
+            # User agent
+            options.add_argument(
+                "--user-agent=Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+                "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+            )
+
+            # Try adding experimental options safely
+            try:
+                options.add_experimental_option("excludeSwitches", ["enable-automation"])
+                options.add_experimental_option('useAutomationExtension', False)
+            except Exception:
+                logging.warning("Could not add experimental options, continuing without them")
+
+            self.blocker.configure_options(options)
+            driver = webdriver.Chrome(options=options, service=self.chrome_service(options))
+            logging.info("✅ Regular Chrome initialized")
+            return driver
+
+        elif approach_name == "minimal_chrome":
+            # Minimal Chrome setup
+            options = Options()
+            options.add_argument("--no-sandbox")
+            options.add_argument("--disable-dev-shm-usage")
+            options.add_argument("--headless")
+            options.add_argument("--disable-gpu")
+            options.add_argument(f"--user-data-dir={user_data_dir}_min")
+            options.add_argument(f"--remote-debugging-port={self.debug_port_base + 2}")
+            options.add_argument("--single-process")  # Sometimes helps with compatibility
+
+            self.blocker.configure_options(options)
+            driver = webdriver.Chrome(options=options, service=self.chrome_service(options))
+            logging.info("✅ Minimal Chrome initialized")
+            return driver
+
+        elif approach_name == "basic_chrome":
+            # Last resort - basic Chrome
+            options = Options()
+            options.add_argument("--headless")
+            options.add_argument("--no-sandbox")
+            options.add_argument(f"--user-data-dir={user_data_dir}_basic")
+
+            self.blocker.configure_options(options)
+            driver = webdriver.Chrome(options=options, service=self.chrome_service(options))
+            logging.info("✅ Basic Chrome initialized")
+            return driver
+
+        return None
+
+    def undetected_enabled(self):
+        if self.use_undetected is None:
+            self.use_undetected = load_undetected()
+        return self.use_undetected
+
+    def chrome_service(self, options):
+        """Pin Chrome and chromedriver paths so Selenium Manager never goes online"""
+        from selenium.webdriver.chrome.service import Service
+
+        chrome_binary = self.driver_manifest.get("chrome_binary")
+        if chrome_binary:
+            options.binary_location = chrome_binary
+        driver_path = self.driver_manifest.get("chrome_driver") or os.getenv("CHROMEDRIVER_PATH")
+        if driver_path and os.path.exists(driver_path):
+            return Service(executable_path=driver_path)
+        return Service()
+
+    def record_driver_resolution(self):
+        """Remember the driver binary that worked for this Chrome build"""
+        if not self.use_driver_cache:
+            return
+        try:
+            patcher = getattr(self.driver, "patcher", None)
+            if patcher is not None:
+                self.driver_cache.store_binary("uc_driver", patcher.executable_path)
+            else:
+                self.driver_cache.record(chrome_driver=self.driver.service.path)
+        except Exception as e:
+            logging.warning(f"Could not record driver resolution: {e}")
+
+    def launch_healthy_driver(self, approach_name, user_data_dir):
+        """Launch a strategy and make sure the session answers commands"""
+        driver = self.create_driver(approach_name, user_data_dir)
+        if driver is None:
+            return None
+        try:
+            driver.execute_script("return document.readyState")
+        except Exception:
+            try:
+                driver.quit()
+            except Exception:
+                pass
+            raise
+        return driver
+
+    def start_driver_sequential(self, user_data_dir):
+        """Try each strategy in turn, returns (driver, description)"""
+        for approach_name, approach_desc in self.chrome_approaches:
             try:
                 logging.info(f"Attempting {approach_desc}...")
-                
-                if approach_name == "undetected_chrome" and self.use_undetected:
-                    # Undetected Chrome approach
-                    options = uc.ChromeOptions()
-                    
-                    # Essential options only
-                    options.add_argument("--no-sandbox")
-                    options.add_argument("--disable-dev-shm-usage")
-                    options.add_argument("--disable-gpu")
-                    options.add_argument("--headless")
-                    options.add_argument("--window-size=1366,768")
-                    options.add_argument(f"--user-data-dir={user_data_dir}_uc")
-                    options.add_argument("--remote-debugging-port=9223")
-                    
-                    # Basic stealth
-                    options.add_argument("--disable-blink-features=AutomationControlled")
-                    options.add_argument("--disable-web-security")
-                    options.add_argument("--disable-extensions")
-                    
-                    # Try without version specification first
-                    try:
-                        self.driver = uc.Chrome(options=options, version_main=None)
-                        logging.info("✅ Undetected Chrome without version check")
-                        driver_initialized = True
-                    except Exception as e1:
-                        logging.warning(f"Undetected Chrome without version failed: {e1}")
-                        # Try with version auto-detection
-                        try:
-                            self.driver = uc.Chrome(options=options)
-                            logging.info("✅ Undetected Chrome with auto-detection")
-                            driver_initialized = True
-                        except Exception as e2:
-                            logging.warning(f"Undetected Chrome with auto-detection failed: {e2}")
-                            raise e2
-                    
-                elif approach_name == "regular_chrome":
-                    # Regular Chrome with maximum compatibility
-                    options = Options()
-                    
-                    # Essential CI options
-                    options.add_argument("--no-sandbox")
-                    options.add_argument("--disable-dev-shm-usage")
-                    options.add_argument("--disable-gpu")
-                    options.add_argument("--headless")
-                    options.add_argument("--window-size=1366,768")
-                    options.add_argument(f"--user-data-dir={user_data_dir}_reg")
-                    options.add_argument("--remote-debugging-port=9224")
-                    
-                    # Compatibility options
-                    options.add_argument("--disable-blink-features=AutomationControlled")
-                    options.add_argument("--disable-web-security")
-                    options.add_argument("--disable-features=VizDisplayCompositor")
-                    options.add_argument("--disable-extensions")
-                    options.add_argument("--disable-plugins")
-                    options.add_argument("--disable-default-apps")
-                    options.add_argument("--disable-background-timer-throttling")
-                    options.add_argument("--disable-backgrounding-occluded-windows")
-                    options.add_argument("--disable-renderer-backgrounding")
-                    options.add_argument("--disable-ipc-flooding-protection")
-                    
-                    # User agent
-                    options.add_argument(
-                        "--user-agent=Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
-                        "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-                    )
-                    
-                    # Try adding experimental options safely
-                    try:
-                        options.add_experimental_option("excludeSwitches", ["enable-automation"])
-                        options.add_experimental_option('useAutomationExtension', False)
-                    except Exception:
-                        logging.warning("Could not add experimental options, continuing without them")
-                    
-                    self.driver = webdriver.Chrome(options=options)
-                    logging.info("✅ Regular Chrome initialized")
-                    driver_initialized = True
-                    
-                elif approach_name == "minimal_chrome":
-                    # Minimal Chrome setup
-                    options = Options()
-                    options.add_argument("--no-sandbox")
-                    options.add_argument("--disable-dev-shm-usage")
-                    options.add_argument("--headless")
-                    options.add_argument("--disable-gpu")
-                    options.add_argument(f"--user-data-dir={user_data_dir}_min")
-                    options.add_argument("--remote-debugging-port=9225")
-                    options.add_argument("--single-process")  # Sometimes helps with compatibility
-                    
-                    self.driver = webdriver.Chrome(options=options)
-                    logging.info("✅ Minimal Chrome initialized")
-                    driver_initialized = True
-                    
-                elif approach_name == "basic_chrome":
-                    # Last resort - basic Chrome
-                    options = Options()
-                    options.add_argument("--headless")
-                    options.add_argument("--no-sandbox")
-                    options.add_argument(f"--user-data-dir={user_data_dir}_basic")
-                    
-                    self.driver = webdriver.Chrome(options=options)
-                    logging.info("✅ Basic Chrome initialized")
-                    driver_initialized = True
-                
-                # If we got here, initialization succeeded
-                if driver_initialized:
-                    # Execute stealth scripts if possible
-                    try:
-                        stealth_js = """
-                        Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
-                        Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]});
-                        Object.defineProperty(navigator, 'languages', {get: () => ['en-US', 'en']});
-                        """
-                        self.driver.execute_script(stealth_js)
-                        logging.info("✅ Stealth scripts executed")
-                    except Exception as js_error:
-                        logging.warning(f"Stealth JS execution failed: {js_error}")
-                    
-                    break
-                    
+                driver = self.launch_healthy_driver(approach_name, user_data_dir)
+                if driver:
+                    return driver, approach_desc
             except Exception as e:
                 logging.error(f"{approach_desc} failed: {str(e)}")
-                # Clean up failed attempt
-                try:
-                    if hasattr(self, 'driver') and self.driver:
-                        self.driver.quit()
-                        self.driver = None
-                except:
-                    pass
                 continue
+        return None, None
+
+    def start_driver_parallel(self, user_data_dir):
+        """Launch all strategies at once, the best-ranked healthy session wins"""
+        candidates = [
+            (name, desc) for name, desc in self.chrome_approaches
+            if name != "undetected_chrome" or self.undetected_enabled()
+        ]
+        logging.info(f"🏁 Racing {len(candidates)} Chrome strategies in parallel...")
+
+        executor = ThreadPoolExecutor(max_workers=len(candidates), thread_name_prefix="chrome_start")
+        futures = {
+            executor.submit(self.launch_healthy_driver, name, user_data_dir): desc
+            for name, desc in candidates
+        }
+
+        winner = None
+        winner_future = None
+        try:
+            # Dicts keep submit order, which is strategy priority: a lower-ranked (less stealthy)
+            # driver is only taken once every higher-ranked one has failed, it just starts early
+            for future in futures:
+                approach_desc = futures[future]
+                try:
+                    driver = future.result()
+                except Exception as e:
+                    logging.error(f"{approach_desc} failed: {str(e)}")
+                    continue
+                if driver:
+                    winner, winner_future = (driver, approach_desc), future
+                    break
+        finally:
+            # Losers may still be starting, quit them whenever they finish
+            for future, approach_desc in futures.items():
+                if future is not winner_future:
+                    future.add_done_callback(
+                        lambda f, desc=approach_desc: self.discard_losing_driver(f, desc)
+                    )
+            executor.shutdown(wait=False)
+
+        return winner if winner else (None, None)
+
+    def discard_losing_driver(self, future, approach_desc):
+        """Tear down a driver that lost the startup race"""
+        if future.cancelled() or future.exception() is not None:
+            return
+        driver = future.result()
+        if not driver:
+            return
+        try:
+            driver.quit()
+            logging.info(f"🧹 Closed losing strategy: {approach_desc}")
+        except Exception as e:
+            logging.warning(f"Could not close {approach_desc}: {e}")
+
+    def prepare_profile_dir(self):
+        """Warm cached profile when a slot is free, else a throwaway temp dir"""
+        if self.use_profile_cache:
+            self.profile_cache.cleanup_abandoned()
+            self.profile_cache.enforce_size_cap()
+            self.profile_slot = self.profile_cache.acquire(self.profile_name)
+            if self.profile_slot:
+                return os.path.join(self.profile_slot, "chrome")
+
+        # Unique user data dir, marked with our pid so cleanup in other runs leaves it alone
+        self.temp_profile_dir = create_temp_profile()
+        return self.temp_profile_dir
+
+    def release_profile_dir(self):
+        """Unlock the cached profile, or delete the temp dirs of every strategy"""
+        if self.profile_slot:
+            self.profile_cache.release(self.profile_slot)
+            self.profile_slot = None
+        if self.temp_profile_dir:
+            for suffix in ("", "_uc", "_reg", "_min", "_basic"):
+                shutil.rmtree(f"{self.temp_profile_dir}{suffix}", ignore_errors=True)
+            self.temp_profile_dir = None
+
+    @timed_phase("setup")
+    def setup_stealth_driver(self):
+        """Setup maximum stealth browser with better version compatibility"""
+        user_data_dir = self.prepare_profile_dir()
+        self.driver_manifest = self.driver_cache.resolve() if self.use_driver_cache else {}
+
+        if self.startup_mode == "parallel":
+            self.driver, approach_desc = self.start_driver_parallel(user_data_dir)
+        else:
+            self.driver, approach_desc = self.start_driver_sequential(user_data_dir)
 
-        if not driver_initialized:
+        if not self.driver:
+            # A retried setup acquires its own profile, this one must not stay locked
+            self.release_profile_dir()
             raise Exception("All Chrome initialization methods failed")
-            
+        self.record_driver_resolution()
+        self.timer.instrument(self.driver)
+        self.drain_on_navigation(self.driver)
+        self.waits.driver = self.driver
+        self.probe.driver = self.driver
+        self.page.driver = self.driver
+        self.blocker.apply(self.driver)
+
+        # Execute stealth scripts if possible
+        try:
+            self.driver.execute_script(STEALTH_JS)
+            logging.info("✅ Stealth scripts executed")
+        except Exception as js_error:
+            logging.warning(f"Stealth JS execution failed: {js_error}")
+
         # Set timeouts with error handling
         try:
             self.driver.set_page_load_timeout(60)
@@ -209,10 +431,78 @@ class StealthNaukriUploader:
         
         logging.info(f"🚗 Chrome driver setup completed successfully using {approach_desc}")
 
+    def start_browser(self):
+        """Setup phase of the state machine, replaces a dead driver if there is one"""
+        if self.driver:
+            self.discard_driver()
+        else:
+            # Setup may have died before a driver existed, after the profile was taken
+            self.release_profile_dir()
+        self.setup_stealth_driver()
+        return True
+
+    def drain_performance_log(self):
+        """Empty chromedriver's performance buffer into the blocker and waterfall"""
+        if self.driver and not self.monitor.tripped:
+            self.blocker.collect(self.driver)
+
+    def drain_on_navigation(self, driver):
+        """Collect the performance log after every get/refresh, so a restart or crash loses at most one page"""
+        original_get, original_refresh = driver.get, driver.refresh
+
+        def get(url):
+            try:
+                return original_get(url)
+            finally:
+                self.drain_performance_log()
+
+        def refresh():
+            try:
+                return original_refresh()
+            finally:
+                self.drain_performance_log()
+
+        driver.get = get
+        driver.refresh = refresh
+        return driver
+
+    def discard_driver(self):
+        """Drop a dead session and its profile lock before starting a new one"""
+        try:
+            self.drain_performance_log()
+        except Exception:
+            pass
+        try:
+            self.driver.quit()
+        except Exception:
+            pass
+        self.driver = None
+        self.release_profile_dir()
+
+    def driver_alive(self):
+        try:
+            return self.driver is not None and self.driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    def monitored_pids(self):
+        driver = self.driver
+        return driver_root_pids(driver) if driver else []
+
+    def abort_for_memory(self, reason):
+        """Memory ceiling hit (monitor thread): kill the Chrome tree so the run fails fast and frees the runner"""
+        self.exit_code = EXIT_MEMORY_CEILING
+        for pid in tree_usage(self.monitored_pids()).pids:
+            try:
+                os.kill(pid, signal.SIGKILL)
+            except OSError:
+                pass
+
     def human_like_delay(self, min_delay=1, max_delay=3):
         """Add human-like delays"""
         delay = random.uniform(min_delay, max_delay)
         time.sleep(delay)
+        self.timer.add_sleep(delay)
 
     def human_like_typing(self, element, text):
         """Type like a human with random delays"""
@@ -234,6 +524,51 @@ class StealthNaukriUploader:
                 logging.error(f"Cookie decode failed: {e}")
         return False
 
+    def load_cookies_bulk(self):
+        """Seed the whole cookie jar through DevTools before the first navigation"""
+        try:
+            cookies = read_cookie_file(self.cookies_file)
+            applied, rejected = bulk_set_cookies(self.driver, cookies)
+            logging.info(f"🍪 Loaded {len(applied)} cookies in bulk ({len(rejected)} rejected)")
+            return len(applied) > 0
+        except Exception as e:
+            logging.warning(f"Bulk cookie load unavailable, falling back to per-cookie: {e}")
+            return False
+
+    @timed_phase("preflight")
+    def preflight_session(self):
+        """Probe the saved session over HTTP before paying for Chrome"""
+        result = check_session(self.cookies_file, self.cookies_b64)
+        log_result(result)
+        return result.status != DEAD
+
+    @timed_phase("prepare_resume")
+    def prepare_resume(self):
+        """Validate, size-check and optimize the resume (cached by content hash)"""
+        try:
+            prepared = self.preparer.prepare(self.resume_path)
+        except ResumeError as e:
+            logging.error(f"❌ Resume rejected: {e}")
+            self.exit_code = EXIT_RESUME_REJECTED
+            return False
+        self.upload_path = prepared.path
+        self.resume_hash = prepared.sha256
+        return True
+
+    def upload_file(self):
+        """Absolute path of the file we actually send"""
+        return os.path.abspath(self.upload_path or self.resume_path)
+
+    @timed_phase("http_fast_path")
+    def upload_over_http(self):
+        """Upload and confirm over plain HTTP on the saved cookie jar"""
+        http = HttpUploader(self.upload_file(), self.cookies_file, self.cookies_b64, timer=self.timer)
+        if http.run():
+            self.upload_indicator = http.upload_indicator
+            return True
+        return False
+
+    @timed_phase("cookies")
     def load_cookies_stealthily(self):
         """Load cookies with stealth approach"""
         try:
@@ -241,14 +576,17 @@ class StealthNaukriUploader:
                 if not self.decode_cookies_from_secret():
                     raise FileNotFoundError("No cookies available")
 
+            # Bulk seeding needs no page, so the homepage load and refresh are skipped
+            if self.cookie_load_mode == "bulk" and self.load_cookies_bulk():
+                return True
+
             # Start with main domain and browse like human
             logging.info("🌐 Navigating to Naukri homepage...")
-            self.driver.get("https://www.naukri.com")
-            self.human_like_delay(3, 5)
+            self.driver.get(NAUKRI_HOME)
+            self.waits.wait("homepage loaded", document_ready())
 
             # Load cookies
-            with open(self.cookies_file, "r", encoding="utf-8") as f:
-                cookies = json.load(f)
+            cookies = read_cookie_file(self.cookies_file)
 
             # Add cookies one by one with delays
             valid_cookies = []
@@ -268,111 +606,114 @@ class StealthNaukriUploader:
             # Refresh and wait like human
             logging.info("🔄 Refreshing page...")
             self.driver.refresh()
-            self.human_like_delay(3, 5)
+            self.waits.wait("cookies applied", document_ready())
 
             return True
         except Exception as e:
             logging.error(f"Cookie loading failed: {e}")
             return False
 
+    @timed_phase("navigate")
     def navigate_like_human(self):
         """Navigate to profile page like a human user"""
+        from selenium.webdriver.common.action_chains import ActionChains
+
         try:
             # First, go to homepage and browse a bit
             logging.info("🏠 Starting from homepage...")
-            self.driver.get("https://www.naukri.com")
-            self.human_like_delay(2, 4)
+            self.driver.get(NAUKRI_HOME)
+            self.waits.wait("homepage ready", document_ready(), network_idle())
 
             # Scroll a bit like human
             self.driver.execute_script("window.scrollTo(0, 300);")
-            self.human_like_delay(1, 2)
+            self.waits.pace("homepage scroll")
 
-            # Try to click on profile/dashboard links naturally
-            profile_links = [
-                "//a[contains(@href, 'mnjuser')]",
-                "//a[contains(text(), 'Profile')]",
-                "//a[contains(text(), 'My Profile')]",
-                "//a[contains(@href, 'profile')]"
-            ]
+            # Try to click on profile/dashboard links naturally, historically best link first
+            profile_links = self.probe.scan(PROFILE_LINKS)
+            scanned_url = self.driver.current_url
 
-            for link_xpath in profile_links:
+            for name in self.hints.order(PROFILE_LINK, PROFILE_LINKS):
+                result = profile_links[name]
+                if not result.usable:
+                    continue
                 try:
-                    links = self.driver.find_elements(By.XPATH, link_xpath)
-                    for link in links:
-                        if link.is_displayed():
-                            logging.info(f"🔗 Clicking profile link: {link.text}")
-                            ActionChains(self.driver).move_to_element(link).click().perform()
-                            self.human_like_delay(3, 5)
-                            
-                            # Check if we're on a user page
-                            if "mnjuser" in self.driver.current_url:
-                                logging.info(f"✅ Successfully navigated to: {self.driver.current_url}")
-                                return True
+                    # Probe only hands back visible, enabled links
+                    for link, link_text in zip(result.usable, result.texts):
+                        logging.info(f"🔗 Clicking profile link: {link_text}")
+                        ActionChains(self.driver).move_to_element(link).click().perform()
+                        self.waits.wait("profile link", url_matches("mnjuser"), document_ready(), ceiling=8)
+
+                        # Check if we're on a user page
+                        if "mnjuser" in self.driver.current_url:
+                            logging.info(f"✅ Successfully navigated to: {self.driver.current_url}")
+                            self.hints.record(PROFILE_LINK, name, True)
+                            return True
+
+                        # A click that went elsewhere leaves every probed element stale
+                        if self.driver.current_url != scanned_url:
+                            break
                 except Exception as e:
-                    continue
+                    pass
+                self.hints.record(PROFILE_LINK, name, False)
+
+                # Re-probe on the page we landed on, so later candidates are not scored on stale elements
+                if self.driver.current_url != scanned_url:
+                    profile_links = self.probe.scan(PROFILE_LINKS)
+                    scanned_url = self.driver.current_url
 
             # If clicking links didn't work, try direct navigation
             logging.info("🔗 Trying direct navigation to profile...")
-            self.driver.get("https://www.naukri.com/mnjuser/profile")
-            self.human_like_delay(3, 5)
+            self.driver.get(f"{NAUKRI_HOME}/mnjuser/profile")
+            self.waits.wait("profile page", document_ready())
 
             # Check for access denied
-            if "Access Denied" not in self.driver.title and "access denied" not in self.driver.page_source.lower():
+            if not self.page.title_contains("access denied") and not self.page.contains("access denied"):
                 logging.info("✅ Direct navigation successful")
+                self.hints.record(PROFILE_LINK, "direct navigation", True)
                 return True
 
+            self.hints.record(PROFILE_LINK, "direct navigation", False)
             return False
 
         except Exception as e:
             logging.error(f"Navigation failed: {e}")
             return False
 
+    @timed_phase("verify_login")
     def verify_login_status(self):
         """Verify login with multiple checks"""
         try:
-            current_url = self.driver.current_url
-            page_title = self.driver.title
+            snapshot = self.page.head()
+            current_url = snapshot.url
+            page_title = snapshot.title
             
             logging.info(f"📍 Current URL: {current_url}")
             logging.info(f"📄 Page title: {page_title}")
 
             # Check for access denied first
-            if "access denied" in page_title.lower() or "access denied" in self.driver.page_source.lower():
+            if "access denied" in page_title.lower() or self.page.contains("access denied"):
                 logging.error("❌ ACCESS DENIED detected")
                 
                 # Try alternative approach - go back to homepage and try again
                 logging.info("🔄 Trying alternative navigation...")
-                self.driver.get("https://www.naukri.com")
-                self.human_like_delay(3, 5)
+                self.driver.get(NAUKRI_HOME)
+                self.waits.wait("homepage retry", document_ready())
                 
                 # Try jobs page first (less restricted)
-                self.driver.get("https://www.naukri.com/mnjuser/homepage")
-                self.human_like_delay(3, 5)
+                self.driver.get(f"{NAUKRI_HOME}/mnjuser/homepage")
+                self.waits.wait("user homepage", document_ready())
                 
-                if "access denied" not in self.driver.title.lower():
+                if not self.page.title_contains("access denied"):
                     logging.info("✅ Alternative navigation worked")
                     return True
                 else:
                     return False
 
             # Look for login indicators
-            login_indicators = [
-                "//div[contains(@class, 'nI-gNb-drawer')]",
-                "//div[contains(@class, 'user-name')]",
-                "//span[contains(@class, 'fullname')]",
-                "//*[contains(text(), 'My Profile')]",
-                "//*[contains(text(), 'Dashboard')]",
-                "//a[contains(@href, 'logout')]"
-            ]
-
-            for indicator in login_indicators:
-                try:
-                    elements = self.driver.find_elements(By.XPATH, indicator)
-                    if elements and elements[0].is_displayed():
-                        logging.info(f"✅ Login verified via: {indicator}")
-                        return True
-                except Exception:
-                    continue
+            indicator = self.probe.first_visible(LOGIN_INDICATORS)
+            if indicator:
+                logging.info(f"✅ Login verified via: {LOGIN_INDICATORS[indicator]}")
+                return True
 
             # Check URL pattern
             if "mnjuser" in current_url and "login" not in current_url:
@@ -386,8 +727,12 @@ class StealthNaukriUploader:
             logging.error(f"Login verification failed: {e}")
             return False
 
+    @timed_phase("upload")
     def find_and_upload_resume(self):
-        """Find upload elements and upload resume"""
+        """Find upload elements and submit the resume, confirmation is a separate phase"""
+        if self.submitted_methods >= set(UPLOAD_ELEMENTS):
+            logging.error("❌ Every upload method already submitted without confirmation, not posting again")
+            return False
         try:
             # Make sure we're on a profile-related page
             if not self.navigate_to_upload_page():
@@ -398,69 +743,89 @@ class StealthNaukriUploader:
             
             # Scroll around the page like human
             self.driver.execute_script("window.scrollTo(0, 200);")
-            self.human_like_delay(1, 2)
+            self.waits.pace("upload page scroll")
             self.driver.execute_script("window.scrollTo(0, 500);")
-            self.human_like_delay(1, 2)
-
-            # Find file inputs
-            file_inputs = self.driver.find_elements(By.XPATH, "//input[@type='file']")
-            logging.info(f"📄 Found {len(file_inputs)} file input(s)")
-
-            if file_inputs:
-                return self.upload_to_file_input(file_inputs[0])
-
-            # Look for upload buttons that trigger file dialogs
-            upload_buttons = self.driver.find_elements(By.XPATH, 
-                "//button[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'upload') or "
-                "contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'resume')]"
-            )
-            
-            logging.info(f"🔘 Found {len(upload_buttons)} upload button(s)")
+            self.waits.pace("upload page scroll")
+
+            # Find file inputs and upload buttons in one probe
+            elements = self.probe.scan(UPLOAD_ELEMENTS)
+            file_inputs = elements["file input"]
+            upload_buttons = elements["upload button"]
+            logging.info(f"📄 Found {file_inputs.count} file input(s)")
+            logging.info(f"🔘 Found {upload_buttons.count} upload button(s), {len(upload_buttons.usable)} usable")
+
+            # Try whichever upload path worked last time first, skipping any that already submitted
+            for method in self.hints.order(UPLOAD_METHOD, UPLOAD_ELEMENTS):
+                if method in self.submitted_methods:
+                    continue
+                if method == "file input" and file_inputs.count:
+                    uploaded = self.upload_to_file_input(file_inputs.first)
+                elif method == "upload button" and upload_buttons.usable:
+                    # Look for upload buttons that trigger file dialogs
+                    uploaded = any(
+                        self.try_button_upload(button, button_text)
+                        for button, button_text in zip(upload_buttons.usable, upload_buttons.texts)
+                    )
+                else:
+                    continue
 
-            for button in upload_buttons:
-                if self.try_button_upload(button):
+                if uploaded:
+                    # Scored once confirm_upload knows whether it landed
+                    self.upload_method = method
+                    self.submitted_methods.add(method)
                     return True
+                self.hints.record(UPLOAD_METHOD, method, False)
 
-            logging.warning("⚠️ No upload elements found")
+            if not file_inputs.count and not upload_buttons.usable:
+                logging.warning("⚠️ No upload elements found")
             return False
 
         except Exception as e:
             logging.error(f"Upload search failed: {e}")
             return False
 
+    @timed_phase("upload_page")
     def navigate_to_upload_page(self):
         """Navigate to best page for upload"""
-        upload_pages = [
-            "https://www.naukri.com/mnjuser/profile",
-            "https://www.naukri.com/mnjuser/homepage", 
-            "https://www.naukri.com/mnjuser/manageResume"
-        ]
+        upload_pages = self.hints.order(UPLOAD_PAGE, UPLOAD_PAGES)
 
         for page in upload_pages:
             try:
                 logging.info(f"🌐 Trying page: {page}")
                 self.driver.get(page)
-                self.human_like_delay(3, 5)
-
-                if "access denied" not in self.driver.title.lower():
+                self.waits.wait(
+                    f"upload elements on {page}",
+                    document_ready(),
+                    any_of(
+                        element_present(FILE_INPUT),
+                        element_present(UPLOAD_BUTTON)
+                    ),
+                    ceiling=10
+                )
+
+                if not self.page.title_contains("access denied"):
                     # Look for upload elements
-                    file_inputs = self.driver.find_elements(By.XPATH, "//input[@type='file']")
-                    upload_buttons = self.driver.find_elements(By.XPATH, 
-                        "//button[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'upload')]"
-                    )
-                    
+                    markers = self.probe.scan(UPLOAD_PAGE_MARKERS)
+                    file_inputs = markers["file input"].count
+                    upload_buttons = markers["upload button"].count
+
                     if file_inputs or upload_buttons:
                         logging.info(f"✅ Found upload page: {page}")
+                        self.hints.record(UPLOAD_PAGE, page, True)
                         return True
-                        
+
             except Exception as e:
                 logging.warning(f"Page {page} failed: {e}")
-                continue
+
+            self.hints.record(UPLOAD_PAGE, page, False)
 
         return False
 
+    @timed_phase("file_input_upload")
     def upload_to_file_input(self, file_input):
         """Upload file to input element"""
+        from selenium.webdriver.common.action_chains import ActionChains
+
         try:
             # Make element visible and interactable
             self.driver.execute_script(
@@ -473,59 +838,50 @@ class StealthNaukriUploader:
 
             # Scroll to element
             self.driver.execute_script("arguments[0].scrollIntoView(true);", file_input)
-            self.human_like_delay(1, 2)
+            self.waits.pace("file input scroll")
 
             logging.info("📁 Uploading resume file...")
-            file_input.send_keys(os.path.abspath(self.resume_path))
-            self.human_like_delay(2, 4)
+            file_input.send_keys(self.upload_file())
+            self.waits.wait("file attached", document_ready(), network_idle(), ceiling=8)
 
             # Look for submit button
-            submit_buttons = self.driver.find_elements(By.XPATH,
-                "//button[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'upload') or "
-                "contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'save') or "
-                "contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), 'submit')]"
-            )
+            submit_buttons = self.probe.scan({"submit button": SUBMIT_BUTTON})["submit button"]
 
-            if submit_buttons:
-                for button in submit_buttons:
-                    if button.is_displayed() and button.is_enabled():
-                        logging.info(f"🔘 Clicking submit: {button.text}")
-                        ActionChains(self.driver).move_to_element(button).click().perform()
-                        self.human_like_delay(3, 6)
-                        break
+            if submit_buttons.usable:
+                logging.info(f"🔘 Clicking submit: {submit_buttons.texts[0]}")
+                ActionChains(self.driver).move_to_element(submit_buttons.usable[0]).click().perform()
+                self.waits.wait("submit processed", document_ready(), network_idle(), ceiling=10)
 
-            return self.verify_upload_success()
+            return True
 
         except Exception as e:
             logging.error(f"File input upload failed: {e}")
             return False
 
-    def try_button_upload(self, button):
-        """Try clicking upload button to trigger file dialog"""
-        try:
-            if not button.is_displayed() or not button.is_enabled():
-                return False
+    @timed_phase("button_upload")
+    def try_button_upload(self, button, button_text=""):
+        """Try clicking upload button to trigger file dialog (button comes from a probe, already visible and enabled)"""
+        from selenium.webdriver.common.action_chains import ActionChains
 
-            button_text = button.text.strip()
+        try:
             logging.info(f"🔘 Trying button: {button_text}")
 
             # Scroll to button
             self.driver.execute_script("arguments[0].scrollIntoView(true);", button)
-            self.human_like_delay(1, 2)
+            self.waits.pace("upload button scroll")
 
             # Click button
             ActionChains(self.driver).move_to_element(button).click().perform()
-            self.human_like_delay(2, 3)
+            self.waits.wait("file input triggered", element_present(ENABLED_FILE_INPUT), ceiling=6)
 
             # Look for file input that appeared
-            file_inputs = self.driver.find_elements(By.XPATH, "//input[@type='file' and not(@disabled)]")
-            
-            for file_input in file_inputs:
-                if file_input.is_displayed() or file_input.is_enabled():
-                    logging.info("📁 Found triggered file input")
-                    file_input.send_keys(os.path.abspath(self.resume_path))
-                    self.human_like_delay(2, 4)
-                    return self.verify_upload_success()
+            file_inputs = self.probe.scan({"file input": ENABLED_FILE_INPUT})["file input"]
+
+            if file_inputs.count:
+                logging.info("📁 Found triggered file input")
+                file_inputs.first.send_keys(self.upload_file())
+                self.waits.wait("file attached", document_ready(), network_idle(), ceiling=8)
+                return True
 
             return False
 
@@ -533,33 +889,38 @@ class StealthNaukriUploader:
             logging.error(f"Button upload failed: {e}")
             return False
 
+    def confirm_upload(self):
+        """Confirm phase: verify in place, then score the method that submitted"""
+        confirmed = self.verify_upload_success()
+        if self.upload_method:
+            self.hints.record(UPLOAD_METHOD, self.upload_method, confirmed)
+            self.upload_method = None
+        return confirmed
+
+    @timed_phase("verify_upload")
     def verify_upload_success(self):
         """Verify that upload was successful"""
         try:
-            # Wait for upload indicators
-            success_indicators = [
-                (By.ID, "results_resumeParser"),
-                (By.XPATH, "//div[contains(text(), 'successfully')]"),
-                (By.XPATH, "//div[contains(text(), 'uploaded')]"),
-                (By.CSS_SELECTOR, ".success"),
-                (By.CSS_SELECTOR, ".alert-success")
-            ]
-
-            for by, selector in success_indicators:
-                try:
-                    WebDriverWait(self.driver, 10).until(
-                        EC.presence_of_element_located((by, selector))
-                    )
-                    logging.info(f"✅ Upload success detected: {selector}")
-                    return True
-                except TimeoutException:
-                    continue
+            # Watch every success and failure indicator at once
+            try:
+                result = self.probe.race(SUCCESS_INDICATORS, FAILURE_INDICATORS, timeout=self.upload_verify_timeout)
+            except Exception as race_error:
+                # A navigation during the wait kills the script, fall back to the page scan
+                logging.warning(f"Indicator race interrupted: {race_error}")
+                result = None
+
+            if result and result.outcome == "success":
+                self.upload_indicator = result.name
+                logging.info(f"✅ Upload success detected: {result.name} ({result.elapsed:.1f}s)")
+                return True
+
+            if result and result.outcome == "failure":
+                logging.error(f"❌ Upload failure detected: {result.name} ({result.elapsed:.1f}s)")
+                return False
 
-            # Check for any positive change in page
-            self.human_like_delay(3, 5)
-            
             # Look for resume file name on page
-            if "resume" in self.driver.page_source.lower() and ".pdf" in self.driver.page_source.lower():
+            if self.page.contains("resume") and self.page.contains(".pdf"):
+                self.upload_indicator = "resume on page"
                 logging.info("✅ Resume detected on page")
                 return True
 
@@ -570,87 +931,150 @@ class StealthNaukriUploader:
             logging.error(f"Upload verification failed: {e}")
             return False
 
-    def save_debug_info(self):
-        """Save debug information"""
-        try:
-            timestamp = int(time.time())
-            
-            # Screenshot
-            self.driver.save_screenshot(f"./logs/debug_{timestamp}.png")
-            
-            # Page source
-            with open(f"./logs/page_{timestamp}.html", "w", encoding="utf-8") as f:
-                f.write(self.driver.page_source)
-            
-            logging.info(f"🐛 Debug info saved with timestamp {timestamp}")
-            
-        except Exception as e:
-            logging.error(f"Debug save failed: {e}")
-
+    def save_debug_info(self, label="final"):
+        """Save debug information (written in the background)"""
+        self.capture.capture(self.driver, label)
+
+    def capture_phase(self, span):
+        """Optional capture at each top-level phase boundary"""
+        if span.depth != 1 or span.name == "cleanup" or not self.driver:
+            return
+        if self.capture.should_capture_phase(span.outcome != "ok"):
+            self.save_debug_info(span.name)
+
+    def save_cookies(self, print_b64=True):
+        """Save updated cookies back to the cookie file"""
+        cookies = self.driver.get_cookies()
+        with open(self.cookies_file, "w") as f:
+            json.dump(cookies, f, indent=2)
+
+        logging.info("🍪 Updated cookies saved")
+        if print_b64:
+            cookies_b64 = base64.b64encode(json.dumps(cookies).encode()).decode()
+            print(f"COOKIES_B64: {cookies_b64}")
+
+    @timed_phase("cleanup")
     def cleanup(self):
         """Cleanup resources"""
         try:
-            if self.driver:
-                self.save_debug_info()
-                
-                # Save updated cookies
-                cookies = self.driver.get_cookies()
-                with open(self.cookies_file, "w") as f:
-                    json.dump(cookies, f, indent=2)
-                
-                cookies_b64 = base64.b64encode(json.dumps(cookies).encode()).decode()
-                logging.info("🍪 Updated cookies saved")
-                print(f"COOKIES_B64: {cookies_b64}")
+            if self.driver and self.monitor.tripped:
+                # Already killed by the memory ceiling, nothing left to save
+                self.discard_driver()
+            elif self.driver:
+                if self.capture.should_capture(not self.run_succeeded):
+                    self.save_debug_info()
+                self.save_cookies()
                 
                 self.driver.quit()
                 logging.info("🧹 Cleanup completed")
                 
         except Exception as e:
             logging.error(f"Cleanup error: {e}")
+        finally:
+            self.capture.close()
+            self.release_profile_dir()
 
     def run(self):
-        """Main execution"""
+        """Main execution, timed as nested per-phase spans"""
+        with self.timer.span("run") as run_span:
+            success = self.run_flow()
+            if not success:
+                run_span.outcome = "failed"
+        self.hints.save()
+        if self.machine:
+            self.timer.extra_summary.extend(self.machine.summary_lines())
+        self.timer.extra_summary.extend(self.hints.summary_lines())
+        self.timer.extra_summary.extend(self.blocker.summary_lines())
+        self.timer.extra_summary.extend(self.waterfall.summary_lines())
+        self.waterfall.write(self.timer)
+        self.timer.extra_summary.extend(self.monitor.summary_lines())
+        self.timer.extra_summary.append(f"🏁 Upload mode {self.upload_mode}, succeeded via: {self.upload_engine or 'none'}")
+        self.timer.write()
+        self.timer.summary()
+        return success
+
+    def run_flow(self):
+        """Upload flow: driver, cookies, navigation, login check, upload"""
         try:
             logging.info("🚀 Starting STEALTH Naukri automation")
             
-            if not os.path.exists(self.resume_path):
-                raise FileNotFoundError(f"Resume not found: {self.resume_path}")
-            
-            logging.info(f"📄 Resume: {self.resume_path} ({os.path.getsize(self.resume_path)} bytes)")
-            
-            # Setup stealth browser
-            self.setup_stealth_driver()
-            
-            # Load cookies stealthily
-            if not self.load_cookies_stealthily():
-                raise Exception("Cookie loading failed")
-            
-            # Navigate like human
-            if not self.navigate_like_human():
-                raise Exception("Navigation failed")
-            
-            # Verify login
-            if not self.verify_login_status():
-                raise Exception("Login verification failed")
+            logging.info(f"📄 Resume: {self.resume_path}")
+
+            # Refuse a broken or oversized PDF before any session is spent on it
+            if not self.prepare_resume():
+                raise Exception("Resume preparation failed")
+
+            # Skip the browser entirely if this exact resume was confirmed recently
+            confirmed = self.ledger.recent_confirmation(self.resume_hash, self.account)
+            if confirmed and not self.force:
+                logging.info(
+                    f"📒 Resume {self.resume_hash[:12]} already confirmed at {confirmed['confirmed_at']} "
+                    f"via {confirmed['indicator']}, skipping (use --force to upload anyway)"
+                )
+                return True
             
-            # Upload resume
-            if self.find_and_upload_resume():
+            # Fail fast on a dead session, inconclusive probes go on to the browser
+            if self.preflight and not self.preflight_session():
+                self.exit_code = EXIT_SESSION_EXPIRED
+                raise Exception("Session expired, refresh NAUKRI_COOKIES_B64")
+
+            # Plain HTTP first when the mode allows it, the browser flow is the fallback
+            self.upload_mode = resolve_upload_mode(self.upload_mode)
+            if self.upload_mode in ("auto", "http"):
+                if self.upload_over_http():
+                    logging.info("🎉 SUCCESS: Resume upload completed over HTTP!")
+                    self.upload_engine = "http"
+                    self.run_succeeded = True
+                    self.ledger.record(self.resume_hash, self.account, self.upload_indicator, self.resume_path)
+                    return True
+                if self.upload_mode == "http":
+                    raise Exception("HTTP upload failed and UPLOAD_MODE=http allows no browser fallback")
+                logging.info("↩️ HTTP fast path failed, falling back to the browser")
+
+            # Browser flow as a state machine, a failed phase retries on the live driver
+            self.machine = PhaseMachine(
+                [
+                    Phase("setup", self.start_browser, "cookies", None, False),
+                    Phase("cookies", self.load_cookies_stealthily, "navigate", None, True),
+                    Phase("navigate", self.navigate_like_human, "verify", None, True),
+                    Phase("verify", self.verify_login_status, "upload", "navigate", True),
+                    Phase("upload", self.find_and_upload_resume, "confirm", None, True),
+                    # A failed confirm moves on to the next untried upload method, never resubmits the same one
+                    Phase("confirm", self.confirm_upload, DONE, "upload", True),
+                ],
+                retries=self.phase_retries,
+                backoff=self.retry_backoff,
+                max_driver_restarts=self.max_driver_restarts,
+                driver_alive=self.driver_alive,
+                sleep=self.waits.sleep,
+                abort_check=lambda: self.monitor.tripped
+            )
+            self.monitor.start()
+            if self.machine.run():
                 logging.info("🎉 SUCCESS: Resume upload completed!")
+                self.upload_engine = "browser"
+                self.run_succeeded = True
+                self.ledger.record(self.resume_hash, self.account, self.upload_indicator, self.resume_path)
                 return True
             else:
-                logging.error("❌ Resume upload failed")
+                logging.error(f"❌ Resume upload failed ({self.machine.error})")
                 return False
                 
         except Exception as e:
             logging.error(f"💥 Automation failed: {e}")
+            self.failure = str(e)
             return False
         finally:
+            logging.info(f"⏱️ Waited {self.waits.total_waited():.1f}s across {len(self.waits.history)} waits")
+            self.page.log_stats()
+            self.drain_performance_log()
             self.cleanup()
+            self.monitor.stop()
 
 def main():
-    uploader = StealthNaukriUploader()
-    success = uploader.run()
-    exit(0 if success else 1)
+    """Full upload run, the same as `cli.py upload`"""
+    from cli import main as cli_main
+    exit(cli_main(["upload"] + sys.argv[1:]))
 
 if __name__ == "__main__":
     main()
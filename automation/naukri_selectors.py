@@ -0,0 +1,86 @@
+# automation/naukri_selectors.py
+"""
+Naukri page locations, element selectors and page scripts shared by every uploader engine
+"""
+
+import os
+
+# Overridable so runs can target the local stand-in server
+NAUKRI_HOME = os.getenv("NAUKRI_BASE_URL", "https://www.naukri.com").rstrip("/")
+
+UPLOAD_PAGES = [
+    f"{NAUKRI_HOME}/mnjuser/profile",
+    f"{NAUKRI_HOME}/mnjuser/homepage",
+    f"{NAUKRI_HOME}/mnjuser/manageResume"
+]
+
+# HTTP fast path; production uploads go through Naukri's file service, so point these at it per deployment.
+# No default upload URL: unset keeps auto mode on the browser path
+HTTP_UPLOAD_URL = os.getenv("HTTP_UPLOAD_URL", "")
+HTTP_CONFIRM_URL = os.getenv("HTTP_CONFIRM_URL", f"{NAUKRI_HOME}/mnjuser/profile")
+
+# XPath has no lower-case(), so text matching goes through translate()
+LOWER_TEXT = "translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
+
+LOGIN_INDICATORS = {
+    "nav drawer": "//div[contains(@class, 'nI-gNb-drawer')]",
+    "user name": "//div[contains(@class, 'user-name')]",
+    "full name": "//span[contains(@class, 'fullname')]",
+    "my profile text": "//*[contains(text(), 'My Profile')]",
+    "dashboard text": "//*[contains(text(), 'Dashboard')]",
+    "logout link": "//a[contains(@href, 'logout')]"
+}
+
+PROFILE_LINKS = {
+    "mnjuser link": "//a[contains(@href, 'mnjuser')]",
+    "profile text link": "//a[contains(text(), 'Profile')]",
+    "my profile link": "//a[contains(text(), 'My Profile')]",
+    "profile href link": "//a[contains(@href, 'profile')]"
+}
+
+FILE_INPUT = "//input[@type='file']"
+ENABLED_FILE_INPUT = "//input[@type='file' and not(@disabled)]"
+UPLOAD_BUTTON = f"//button[contains({LOWER_TEXT}, 'upload')]"
+UPLOAD_OR_RESUME_BUTTON = (
+    f"//button[contains({LOWER_TEXT}, 'upload') or "
+    f"contains({LOWER_TEXT}, 'resume')]"
+)
+SUBMIT_BUTTON = (
+    f"//button[contains({LOWER_TEXT}, 'upload') or "
+    f"contains({LOWER_TEXT}, 'save') or "
+    f"contains({LOWER_TEXT}, 'submit')]"
+)
+
+UPLOAD_PAGE_MARKERS = {
+    "file input": FILE_INPUT,
+    "upload button": UPLOAD_BUTTON
+}
+
+UPLOAD_ELEMENTS = {
+    "file input": FILE_INPUT,
+    "upload button": UPLOAD_OR_RESUME_BUTTON
+}
+
+SUCCESS_INDICATORS = {
+    "resume parser result": ("css", "#results_resumeParser"),
+    "successfully message": "//div[contains(text(), 'successfully')]",
+    "uploaded message": "//div[contains(text(), 'uploaded')]",
+    "success class": ("css", ".success"),
+    "success alert": ("css", ".alert-success")
+}
+
+FAILURE_INDICATORS = {
+    "error alert": ("css", ".alert-danger, .alert-error"),
+    "upload error message": (
+        f"//*[contains(@class, 'error') and (contains({LOWER_TEXT}, 'upload') or "
+        f"contains({LOWER_TEXT}, 'failed') or contains({LOWER_TEXT}, 'invalid'))]"
+    ),
+    "file too large": f"//*[contains({LOWER_TEXT}, 'file size') and contains({LOWER_TEXT}, 'exceed')]"
+}
+
+# Hides the usual automation fingerprints
+STEALTH_JS = """
+Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
+Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]});
+Object.defineProperty(navigator, 'languages', {get: () => ['en-US', 'en']});
+"""
@@ -0,0 +1,268 @@
+# automation/naukri_standin.py
+"""
+Local Naukri stand-in - serves the mnjuser pages with the elements the
+uploader looks for, with configurable latency and failure injection
+"""
+
+import os
+import html
+import json
+import time
+import uuid
+import random
+import logging
+import argparse
+import threading
+from datetime import datetime
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+SESSION_COOKIE = "nauk_at"
+
+PAGE_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head><title>{title}</title></head>
+<body>
+<div class="nI-gNb-drawer"><div class="user-name">Stand-in User</div>
+<a href="/mnjuser/profile">My Profile</a> <a href="/logout">Logout</a></div>
+{body}
+</body>
+</html>
+"""
+
+HOME_BODY = """<h1>Naukri stand-in</h1>
+<p>Jobs for you</p>
+"""
+
+UPLOAD_BODY = """<h1>{heading}</h1>
+{current_resume}
+<form id="resumeForm" onsubmit="return false;">
+  <input type="file" id="attachCV" name="file" accept=".pdf,.doc,.docx">
+  <button type="button" id="saveResume">Save</button>
+</form>
+<div id="status"></div>
+<script>
+document.getElementById('saveResume').addEventListener('click', function () {{
+  var input = document.getElementById('attachCV');
+  if (!input.files.length) return;
+  var data = new FormData();
+  data.append('file', input.files[0]);
+  fetch('/upload', {{method: 'POST', body: data}}).then(function (response) {{
+    return response.json();
+  }}).then(function (result) {{
+    var status = document.getElementById('status');
+    if (result.ok) {{
+      status.innerHTML = '<div id="results_resumeParser" class="alert-success">' +
+        'Resume ' + result.name + ' uploaded successfully</div>';
+    }} else {{
+      status.innerHTML = '<div class="alert-danger">Upload failed, please try again</div>';
+    }}
+  }});
+}});
+</script>
+"""
+
+ACCESS_DENIED = """<!DOCTYPE html>
+<html><head><title>Access Denied</title></head>
+<body><h1>Access Denied</h1><p>You don't have permission to access this page.</p></body></html>
+"""
+
+LOGIN_PAGE = """<!DOCTYPE html>
+<html><head><title>Login | Naukri stand-in</title></head>
+<body><h1>Login</h1><form><input name="username"><input name="password" type="password"></form></body></html>
+"""
+
+UPLOAD_PAGES = {
+    "/mnjuser/profile": "Profile",
+    "/mnjuser/homepage": "Homepage",
+    "/mnjuser/manageResume": "Manage Resume",
+}
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    server_version = "NaukriStandIn/1.0"
+
+    def log_message(self, format, *args):
+        logging.debug("stand-in: " + format % args)
+
+    def do_GET(self):
+        config = self.server.config
+        path = self.path.split("?", 1)[0]
+        self.server.record("requests")
+        self.inject_latency(config["page_latency"])
+
+        if path == "/":
+            return self.send_html(PAGE_TEMPLATE.format(title="Naukri stand-in", body=HOME_BODY))
+        if path == "/logout":
+            return self.send_html(LOGIN_PAGE)
+        if path in UPLOAD_PAGES:
+            if random.random() < config["access_denied_rate"]:
+                self.server.record("access_denied")
+                return self.send_html(ACCESS_DENIED, status=403)
+            if not self.logged_in():
+                self.send_response(302)
+                self.send_header("Location", "/nlogin/login")
+                self.end_headers()
+                return
+            heading = UPLOAD_PAGES[path]
+            last_upload = self.server.last_upload
+            current_resume = (
+                f'<div class="resume-name" data-upload-id="{self.server.last_upload_id}">{html.escape(last_upload)}</div>'
+                f'<div class="resume-updated">Uploaded on {self.server.last_upload_at}</div>'
+            ) if last_upload else ""
+            return self.send_html(PAGE_TEMPLATE.format(
+                title=f"{heading} | Naukri stand-in",
+                body=UPLOAD_BODY.format(heading=heading, current_resume=current_resume)
+            ))
+        if path == "/nlogin/login":
+            return self.send_html(LOGIN_PAGE)
+        if path == "/stats":
+            return self.send_json(self.server.snapshot_stats())
+        self.send_html("<html><head><title>Not Found</title></head><body>Not Found</body></html>", status=404)
+
+    def do_POST(self):
+        config = self.server.config
+        path = self.path.split("?", 1)[0]
+        self.server.record("requests")
+        if path != "/upload":
+            return self.send_json({"ok": False, "error": "not found"}, status=404)
+
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length) if length else b""
+        self.inject_latency(config["upload_latency"])
+
+        if not self.logged_in() or random.random() < config["upload_failure_rate"]:
+            self.server.record("upload_failures")
+            return self.send_json({"ok": False})
+
+        self.server.record("uploads")
+        name = "resume.pdf"
+        marker = b'filename="'
+        if marker in body:
+            start = body.index(marker) + len(marker)
+            name = body[start:body.index(b'"', start)].decode("utf-8", "replace")
+        self.server.last_upload = name
+        self.server.last_upload_id = uuid.uuid4().hex[:12]
+        self.server.last_upload_at = datetime.now().strftime("%b %d, %Y %H:%M:%S.%f")
+        return self.send_json({"ok": True, "id": self.server.last_upload_id, "name": name, "bytes": len(body)})
+
+    def logged_in(self):
+        return f"{SESSION_COOKIE}=" in self.headers.get("Cookie", "")
+
+    def inject_latency(self, latency):
+        low, high = latency
+        if high > 0:
+            time.sleep(random.uniform(low, high))
+
+    def send_html(self, html, status=200):
+        payload = html.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def send_json(self, data, status=200):
+        payload = json.dumps(data).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+class StandInServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, host="127.0.0.1", port=0, page_latency=(0.0, 0.0), upload_latency=(0.0, 0.0),
+                 access_denied_rate=0.0, upload_failure_rate=0.0):
+        super().__init__((host, port), StandInHandler)
+        self.config = {
+            "page_latency": page_latency,
+            "upload_latency": upload_latency,
+            "access_denied_rate": access_denied_rate,
+            "upload_failure_rate": upload_failure_rate,
+        }
+        self.stats = {"requests": 0, "uploads": 0, "upload_failures": 0, "access_denied": 0}
+        self.last_upload = None
+        self.last_upload_id = None
+        self.last_upload_at = None
+        self._stats_lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def record(self, counter):
+        with self._stats_lock:
+            self.stats[counter] += 1
+
+    def snapshot_stats(self):
+        with self._stats_lock:
+            return dict(self.stats)
+
+    def start(self):
+        self._thread = threading.Thread(target=self.serve_forever, name="naukri_standin", daemon=True)
+        self._thread.start()
+        logging.info(f"🧪 Naukri stand-in listening on {self.base_url}")
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def write_cookie_file(self, cookies_file):
+        """Cookie jar that logs the uploader into the stand-in"""
+        host = self.server_address[0]
+        cookies = [
+            {"name": SESSION_COOKIE, "value": "standin-session", "domain": host, "path": "/",
+             "secure": False, "httpOnly": True, "expiry": int(time.time()) + 86400, "sameSite": "Lax"},
+            {"name": "test", "value": "1", "domain": host, "path": "/", "secure": False, "httpOnly": False}
+        ]
+        os.makedirs(os.path.dirname(cookies_file) or ".", exist_ok=True)
+        with open(cookies_file, "w", encoding="utf-8") as f:
+            json.dump(cookies, f, indent=2)
+        return cookies_file
+
+
+def parse_range(value):
+    """'0.2' or '0.1-0.5' seconds"""
+    if "-" in value:
+        low, high = value.split("-", 1)
+        return float(low), float(high)
+    return float(value), float(value)
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    parser = argparse.ArgumentParser(description="Local Naukri stand-in server")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--page-latency", default="0", help="seconds, or a range like 0.2-1.0")
+    parser.add_argument("--upload-latency", default="0", help="seconds, or a range like 0.5-2.0")
+    parser.add_argument("--access-denied-rate", type=float, default=0.0)
+    parser.add_argument("--upload-failure-rate", type=float, default=0.0)
+    parser.add_argument("--cookies-file", help="write a matching cookie jar here")
+    args = parser.parse_args()
+
+    server = StandInServer(
+        port=args.port,
+        page_latency=parse_range(args.page_latency),
+        upload_latency=parse_range(args.upload_latency),
+        access_denied_rate=args.access_denied_rate,
+        upload_failure_rate=args.upload_failure_rate
+    )
+    if args.cookies_file:
+        server.write_cookie_file(args.cookies_file)
+        logging.info(f"🍪 Stand-in cookies written to {args.cookies_file}")
+    logging.info(f"🧪 Naukri stand-in listening on {server.base_url} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+# automation/navigation_hints.py
+"""
+Navigation hints - remembers which upload page, profile link and upload path
+worked on earlier runs, so the historically best option is tried first
+"""
+
+import os
+import json
+import fcntl
+import time
+import logging
+
+UPLOAD_PAGE = "upload_page"
+PROFILE_LINK = "profile_link"
+UPLOAD_METHOD = "upload_method"
+
+
+def success_score(stats):
+    """Smoothed success rate, an option we never tried scores 0.5"""
+    return (stats.get("successes", 0) + 1) / (stats.get("attempts", 0) + 2)
+
+
+class NavigationHints:
+    def __init__(self, path=None):
+        self.path = path or os.getenv("NAVIGATION_HINTS_PATH", "./state/navigation_hints.json")
+        self.enabled = os.getenv("NAVIGATION_HINTS", "1") != "0"
+        self.hints = self.load()
+        self.outcomes = []
+
+    def load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def stats(self, category, option):
+        return self.hints.get(category, {}).get("options", {}).get(option, {})
+
+    def order(self, category, options):
+        """Options best-first by success rate, then last winner, then their default order"""
+        options = list(options)
+        if not self.enabled:
+            return options
+        last = self.hints.get(category, {}).get("last_success")
+        ranked = sorted(
+            options,
+            key=lambda o: (-success_score(self.stats(category, o)), o != last, options.index(o))
+        )
+        if ranked != options:
+            logging.info(f"🧭 Hinted {category} order: {', '.join(ranked)}")
+        return ranked
+
+    def record(self, category, option, success):
+        """Note one attempt, applied to the shared file by save()"""
+        self.outcomes.append((category, option, bool(success), time.time()))
+        self.apply(self.hints, category, option, success, time.time())
+
+    def apply(self, hints, category, option, success, timestamp):
+        entry = hints.setdefault(category, {"options": {}, "last_success": None})
+        stats = entry["options"].setdefault(option, {"attempts": 0, "successes": 0})
+        stats["attempts"] += 1
+        if success:
+            stats["successes"] += 1
+            stats["last_success"] = timestamp
+            entry["last_success"] = option
+
+    def save(self):
+        """Merge this run's outcomes into the file under a lock, so parallel runs never drop each other's"""
+        if not self.outcomes:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(f"{self.path}.lock", "a+") as lock:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+                hints = self.load()
+                for category, option, success, timestamp in self.outcomes:
+                    self.apply(hints, category, option, success, timestamp)
+
+                tmp_path = f"{self.path}.{os.getpid()}.tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump(hints, f, indent=2)
+                os.replace(tmp_path, self.path)
+            self.hints = hints
+            self.outcomes = []
+        except Exception as e:
+            logging.warning(f"Could not save navigation hints: {e}")
+
+    def summary_lines(self):
+        """Per-option success rates for the run summary"""
+        lines = []
+        for category in (PROFILE_LINK, UPLOAD_PAGE, UPLOAD_METHOD):
+            entry = self.hints.get(category)
+            if not entry:
+                continue
+            lines.append(f"🧭 {category} hints (last success: {entry.get('last_success') or '-'})")
+            options = sorted(entry["options"].items(), key=lambda item: -success_score(item[1]))
+            for option, stats in options:
+                rate = stats["successes"] / stats["attempts"] if stats["attempts"] else 0.0
+                lines.append(f"    {option:<52} {stats['successes']:>4}/{stats['attempts']:<4} succeeded ({rate:.0%})")
+        return lines
@@ -0,0 +1,187 @@
+# automation/network_waterfall.py
+"""
+Network waterfall - groups DevTools Network/Page events by main-frame
+navigation and reports where page-load time went: slowest and largest
+requests, DOMContentLoaded and load per page
+"""
+
+import os
+import json
+import logging
+
+# Span pairs from Network.Response.timing, milliseconds relative to requestTime
+TIMING_PHASES = {
+    "dns": ("dnsStart", "dnsEnd"),
+    "connect": ("connectStart", "connectEnd"),
+    "ssl": ("sslStart", "sslEnd"),
+    "send": ("sendStart", "sendEnd"),
+    "wait": ("sendEnd", "receiveHeadersEnd"),
+}
+
+
+def response_timings(timing):
+    """dns/connect/ssl/send/wait in ms, phases Chrome skipped (reused connection) are left out"""
+    phases = {}
+    for name, (start, end) in TIMING_PHASES.items():
+        if timing.get(start, -1) >= 0 and timing.get(end, -1) >= 0:
+            phases[name] = round(timing[end] - timing[start], 1)
+    return phases
+
+
+def shorten(url, limit=100):
+    return url if len(url) <= limit else url[:limit - 1] + "…"
+
+
+class PageLoad:
+    def __init__(self, url, started, wall_time):
+        self.url = url
+        self.started = started
+        self.wall_time = wall_time
+        self.dom_content_loaded = None
+        self.load = None
+        self.requests = {}
+
+    def request_list(self):
+        return [r for r in self.requests.values() if r.get("finished") is not None]
+
+    def to_dict(self, top):
+        requests = self.request_list()
+        for request in requests:
+            request["duration_ms"] = round((request["finished"] - request["started"]) * 1000, 1)
+            request["offset_ms"] = round((request["started"] - self.started) * 1000, 1)
+
+        def row(r):
+            return {key: r.get(key) for key in (
+                "url", "type", "status", "offset_ms", "duration_ms", "bytes", "timings", "error"
+            ) if r.get(key) is not None}
+
+        def since_start(timestamp):
+            return round((timestamp - self.started) * 1000, 1) if timestamp else None
+
+        return {
+            "url": self.url,
+            "wall_time": self.wall_time,
+            "dom_content_loaded_ms": since_start(self.dom_content_loaded),
+            "load_ms": since_start(self.load),
+            "requests": len(requests),
+            "failed": sum(1 for r in requests if r.get("error")),
+            "bytes": sum(r.get("bytes", 0) for r in requests),
+            "slowest": [row(r) for r in sorted(requests, key=lambda r: -r["duration_ms"])[:top]],
+            "largest": [row(r) for r in sorted(requests, key=lambda r: -r.get("bytes", 0))[:top] if r.get("bytes")],
+        }
+
+
+class NetworkWaterfall:
+    def __init__(self):
+        self.enabled = os.getenv("NETWORK_WATERFALL", "0") == "1"
+        self.top = int(os.getenv("NETWORK_WATERFALL_TOP", "10"))
+        self.reset()
+
+    def reset(self):
+        self.pages = []
+        self.main_frame = None
+
+    def current(self):
+        return self.pages[-1] if self.pages else None
+
+    def find_request(self, request_id):
+        # Later pages first, a request id only lives on the page that started it
+        for page in reversed(self.pages):
+            if request_id in page.requests:
+                return page.requests[request_id]
+        return None
+
+    def record_event(self, method, params):
+        """Feed one Network.* or Page.* DevTools event"""
+        if not self.enabled:
+            return
+        if method == "Network.requestWillBeSent":
+            self.request_started(params)
+        elif method == "Network.responseReceived":
+            request = self.find_request(params["requestId"])
+            if request:
+                response = params.get("response", {})
+                request["status"] = response.get("status")
+                request["type"] = params.get("type", request["type"])
+                request["timings"] = response_timings(response.get("timing") or {})
+        elif method == "Network.loadingFinished":
+            request = self.find_request(params["requestId"])
+            if request:
+                request["finished"] = params.get("timestamp", request["started"])
+                request["bytes"] = int(params.get("encodedDataLength", 0))
+        elif method == "Network.loadingFailed":
+            request = self.find_request(params["requestId"])
+            if request:
+                request["finished"] = params.get("timestamp", request["started"])
+                request["error"] = params.get("blockedReason") or params.get("errorText") or "failed"
+        elif method == "Page.domContentEventFired" and self.current():
+            self.current().dom_content_loaded = self.current().dom_content_loaded or params.get("timestamp")
+        elif method == "Page.loadEventFired" and self.current():
+            self.current().load = self.current().load or params.get("timestamp")
+
+    def request_started(self, params):
+        request_id = params["requestId"]
+        request = params.get("request", {})
+        timestamp = params.get("timestamp", 0)
+
+        # A redirect reuses the request id, close the previous hop as its own row
+        redirect = params.get("redirectResponse")
+        previous = self.find_request(request_id)
+        if redirect and previous:
+            for page in self.pages:
+                if page.requests.get(request_id) is previous:
+                    previous.update(finished=timestamp, status=redirect.get("status"))
+                    page.requests[f"{request_id}:{len(page.requests)}"] = page.requests.pop(request_id)
+
+        # The main frame's document request starts a new page, the first document seen is the main frame
+        if params.get("type") == "Document" and request_id == params.get("loaderId"):
+            self.main_frame = self.main_frame or params.get("frameId")
+            if params.get("frameId") == self.main_frame and not (redirect and previous):
+                self.pages.append(PageLoad(request.get("url", ""), timestamp, params.get("wallTime")))
+
+        page = self.current()
+        if page is None:
+            return
+        page.requests[request_id] = {
+            "url": request.get("url", ""),
+            "type": params.get("type", "Other"),
+            "started": timestamp,
+            "finished": None,
+        }
+
+    def report(self):
+        return [page.to_dict(self.top) for page in self.pages if page.requests]
+
+    def write(self, timer):
+        """Save the waterfall next to the phase timings, returns the file path"""
+        if not self.enabled or not self.pages:
+            return None
+        log_dir = os.path.dirname(timer.history_path) or "."
+        path = os.path.join(log_dir, f"network_waterfall_{timer.run_id}.json")
+        try:
+            os.makedirs(log_dir, exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump({"run_id": timer.run_id, "top": self.top, "pages": self.report()}, f, indent=2)
+            logging.info(f"🌊 Network waterfall saved to {path}")
+            return path
+        except Exception as e:
+            logging.warning(f"Could not write network waterfall: {e}")
+            return None
+
+    def summary_lines(self, slowest=3):
+        if not self.enabled:
+            return []
+        lines = [f"🌊 Network waterfall ({len(self.pages)} pages, top {slowest} slowest each)"]
+        for page in self.report():
+            dcl = page["dom_content_loaded_ms"]
+            load = page["load_ms"]
+            lines.append(
+                f"    {shorten(page['url'], 70)} - DCL {dcl if dcl is not None else '-'} ms, "
+                f"load {load if load is not None else '-'} ms, {page['requests']} requests, "
+                f"{page['bytes'] / 1024:.0f} KB"
+            )
+            for r in page["slowest"][:slowest]:
+                lines.append(
+                    f"        {r['duration_ms']:>8.0f} ms {r.get('status', '-')!s:>4} {r['type']:<10} {shorten(r['url'], 80)}"
+                )
+        return lines
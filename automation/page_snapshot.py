@@ -0,0 +1,100 @@
+# automation/page_snapshot.py
+"""
+Page snapshot cache - title and URL ride along with a cheap change stamp,
+the source is only pulled for content checks and at most once per
+navigation or DOM change, checks run against the cached lowercased copy
+"""
+
+import re
+import logging
+from collections import namedtuple
+
+Snapshot = namedtuple("Snapshot", ["title", "url", "text"])
+
+# Tags the document with an id and counts content mutations, so a cheap call
+# answers title/URL checks and tells us whether the cached source is still current.
+# The tag hangs off a registry Symbol as a non-enumerable property of document, so no
+# window global or string key shows up to the page's own scripts or fingerprinting
+STAMP_JS = """
+const key = Symbol.for("sc");
+let stamp = document[key];
+if (!stamp) {
+    stamp = {id: Math.random().toString(36).slice(2), version: 0};
+    Object.defineProperty(document, key, {value: stamp, enumerable: false, configurable: true});
+    new MutationObserver(() => { stamp.version += 1; })
+        .observe(document, {childList: true, subtree: true, characterData: true});
+}
+return [document.title, location.href, stamp.id, stamp.version];
+"""
+
+FETCH_JS = "return document.documentElement.outerHTML;"
+
+
+class PageSnapshot:
+    def __init__(self, driver=None):
+        self.driver = driver
+        self.hits = 0
+        self.misses = 0
+        self.bytes_fetched = 0
+        self._stamp = None
+        self._snapshot = None
+
+    def invalidate(self):
+        self._stamp = None
+        self._snapshot = None
+
+    def read_stamp(self):
+        """Title, URL and change stamp in one round trip, no page source"""
+        try:
+            title, url, doc_id, version = self.driver.execute_script(STAMP_JS)
+            return title, url, (url, doc_id, version)
+        except Exception:
+            return self.driver.title, self.driver.current_url, None
+
+    def head(self):
+        """Title and URL only, source left as None"""
+        title, url, _ = self.read_stamp()
+        return Snapshot(title, url, None)
+
+    def current(self):
+        """Cached snapshot with source, refetched only when the page changed"""
+        title, url, stamp = self.read_stamp()
+
+        if stamp is not None and stamp == self._stamp and self._snapshot:
+            self.hits += 1
+            return self._snapshot
+
+        self.misses += 1
+        try:
+            source = self.driver.execute_script(FETCH_JS)
+        except Exception:
+            source = self.driver.page_source
+        self.bytes_fetched += len(source)
+        self._snapshot = Snapshot(title, url, source.lower())
+        self._stamp = stamp
+        return self._snapshot
+
+    @property
+    def title(self):
+        return self.head().title
+
+    @property
+    def url(self):
+        return self.head().url
+
+    def contains(self, needle):
+        """Case-insensitive substring check against the page source"""
+        return needle.lower() in self.current().text
+
+    def title_contains(self, needle):
+        return needle.lower() in self.head().title.lower()
+
+    def matches(self, pattern):
+        """Regex search against the lowercased page source"""
+        return re.search(pattern, self.current().text) is not None
+
+    def log_stats(self):
+        logging.info(
+            f"📸 Page snapshots: {self.hits} hits, {self.misses} misses, "
+            f"{self.bytes_fetched / 1024:.0f} KB fetched"
+        )
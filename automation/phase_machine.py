@@ -0,0 +1,131 @@
+# automation/phase_machine.py
+"""
+Phase state machine - runs the upload flow one phase at a time, retrying a
+failed phase on the live driver and restarting from setup only when the
+driver itself died
+"""
+
+import time
+import random
+import logging
+from collections import namedtuple
+
+DONE = "done"
+FAILED = "failed"
+
+DEFAULT_RETRIES = {"setup": 1, "cookies": 1, "navigate": 2, "verify": 1, "upload": 1, "confirm": 0}
+
+# fallback: where to go once the phase's own retries are spent, None means the run fails
+Phase = namedtuple("Phase", ["name", "action", "next", "fallback", "needs_driver"])
+Transition = namedtuple("Transition", ["at", "source", "target", "event", "detail"])
+
+
+def parse_retries(spec, defaults=DEFAULT_RETRIES):
+    """'navigate=3,upload=2' on top of the default retry budgets"""
+    retries = dict(defaults)
+    for item in (spec or "").split(","):
+        if "=" not in item:
+            continue
+        name, value = item.split("=", 1)
+        try:
+            retries[name.strip()] = int(value)
+        except ValueError:
+            logging.warning(f"Ignoring retry budget {item!r}")
+    return retries
+
+
+class PhaseMachine:
+    def __init__(self, phases, retries=None, backoff=2.0, max_driver_restarts=1,
+                 driver_alive=None, sleep=time.sleep, start="setup", abort_check=None):
+        self.phases = {phase.name: phase for phase in phases}
+        self.retries = retries or dict(DEFAULT_RETRIES)
+        self.backoff = backoff
+        self.max_driver_restarts = max_driver_restarts
+        self.driver_alive = driver_alive or (lambda: True)
+        self.sleep = sleep
+        self.start = start
+        self.abort_check = abort_check or (lambda: None)
+        self.attempts = {}
+        self.driver_restarts = 0
+        self.transitions = []
+        self.started = None
+        self.error = None
+
+    def record(self, source, target, event, detail=None):
+        transition = Transition(time.monotonic() - self.started, source, target, event, detail)
+        self.transitions.append(transition)
+        logging.info(f"🔀 {source} → {target} ({event}{': ' + detail if detail else ''})")
+
+    def backoff_delay(self, attempt):
+        """Exponential backoff with a little jitter"""
+        return self.backoff * (2 ** (attempt - 1)) * random.uniform(0.8, 1.2)
+
+    def run(self):
+        """Drive phases until done or failed, returns True on done"""
+        self.started = time.monotonic()
+        state = self.start
+        self.record("start", state, "begin")
+
+        while state not in (DONE, FAILED):
+            # Checked between phases and after a failure, whatever tripped it already cut the driver loose
+            abort_reason = self.abort_check()
+            if abort_reason:
+                self.error = abort_reason
+                self.record(state, FAILED, "aborted", abort_reason)
+                break
+
+            phase = self.phases[state]
+            attempt = self.attempts.get(state, 0) + 1
+            self.attempts[state] = attempt
+
+            try:
+                ok = phase.action()
+                detail = None if ok else "returned False"
+            except Exception as e:
+                ok, detail = False, str(e)[:160]
+
+            if ok:
+                self.record(state, phase.next, "ok")
+                state = phase.next
+                continue
+
+            self.error = f"{state}: {detail}"
+            if self.abort_check():
+                continue
+
+            # A dead driver makes every retry on it pointless, rebuild it instead
+            if phase.needs_driver and not self.driver_alive():
+                if self.driver_restarts < self.max_driver_restarts:
+                    self.driver_restarts += 1
+                    self.record(state, self.start, "driver dead", f"restart {self.driver_restarts}/{self.max_driver_restarts}")
+                    # A fresh session gets fresh retry budgets, the restart cap bounds the loop
+                    self.attempts = {}
+                    state = self.start
+                    continue
+                self.record(state, FAILED, "driver dead", "no restarts left")
+                state = FAILED
+                continue
+
+            budget = self.retries.get(state, 0)
+            if attempt <= budget:
+                delay = self.backoff_delay(attempt)
+                self.record(state, state, "retry", f"{attempt}/{budget} in {delay:.1f}s after {detail}")
+                self.sleep(delay)
+                continue
+
+            if phase.fallback and self.attempts.get(phase.fallback, 0) <= self.retries.get(phase.fallback, 0):
+                self.record(state, phase.fallback, "fallback", detail)
+                state = phase.fallback
+                continue
+
+            self.record(state, FAILED, "exhausted", detail)
+            state = FAILED
+
+        return state == DONE
+
+    def summary_lines(self):
+        lines = [f"🔀 Phase transitions ({len(self.transitions)}, driver restarts {self.driver_restarts})"]
+        for t in self.transitions:
+            detail = f" - {t.detail}" if t.detail else ""
+            lines.append(f"    +{t.at:>7.2f}s {t.source:>10} → {t.target:<10} {t.event}{detail}")
+        return lines
@@ -0,0 +1,83 @@
+# automation/proc_tree.py
+"""
+/proc helpers - RSS, CPU time and process count of a whole process tree
+(chromedriver, Chrome and its renderers), Linux only
+"""
+
+import os
+from collections import namedtuple
+
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+CLOCK_TICKS = os.sysconf("SC_CLK_TCK") if hasattr(os, "sysconf") else 100
+
+ProcInfo = namedtuple("ProcInfo", ["pid", "ppid", "name", "cpu_ticks", "rss_pages"])
+TreeUsage = namedtuple("TreeUsage", ["rss_bytes", "cpu_seconds", "processes", "pids"])
+
+
+def read_proc(pid):
+    """One /proc/<pid>/stat entry, None if the process is gone"""
+    try:
+        with open(f"/proc/{pid}/stat", "r") as f:
+            data = f.read()
+    except OSError:
+        return None
+    # comm sits in parentheses and may itself contain spaces or ')'
+    name = data[data.index("(") + 1:data.rindex(")")]
+    fields = data[data.rindex(")") + 2:].split()
+    if fields[0] == "Z":
+        return None
+    return ProcInfo(pid, int(fields[1]), name, int(fields[11]) + int(fields[12]), int(fields[21]))
+
+
+def all_processes():
+    procs = {}
+    for entry in os.listdir("/proc"):
+        if entry.isdigit():
+            info = read_proc(int(entry))
+            if info:
+                procs[info.pid] = info
+    return procs
+
+
+def descendants(roots, procs):
+    """Every pid below the roots, following ppid links"""
+    children = {}
+    for info in procs.values():
+        children.setdefault(info.ppid, []).append(info.pid)
+    found = []
+    pending = list(roots)
+    while pending:
+        pid = pending.pop()
+        for child in children.get(pid, []):
+            if child not in found:
+                found.append(child)
+                pending.append(child)
+    return found
+
+
+def tree_usage(roots, include_roots=True):
+    """Summed RSS (shared pages count once per process), CPU seconds and process count"""
+    roots = [pid for pid in roots if pid]
+    procs = all_processes()
+    pids = descendants(roots, procs)
+    if include_roots:
+        pids = [pid for pid in roots if pid in procs] + [pid for pid in pids if pid not in roots]
+    infos = [procs[pid] for pid in pids if pid in procs]
+    return TreeUsage(
+        rss_bytes=sum(info.rss_pages for info in infos) * PAGE_SIZE,
+        cpu_seconds=sum(info.cpu_ticks for info in infos) / CLOCK_TICKS,
+        processes=len(infos),
+        pids=[info.pid for info in infos],
+    )
+
+
+def driver_root_pids(driver):
+    """chromedriver pid plus the browser pid undetected-chromedriver tracks separately"""
+    pids = []
+    process = getattr(getattr(driver, "service", None), "process", None)
+    if process is not None:
+        pids.append(process.pid)
+    browser_pid = getattr(driver, "browser_pid", None)
+    if browser_pid and browser_pid not in pids:
+        pids.append(browser_pid)
+    return pids
@@ -0,0 +1,170 @@
+# automation/profile_cache.py
+"""
+Warm Chrome profile cache - reuses profile dirs (and their HTTP cache)
+across runs, locked against concurrent use, with a size cap and cleanup
+of abandoned temp profiles
+"""
+
+import os
+import glob
+import time
+import fcntl
+import shutil
+import logging
+import tempfile
+
+LOCK_FILE = ".lock"
+LAST_USED_FILE = ".last_used"
+TEMP_PREFIX = "chrome_profile_"
+OWNER_FILE = ".owner"  # pid of the run using a temp profile
+# Left behind when Chrome dies without a clean shutdown, and block the next launch
+SINGLETON_FILES = ("SingletonLock", "SingletonCookie", "SingletonSocket")
+
+
+def dir_size(path):
+    total = 0
+    for root, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.lstat(os.path.join(root, name)).st_size
+            except OSError:
+                pass
+    return total
+
+
+def pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True  # exists, owned by another user
+    return True
+
+
+def temp_owner(path):
+    """pid from a temp profile's owner marker, None when missing or unreadable"""
+    try:
+        with open(os.path.join(path, OWNER_FILE)) as f:
+            return int(f.read().strip())
+    except (OSError, ValueError):
+        return None
+
+
+def create_temp_profile():
+    """Throwaway profile dir marked with this process as its owner"""
+    path = tempfile.mkdtemp(prefix=TEMP_PREFIX)
+    with open(os.path.join(path, OWNER_FILE), "w") as f:
+        f.write(str(os.getpid()))
+    return path
+
+
+class ProfileCache:
+    def __init__(self, root=None, max_size_mb=None, slots=None, stale_hours=None):
+        self.root = os.path.expanduser(
+            root or os.getenv("CHROME_PROFILE_CACHE_DIR", "~/.cache/naukri-automation/profiles")
+        )
+        self.max_size = int(float(max_size_mb or os.getenv("CHROME_PROFILE_CACHE_MB", "500")) * 1024 * 1024)
+        self.slots = int(slots or os.getenv("CHROME_PROFILE_SLOTS", "4"))
+        self.stale_seconds = float(stale_hours or os.getenv("CHROME_PROFILE_STALE_HOURS", "12")) * 3600
+        self._locks = {}
+
+    def acquire(self, name="default"):
+        """Lock a free slot for this profile name, returns the slot dir or None if all are busy"""
+        os.makedirs(self.root, exist_ok=True)
+        for index in range(self.slots):
+            slot = os.path.join(self.root, name if index == 0 else f"{name}-{index}")
+            os.makedirs(slot, exist_ok=True)
+            lock = self._try_lock(slot)
+            if not lock:
+                continue
+
+            self._locks[slot] = lock
+            self._clear_singletons(slot)
+            with open(os.path.join(slot, LAST_USED_FILE), "w") as f:
+                f.write(str(time.time()))
+            warm = any(entry not in (LOCK_FILE, LAST_USED_FILE) for entry in os.listdir(slot))
+            logging.info(f"🗂️ Using {'warm' if warm else 'new'} profile {slot}")
+            return slot
+
+        logging.warning(f"All {self.slots} profile slots for '{name}' are busy")
+        return None
+
+    def release(self, slot):
+        lock = self._locks.pop(slot, None)
+        if lock:
+            fcntl.flock(lock, fcntl.LOCK_UN)
+            lock.close()
+
+    def enforce_size_cap(self):
+        """Evict least recently used unlocked profiles until the cache fits the cap"""
+        if not os.path.isdir(self.root):
+            return
+        profiles = []
+        for entry in os.listdir(self.root):
+            slot = os.path.join(self.root, entry)
+            if os.path.isdir(slot):
+                profiles.append((self._last_used(slot), slot, dir_size(slot)))
+
+        total = sum(size for _, _, size in profiles)
+        for _, slot, size in sorted(profiles):
+            if total <= self.max_size:
+                break
+            if slot in self._locks:
+                continue
+            lock = self._try_lock(slot)
+            if not lock:
+                continue
+            # Delete while holding the lock so nobody acquires it halfway through
+            shutil.rmtree(slot, ignore_errors=True)
+            lock.close()
+            total -= size
+            logging.info(f"🧹 Evicted profile {slot} ({size / 1024 / 1024:.0f} MB)")
+
+    def cleanup_abandoned(self):
+        """Remove chrome_profile_* temp dirs whose owner has exited, unmarked ones once stale"""
+        cutoff = time.time() - self.stale_seconds
+        paths = glob.glob(os.path.join(tempfile.gettempdir(), f"{TEMP_PREFIX}*"))
+        owners = {path: temp_owner(path) for path in paths}
+        owners = {path: pid for path, pid in owners.items() if pid and pid > 0}
+        removed = 0
+        for path in paths:
+            # Strategy dirs (<base>_uc, <base>_reg, ...) carry no marker, they belong to their base dir's owner
+            base = next((b for b in owners if path == b or path.startswith(f"{b}_")), None)
+            try:
+                if base:
+                    if pid_alive(owners[base]):
+                        continue
+                elif os.path.getmtime(path) >= cutoff:
+                    continue
+            except OSError:
+                continue
+            shutil.rmtree(path, ignore_errors=True)
+            removed += 1
+        if removed:
+            logging.info(f"🧹 Removed {removed} abandoned temp profile dir(s)")
+
+    def _try_lock(self, slot):
+        """Locked file handle if nobody holds the slot, else None"""
+        lock = open(os.path.join(slot, LOCK_FILE), "a+")
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return lock
+        except OSError:
+            lock.close()
+            return None
+
+    def _last_used(self, slot):
+        try:
+            with open(os.path.join(slot, LAST_USED_FILE)) as f:
+                return float(f.read().strip() or 0)
+        except (OSError, ValueError):
+            return 0.0
+
+    def _clear_singletons(self, slot):
+        for pattern in SINGLETON_FILES:
+            for path in glob.glob(os.path.join(slot, "*", pattern)):
+                try:
+                    os.unlink(path)
+                except OSError:
+                    pass
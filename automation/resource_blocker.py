@@ -0,0 +1,141 @@
+# automation/resource_blocker.py
+"""
+Resource blocking - drops images, fonts, media and third-party trackers
+before Chrome fetches them, and counts what was blocked per run
+"""
+
+import os
+import json
+import logging
+
+
+def extension_patterns(*extensions):
+    """Extension at the end of the path, bare or before a query string, never mid-URL like app.icons.min.js"""
+    patterns = []
+    for extension in extensions:
+        patterns.extend([f"*.{extension}", f"*.{extension}?*"])
+    return patterns
+
+
+# Network.setBlockedURLs only matches URL patterns, so resource types map to extensions
+BLOCKED_TYPE_PATTERNS = {
+    "image": extension_patterns("png", "jpg", "jpeg", "gif", "webp", "ico", "svg", "avif"),
+    "font": extension_patterns("woff", "woff2", "ttf", "otf", "eot"),
+    "media": extension_patterns("mp4", "webm", "mp3", "m3u8"),
+    "tracker": [
+        "*google-analytics.com*", "*googletagmanager.com*", "*googletagservices.com*",
+        "*doubleclick.net*", "*googlesyndication.com*", "*adservice.google.*",
+        "*facebook.net*", "*connect.facebook.com*", "*clarity.ms*", "*hotjar.com*",
+        "*criteo.com*", "*taboola.com*", "*outbrain.com*", "*scorecardresearch.com*",
+        "*moengage.com*", "*webengage.com*", "*bing.com/bat*", "*linkedin.com/px*"
+    ],
+}
+DEFAULT_BLOCKED_TYPES = "image,font,media,tracker"
+
+# Rough transfer sizes per Chrome resource type, blocked requests never report a real one
+ESTIMATED_BYTES = {
+    "Image": 35 * 1024,
+    "Font": 40 * 1024,
+    "Media": 250 * 1024,
+    "Script": 60 * 1024,
+    "Stylesheet": 20 * 1024,
+    "XHR": 2 * 1024,
+    "Fetch": 2 * 1024,
+    "Ping": 512,
+    "Other": 8 * 1024,
+}
+
+
+def blocked_url_patterns(types=None, extra_patterns=None):
+    patterns = []
+    for resource_type in (types or DEFAULT_BLOCKED_TYPES).split(","):
+        resource_type = resource_type.strip().lower()
+        if resource_type and resource_type not in BLOCKED_TYPE_PATTERNS:
+            logging.warning(f"Unknown blocked resource type: {resource_type}")
+        patterns.extend(BLOCKED_TYPE_PATTERNS.get(resource_type, []))
+    patterns.extend(p.strip() for p in (extra_patterns or "").split(",") if p.strip())
+    return patterns
+
+
+class ResourceBlocker:
+    def __init__(self):
+        self.enabled = os.getenv("BLOCK_RESOURCES", "1") != "0"
+        self.patterns = blocked_url_patterns(
+            os.getenv("BLOCK_RESOURCE_TYPES", DEFAULT_BLOCKED_TYPES),
+            os.getenv("BLOCK_URL_PATTERNS", "")
+        )
+        self.listeners = []  # other readers of the performance log, it can only be drained once
+        self.reset()
+
+    def reset(self):
+        self.request_types = {}
+        self.blocked = {}
+        self.bytes_saved = 0
+        self.bytes_received = 0
+
+    def configure_options(self, options):
+        """Ask chromedriver for the performance log, where blocked requests show up"""
+        if self.enabled or self.listeners:
+            options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        return options
+
+    def apply(self, driver):
+        """Install the block list on a Selenium session"""
+        if not self.enabled:
+            logging.info("🚫 Resource blocking disabled")
+            return False
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.patterns})
+            logging.info(f"🚫 Blocking {len(self.patterns)} resource patterns")
+            return True
+        except Exception as e:
+            logging.warning(f"Could not install resource blocking: {e}")
+            return False
+
+    def record_event(self, method, params):
+        """Feed one Network.* DevTools event"""
+        if method == "Network.requestWillBeSent":
+            self.request_types[params["requestId"]] = params.get("type", "Other")
+        elif method == "Network.loadingFinished":
+            self.bytes_received += int(params.get("encodedDataLength", 0))
+        elif method == "Network.loadingFailed" and params.get("blockedReason"):
+            resource_type = params.get("type") or self.request_types.get(params["requestId"], "Other")
+            self.blocked[resource_type] = self.blocked.get(resource_type, 0) + 1
+            self.bytes_saved += ESTIMATED_BYTES.get(resource_type, ESTIMATED_BYTES["Other"])
+
+    def collect(self, driver):
+        """Drain the Selenium performance log into the counters and listeners"""
+        if not (self.enabled or self.listeners):
+            return
+        try:
+            entries = driver.get_log("performance")
+        except Exception as e:
+            logging.warning(f"Could not read performance log: {e}")
+            return
+        for entry in entries:
+            try:
+                message = json.loads(entry["message"])["message"]
+                method, params = message.get("method"), message.get("params", {})
+            except (KeyError, ValueError):
+                continue
+            if self.enabled:
+                self.record_event(method, params)
+            for listener in self.listeners:
+                try:
+                    listener(method, params)
+                except Exception as e:
+                    logging.debug(f"Performance log listener failed on {method}: {e}")
+
+    @property
+    def blocked_total(self):
+        return sum(self.blocked.values())
+
+    def summary_lines(self):
+        if not self.enabled:
+            return ["🚫 Resource blocking: off"]
+        by_type = ", ".join(f"{t} {n}" for t, n in sorted(self.blocked.items(), key=lambda item: -item[1]))
+        return [
+            f"🚫 Blocked {self.blocked_total} requests ({by_type or 'none'}), "
+            f"~{self.bytes_saved / 1024:.0f} KB saved (est.), {self.bytes_received / 1024:.0f} KB fetched"
+        ]
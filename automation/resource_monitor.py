@@ -0,0 +1,120 @@
+# automation/resource_monitor.py
+"""
+Live resource monitor - samples RSS, CPU and process count of the
+chromedriver/Chrome tree from /proc, tagged with the active phase, and
+trips when the tree grows past a memory ceiling
+"""
+
+import os
+import time
+import logging
+import threading
+
+from proc_tree import tree_usage
+
+MB = 1024 * 1024
+
+# Exit code when the memory ceiling aborted the run
+EXIT_MEMORY_CEILING = 4
+
+
+class PhaseStats:
+    def __init__(self):
+        self.samples = 0
+        self.rss_total = 0
+        self.rss_peak = 0
+        self.cpu_total = 0.0
+        self.cpu_peak = 0.0
+        self.processes_peak = 0
+
+    def add(self, rss, cpu_percent, processes):
+        self.samples += 1
+        self.rss_total += rss
+        self.rss_peak = max(self.rss_peak, rss)
+        self.cpu_total += cpu_percent
+        self.cpu_peak = max(self.cpu_peak, cpu_percent)
+        self.processes_peak = max(self.processes_peak, processes)
+
+
+class ResourceMonitor:
+    def __init__(self, timer, roots):
+        self.enabled = os.getenv("RESOURCE_MONITOR", "0") == "1"
+        self.interval = float(os.getenv("RESOURCE_MONITOR_INTERVAL", "1.0"))
+        self.ceiling_bytes = float(os.getenv("MEMORY_CEILING_MB", "0")) * MB  # 0 disables the ceiling
+        self.timer = timer
+        self.roots = roots
+        self.on_ceiling = None
+        self.phases = {}
+        self.tripped = None
+        self.thread = None
+        self.stopped = threading.Event()
+        self.last_cpu = None
+
+    def start(self):
+        if not self.enabled or self.thread:
+            return
+        self.stopped.clear()
+        self.thread = threading.Thread(target=self.run, name="resource_monitor", daemon=True)
+        self.thread.start()
+        ceiling = f", ceiling {self.ceiling_bytes / MB:.0f} MB" if self.ceiling_bytes else ""
+        logging.info(f"📈 Resource monitor sampling every {self.interval:.1f}s{ceiling}")
+
+    def stop(self):
+        if self.thread:
+            self.stopped.set()
+            self.thread.join(timeout=self.interval + 2)
+            self.thread = None
+
+    def active_phase(self):
+        # The timer's stack belongs to the main thread, read a copy
+        stack = list(self.timer.stack)
+        return stack[-1].name if stack else "idle"
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            try:
+                self.sample()
+            except Exception as e:
+                logging.debug(f"Resource sample failed: {e}")
+
+    def sample(self):
+        roots = self.roots()
+        if not roots:
+            self.last_cpu = None
+            return
+        usage = tree_usage(roots)
+        now = time.monotonic()
+
+        cpu_percent = 0.0
+        if self.last_cpu:
+            last_at, last_seconds = self.last_cpu
+            # Exited children take their CPU time with them, never report negative usage
+            cpu_percent = max(usage.cpu_seconds - last_seconds, 0.0) / max(now - last_at, 1e-6) * 100
+        self.last_cpu = (now, usage.cpu_seconds)
+
+        phase = self.active_phase()
+        self.phases.setdefault(phase, PhaseStats()).add(usage.rss_bytes, cpu_percent, usage.processes)
+
+        if self.ceiling_bytes and usage.rss_bytes > self.ceiling_bytes and not self.tripped:
+            self.tripped = (
+                f"Chrome tree at {usage.rss_bytes / MB:.0f} MB during {phase}, "
+                f"over the {self.ceiling_bytes / MB:.0f} MB ceiling"
+            )
+            logging.error(f"🧯 {self.tripped}")
+            if self.on_ceiling:
+                self.on_ceiling(self.tripped)
+
+    def summary_lines(self):
+        if not self.enabled:
+            return []
+        lines = [f"📈 Resources per phase (every {self.interval:.1f}s)"]
+        lines.append(f"    {'phase':<20} {'n':>4} {'avg MB':>8} {'peak MB':>8} {'avg CPU%':>9} {'peak CPU%':>10} {'procs':>6}")
+        for phase, stats in self.phases.items():
+            lines.append(
+                f"    {phase:<20} {stats.samples:>4} {stats.rss_total / stats.samples / MB:>8.1f} "
+                f"{stats.rss_peak / MB:>8.1f} {stats.cpu_total / stats.samples:>9.1f} "
+                f"{stats.cpu_peak:>10.1f} {stats.processes_peak:>6}"
+            )
+        if self.tripped:
+            lines.append(f"    aborted: {self.tripped}")
+        return lines
@@ -0,0 +1,135 @@
+# automation/resume_prep.py
+"""
+Resume preparation - validates the PDF, enforces Naukri's size limit and
+caches a size-optimized copy by content hash so later runs reuse it
+"""
+
+import os
+import json
+import shutil
+import logging
+from collections import namedtuple
+
+from upload_ledger import file_sha256
+
+try:
+    import pikepdf
+    USE_PIKEPDF = True
+except ImportError:
+    USE_PIKEPDF = False
+
+# Exit code when the resume is invalid or over the size limit
+EXIT_RESUME_REJECTED = 5
+
+# Kept from the document info dictionary, everything else is producer/tool bloat
+KEEP_DOCINFO = ("/Title", "/Author")
+MB = 1024 * 1024
+
+PreparedResume = namedtuple("PreparedResume", ["path", "sha256", "source_size", "size", "optimized", "cached"])
+
+
+class ResumeError(ValueError):
+    pass
+
+
+def validate_pdf(path):
+    """Cheap structural checks, raises ResumeError"""
+    size = os.path.getsize(path)
+    if size == 0:
+        raise ResumeError(f"{path} is empty")
+    with open(path, "rb") as f:
+        header = f.read(1024)
+        f.seek(max(size - 1024, 0))
+        trailer = f.read()
+    if b"%PDF-" not in header:
+        raise ResumeError(f"{path} is not a PDF (no %PDF- header)")
+    if b"%%EOF" not in trailer:
+        raise ResumeError(f"{path} looks truncated (no %%EOF marker)")
+    return size
+
+
+def optimize_pdf(source, target):
+    """Recompress streams, drop unreferenced resources and metadata bloat"""
+    with pikepdf.open(source) as pdf:
+        pdf.remove_unreferenced_resources()
+        if "/Metadata" in pdf.Root:
+            del pdf.Root.Metadata
+        for key in list(pdf.docinfo.keys()):
+            if key not in KEEP_DOCINFO:
+                del pdf.docinfo[key]
+        pdf.save(
+            target,
+            compress_streams=True,
+            recompress_flate=True,
+            object_stream_mode=pikepdf.ObjectStreamMode.generate,
+        )
+
+
+class ResumePreparer:
+    def __init__(self, cache_dir=None):
+        self.cache_dir = cache_dir or os.getenv(
+            "RESUME_CACHE_DIR", os.path.expanduser("~/.cache/naukri-automation/resumes")
+        )
+        self.max_bytes = float(os.getenv("RESUME_MAX_MB", "2")) * MB  # Naukri accepts resumes up to 2 MB
+        self.optimize = os.getenv("RESUME_OPTIMIZE", "1") != "0"
+
+    def check_size(self, size, path):
+        if size > self.max_bytes:
+            raise ResumeError(
+                f"{os.path.basename(path)} is {size / MB:.2f} MB, over Naukri's {self.max_bytes / MB:.0f} MB limit"
+            )
+
+    def prepare(self, resume_path):
+        """Validated (and when possible optimized) file to upload, raises ResumeError"""
+        if not os.path.exists(resume_path):
+            raise FileNotFoundError(f"Resume not found: {resume_path}")
+        content_hash = file_sha256(resume_path)
+        source_size = os.path.getsize(resume_path)
+
+        # Same basename in a per-hash directory, Naukri shows the uploaded file name
+        entry_dir = os.path.join(self.cache_dir, content_hash)
+        cached_path = os.path.join(entry_dir, os.path.basename(resume_path))
+        meta_path = os.path.join(entry_dir, "meta.json")
+        # RESUME_OPTIMIZE=0 means the original file, even when an optimized copy is cached
+        if self.optimize and os.path.exists(cached_path) and os.path.exists(meta_path):
+            size = os.path.getsize(cached_path)
+            self.check_size(size, resume_path)
+            logging.info(f"📄 Prepared resume from cache ({source_size} → {size} bytes)")
+            return PreparedResume(cached_path, content_hash, source_size, size, size < source_size, True)
+
+        validate_pdf(resume_path)
+        prepared = PreparedResume(resume_path, content_hash, source_size, source_size, False, False)
+
+        if self.optimize and USE_PIKEPDF:
+            # Batch jobs share the cache: build both files aside, swap them in, meta last marks the entry complete
+            tmp_path = f"{cached_path}.{os.getpid()}.tmp"
+            tmp_meta = f"{meta_path}.{os.getpid()}.tmp"
+            try:
+                os.makedirs(entry_dir, exist_ok=True)
+                optimize_pdf(resume_path, tmp_path)
+                optimized_size = os.path.getsize(tmp_path)
+                if optimized_size >= source_size:
+                    # Already lean, cache the original so the hit path never re-runs pikepdf
+                    shutil.copyfile(resume_path, tmp_path)
+                    optimized_size = source_size
+                with open(tmp_meta, "w", encoding="utf-8") as f:
+                    json.dump({"source_size": source_size, "size": optimized_size, "optimizer": "pikepdf"}, f)
+                os.replace(tmp_path, cached_path)
+                os.replace(tmp_meta, meta_path)
+                prepared = PreparedResume(
+                    cached_path, content_hash, source_size, optimized_size, optimized_size < source_size, False
+                )
+            except Exception as e:
+                logging.warning(f"PDF optimization failed, uploading the original: {e}")
+                for path in (tmp_path, tmp_meta):
+                    if os.path.exists(path):
+                        os.remove(path)
+        elif self.optimize:
+            logging.info("ℹ️ pikepdf not installed, uploading the original PDF")
+
+        self.check_size(prepared.size, resume_path)
+        logging.info(
+            f"📄 Prepared resume: {prepared.source_size} → {prepared.size} bytes"
+            f"{' (optimized)' if prepared.optimized else ''}"
+        )
+        return prepared
@@ -0,0 +1,166 @@
+# automation/run_timing.py
+"""
+Per-phase timing spans - wall time, sleep vs active time and WebDriver
+command counts, written as JSON lines so runs can be compared over time
+"""
+
+import os
+import json
+import math
+import time
+import logging
+import functools
+from contextlib import contextmanager
+from datetime import datetime
+
+
+class Span:
+    def __init__(self, name, path, depth):
+        self.name = name
+        self.path = path
+        self.depth = depth
+        self.started_at = datetime.now().isoformat(timespec="seconds")
+        self.start = time.monotonic()
+        self.wall = 0.0
+        self.sleep = 0.0
+        self.commands = 0
+        self.outcome = "ok"
+        self.detail = None
+
+    def to_dict(self, run_id):
+        return {
+            "run_id": run_id,
+            "phase": self.name,
+            "path": self.path,
+            "depth": self.depth,
+            "started_at": self.started_at,
+            "wall": round(self.wall, 3),
+            "sleep": round(self.sleep, 3),
+            "active": round(max(self.wall - self.sleep, 0.0), 3),
+            "commands": self.commands,
+            "outcome": self.outcome,
+            "detail": self.detail,
+        }
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(math.ceil(pct / 100.0 * len(ordered)) - 1, 0)
+    return ordered[min(rank, len(ordered) - 1)]
+
+
+def timed_phase(name):
+    """Wrap an uploader method in a span; a falsy return marks the phase failed"""
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            with self.timer.span(name) as span:
+                result = method(self, *args, **kwargs)
+                if result is False:
+                    span.outcome = "failed"
+                return result
+        return wrapper
+    return decorator
+
+
+class RunTimer:
+    def __init__(self, log_dir="./logs", history_file="phase_timings.jsonl"):
+        self.run_id = datetime.now().strftime("%Y%m%d_%H%M%S") + f"_{os.getpid()}"
+        self.history_path = os.path.join(log_dir, history_file)
+        self.spans = []
+        self.stack = []
+        self.extra_summary = []
+        self.listeners = []
+
+    @contextmanager
+    def span(self, name):
+        path = "/".join([s.name for s in self.stack] + [name])
+        span = Span(name, path, len(self.stack))
+        self.stack.append(span)
+        try:
+            yield span
+        except Exception as e:
+            span.outcome = "error"
+            span.detail = str(e)[:200]
+            raise
+        finally:
+            span.wall = time.monotonic() - span.start
+            self.stack.remove(span)
+            self.spans.append(span)
+            for listener in self.listeners:
+                listener(span)
+
+    @property
+    def current_phase(self):
+        return self.stack[-1].name if self.stack else None
+
+    def add_sleep(self, seconds):
+        """Attribute sleeping to every open span"""
+        for span in self.stack:
+            span.sleep += seconds
+
+    def count_command(self, command=None):
+        for span in self.stack:
+            span.commands += 1
+
+    def instrument(self, driver):
+        """Count every WebDriver command the driver sends"""
+        original_execute = driver.execute
+
+        def counted_execute(driver_command, params=None):
+            self.count_command(driver_command)
+            return original_execute(driver_command, params)
+
+        driver.execute = counted_execute
+        return driver
+
+    def write(self):
+        """Append this run's spans to the JSON-lines history"""
+        try:
+            os.makedirs(os.path.dirname(self.history_path) or ".", exist_ok=True)
+            with open(self.history_path, "a", encoding="utf-8") as f:
+                for span in sorted(self.spans, key=lambda s: s.start):
+                    f.write(json.dumps(span.to_dict(self.run_id)) + "\n")
+        except Exception as e:
+            logging.warning(f"Could not write phase timings: {e}")
+
+    def flush(self):
+        """Write and summarise what was recorded so far, then start a fresh run id"""
+        self.write()
+        self.summary()
+        self.spans = []
+        self.extra_summary = []
+        self.run_id = datetime.now().strftime("%Y%m%d_%H%M%S") + f"_{os.getpid()}"
+
+    def load_history(self):
+        history = {}
+        if not os.path.exists(self.history_path):
+            return history
+        with open(self.history_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                history.setdefault(record["path"], []).append(record["wall"])
+        return history
+
+    def summary(self):
+        """Log this run's spans next to p50/p95 across all recorded runs"""
+        history = self.load_history()
+        lines = [
+            f"{'phase':<42} {'wall':>7} {'sleep':>7} {'active':>7} {'cmds':>5} {'outcome':<8} {'p50':>7} {'p95':>7}"
+        ]
+        for span in sorted(self.spans, key=lambda s: s.start):
+            record = span.to_dict(self.run_id)
+            walls = history.get(span.path, [])
+            label = "  " * span.depth + span.name
+            lines.append(
+                f"{label:<42} {record['wall']:>7.2f} {record['sleep']:>7.2f} {record['active']:>7.2f} "
+                f"{record['commands']:>5} {record['outcome']:<8} {percentile(walls, 50):>7.2f} {percentile(walls, 95):>7.2f}"
+            )
+        lines.extend(self.extra_summary)
+        logging.info("📊 Run summary (seconds, p50/p95 over recorded runs):\n" + "\n".join(lines))
@@ -0,0 +1,142 @@
+# automation/session_preflight.py
+"""
+Browserless session pre-flight - checks cookie expiries locally and probes
+the session over plain HTTP, so a dead login fails before Chrome starts
+"""
+
+import os
+import json
+import time
+import base64
+import logging
+from collections import namedtuple
+from urllib.parse import urlsplit
+
+from cookie_jar import read_cookie_file, cookie_expiry
+from naukri_selectors import NAUKRI_HOME
+
+try:
+    import requests
+    USE_REQUESTS = True
+except ImportError:
+    USE_REQUESTS = False
+
+ALIVE = "alive"
+DEAD = "dead"
+INCONCLUSIVE = "inconclusive"
+
+# Exit code for a dead session, distinct from the generic failure exit 1
+EXIT_SESSION_EXPIRED = 3
+
+USER_AGENT = (
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+PROBE_PATH = "/mnjuser/homepage"
+LOGIN_MARKERS = ("/nlogin", "/login", "login.naukri")
+BLOCK_MARKERS = ("access denied", "reference #", "akamai")
+
+PreflightResult = namedtuple("PreflightResult", ["status", "reason", "elapsed"])
+
+
+def load_cookie_jar(cookies_file, cookies_b64=None):
+    """Cookie list from the cookie file, else from the base64 secret"""
+    if os.path.exists(cookies_file):
+        return read_cookie_file(cookies_file)
+    if cookies_b64:
+        return json.loads(base64.b64decode(cookies_b64).decode("utf-8"))
+    raise FileNotFoundError("No cookies available")
+
+
+def check_expiries(cookies, auth_cookies):
+    """DEAD when nothing usable is left locally, None when the jar looks fine"""
+    now = time.time()
+    live = [c for c in cookies if (cookie_expiry(c) or float("inf")) > now]
+    if not live:
+        return f"all {len(cookies)} cookies expired" if cookies else "cookie jar is empty"
+
+    present = [c for c in cookies if c.get("name") in auth_cookies]
+    if present and not any(c in live for c in present):
+        names = ", ".join(sorted({c["name"] for c in present}))
+        return f"auth cookies expired ({names})"
+    return None
+
+
+def build_session(cookies, user_agent=USER_AGENT):
+    """Pooled requests.Session carrying the saved cookie jar"""
+    session = requests.Session()
+    session.headers.update({
+        "User-Agent": user_agent,
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+        "Accept-Language": "en-US,en;q=0.9",
+    })
+    default_domain = urlsplit(NAUKRI_HOME).hostname
+    for cookie in cookies:
+        if not cookie.get("name") or cookie.get("value") is None:
+            continue
+        session.cookies.set(
+            cookie["name"], str(cookie["value"]),
+            domain=cookie.get("domain") or default_domain,
+            path=cookie.get("path", "/")
+        )
+    return session
+
+
+def classify_response(response):
+    """Map the probe response to alive / dead / inconclusive"""
+    location = response.headers.get("Location", "")
+    if response.is_redirect and any(marker in location for marker in LOGIN_MARKERS):
+        return DEAD, f"redirected to login ({location})"
+    if response.status_code in (401, 403):
+        body = response.text[:4096].lower()
+        if any(marker in body for marker in BLOCK_MARKERS):
+            return INCONCLUSIVE, f"HTTP {response.status_code} from bot protection"
+        return INCONCLUSIVE, f"HTTP {response.status_code}"
+    if response.status_code == 200:
+        if any(marker in response.url for marker in LOGIN_MARKERS):
+            return DEAD, "landed on the login page"
+        return ALIVE, "profile page served"
+    return INCONCLUSIVE, f"HTTP {response.status_code}"
+
+
+def auth_cookie_names():
+    """Cookie names that carry the login, from PREFLIGHT_AUTH_COOKIES"""
+    return {n.strip() for n in os.getenv("PREFLIGHT_AUTH_COOKIES", "nauk_at,nauk_rt").split(",") if n.strip()}
+
+
+def check_session(cookies_file, cookies_b64=None, timeout=None, probe=True):
+    """Local expiry check, then one HTTP probe unless probe=False; only DEAD should stop a run"""
+    start = time.monotonic()
+    timeout = float(timeout or os.getenv("PREFLIGHT_TIMEOUT", "10"))
+    auth_cookies = auth_cookie_names()
+
+    def result(status, reason):
+        return PreflightResult(status, reason, time.monotonic() - start)
+
+    try:
+        cookies = load_cookie_jar(cookies_file, cookies_b64)
+    except Exception as e:
+        return result(DEAD, f"cookies unreadable: {e}")
+
+    expired = check_expiries(cookies, auth_cookies)
+    if expired:
+        return result(DEAD, expired)
+
+    if not probe:
+        return result(ALIVE, f"{len(cookies)} cookies, none expired")
+
+    if not USE_REQUESTS:
+        return result(INCONCLUSIVE, "requests not installed, skipped HTTP probe")
+
+    try:
+        with build_session(cookies) as session:
+            response = session.get(f"{NAUKRI_HOME}{PROBE_PATH}", timeout=timeout, allow_redirects=False)
+            status, reason = classify_response(response)
+    except requests.RequestException as e:
+        return result(INCONCLUSIVE, f"network error: {e}")
+    return result(status, reason)
+
+
+def log_result(result):
+    icon = {ALIVE: "✅", DEAD: "❌", INCONCLUSIVE: "⚠️"}[result.status]
+    logging.info(f"{icon} Session pre-flight: {result.status} - {result.reason} ({result.elapsed:.1f}s)")
@@ -0,0 +1,78 @@
+# automation/upload_ledger.py
+"""
+Upload ledger - remembers confirmed uploads by resume content hash and
+account, so repeated triggers can skip a resume that is already live
+"""
+
+import os
+import json
+import fcntl
+import time
+import hashlib
+import logging
+from datetime import datetime
+
+# Fallback checks that also match an old upload still shown on the profile, never proof of this one
+WEAK_INDICATORS = ("resume on page",)
+
+
+def file_sha256(path, chunk_size=1024 * 1024):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class UploadLedger:
+    def __init__(self, path=None, freshness_hours=None):
+        self.path = path or os.getenv("UPLOAD_LEDGER_PATH", "./state/upload_ledger.json")
+        self.freshness_seconds = float(freshness_hours or os.getenv("LEDGER_FRESHNESS_HOURS", "20")) * 3600
+
+    def load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def key(self, content_hash, account):
+        return f"{account}:{content_hash}"
+
+    def recent_confirmation(self, content_hash, account):
+        """Ledger entry if this exact resume was confirmed inside the freshness window"""
+        entry = self.load().get(self.key(content_hash, account))
+        if not entry or entry.get("indicator") in WEAK_INDICATORS:
+            return None
+        if time.time() - entry.get("timestamp", 0) < self.freshness_seconds:
+            return entry
+        return None
+
+    def record(self, content_hash, account, indicator, resume_path):
+        """Store a confirmed upload, written atomically so concurrent triggers never see half a file"""
+        if indicator in WEAK_INDICATORS:
+            logging.info(f"📒 Not recording {content_hash[:12]} in the ledger, '{indicator}' does not prove this upload")
+            return False
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        # Batch jobs record from several processes, serialize the read-modify-write
+        with open(f"{self.path}.lock", "a+") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            ledger = self.load()
+            key = self.key(content_hash, account)
+            previous = ledger.get(key, {})
+            ledger[key] = {
+                "account": account,
+                "sha256": content_hash,
+                "resume": os.path.basename(resume_path),
+                "indicator": indicator,
+                "confirmed_at": datetime.now().isoformat(timespec="seconds"),
+                "timestamp": time.time(),
+                "uploads": previous.get("uploads", 0) + 1,
+            }
+
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(ledger, f, indent=2)
+            os.replace(tmp_path, self.path)
+        logging.info(f"📒 Upload recorded in ledger ({content_hash[:12]}, via {indicator})")
+        return True
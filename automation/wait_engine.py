@@ -0,0 +1,133 @@
+# automation/wait_engine.py
+"""
+Condition-driven waits - each step waits for the page to be ready instead of sleeping
+a fixed amount of wall-clock time
+"""
+
+import os
+import re
+import time
+import random
+import logging
+from collections import namedtuple
+
+WaitResult = namedtuple("WaitResult", ["name", "ok", "elapsed"])
+
+
+def document_ready():
+    """Document has finished loading"""
+    def check(driver):
+        return driver.execute_script("return document.readyState") == "complete"
+    return check
+
+
+def url_matches(pattern):
+    """Current URL matches a regex"""
+    regex = re.compile(pattern)
+
+    def check(driver):
+        return regex.search(driver.current_url) is not None
+    return check
+
+
+def element_present(xpath):
+    """At least one node matches the XPath (evaluated in-page, no implicit wait)"""
+    def check(driver):
+        return driver.execute_script(
+            "return document.evaluate(arguments[0], document, null,"
+            " XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null).snapshotLength;",
+            xpath
+        ) > 0
+    return check
+
+
+def network_idle(quiet_period=0.5):
+    """No new resources have finished loading for quiet_period seconds"""
+    state = {"count": -1, "since": time.monotonic()}
+
+    def check(driver):
+        count = driver.execute_script(
+            "return document.readyState === 'complete'"
+            " ? performance.getEntriesByType('resource').length : -1;"
+        )
+        now = time.monotonic()
+        if count < 0 or count != state["count"]:
+            state["count"] = count
+            state["since"] = now
+            return False
+        return now - state["since"] >= quiet_period
+    return check
+
+
+def any_of(*predicates):
+    """Satisfied when any of the predicates is"""
+    def check(driver):
+        return any(predicate(driver) for predicate in predicates)
+    return check
+
+
+class WaitEngine:
+    def __init__(self, driver=None):
+        self.driver = driver
+        self.floor = float(os.getenv("WAIT_PACING_FLOOR", "0.5"))
+        self.ceiling = float(os.getenv("WAIT_CEILING", "15"))
+        self.poll_interval = float(os.getenv("WAIT_POLL_INTERVAL", "0.25"))
+        self.history = []
+        self.timer = None
+
+    def pacing(self, floor=None):
+        """Human-like minimum pause, jittered a little above the floor"""
+        floor = self.floor if floor is None else floor
+        return random.uniform(floor, floor * 1.5)
+
+    def sleep(self, seconds):
+        if seconds <= 0:
+            return
+        time.sleep(seconds)
+        if self.timer:
+            self.timer.add_sleep(seconds)
+
+    def wait(self, name, *predicates, floor=None, ceiling=None):
+        """Wait until all predicates hold, never shorter than the pacing floor"""
+        ceiling = self.ceiling if ceiling is None else ceiling
+        min_wait = self.pacing(floor)
+        start = time.monotonic()
+        ok = False
+
+        while True:
+            elapsed = time.monotonic() - start
+            if not ok:
+                ok = self._check_all(predicates)
+            if ok and elapsed >= min_wait:
+                break
+            if elapsed >= ceiling:
+                break
+            if ok:
+                self.sleep(min(min_wait - elapsed, self.poll_interval))
+            else:
+                self.sleep(min(self.poll_interval, max(ceiling - elapsed, 0)))
+
+        result = WaitResult(name, ok, time.monotonic() - start)
+        self.history.append(result)
+        if ok:
+            logging.info(f"⏱️ {name}: ready in {result.elapsed:.2f}s")
+        else:
+            logging.warning(f"⏱️ {name}: not ready after {result.elapsed:.2f}s")
+        return result
+
+    def pace(self, name, floor=None):
+        """Plain human pacing pause where there is nothing to wait for"""
+        return self.wait(name, floor=floor)
+
+    def total_waited(self):
+        return sum(result.elapsed for result in self.history)
+
+    def _check_all(self, predicates):
+        for predicate in predicates:
+            try:
+                if not predicate(self.driver):
+                    return False
+            except Exception:
+                # Page may be mid-navigation, try again on the next poll
+                return False
+        return True